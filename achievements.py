@@ -1,5 +1,8 @@
 import pygame
 import json
+from fonts import Fonts
+from asset_bake import load_image
+from renderer import Display
 
 class Achievements:
     def __init__(self):
@@ -40,10 +43,12 @@ class Achievements:
         self.seeds_collected = 0
         self.base_health_lost = False
         self.total_seeds = 0
+        self.page = None
+        self.page_unlocked = None  # Unlock flags the cached achievements page was rendered with
         
         # Add ui_text.png loading
         try:
-            self.ui_text_bg = pygame.image.load("assets/ui/ui_text.png").convert_alpha()
+            self.ui_text_bg = load_image("assets/ui/ui_text.png")
         except Exception as e:
             print(f"Failed to load ui_text.png: {e}")
             self.ui_text_bg = pygame.Surface((550, 90))
@@ -150,11 +155,7 @@ class Achievements:
             if self.popup_queue:
                 achievement_name = self.popup_queue[0]
                 text = f"Achievement Unlocked: {achievement_name}"
-                try:
-                    font = pygame.font.Font("assets/fonts/OpenSans-Bold.ttf", 21)
-                except Exception as e:
-                    print(f"Failed to load font: {e}")
-                    font = pygame.font.SysFont("Open Sans", 21, bold=True)
+                font = Fonts.get(21, bold=True)
                 
                 text_surface = font.render(text, True, (255, 255, 255))
                 text_width, text_height = text_surface.get_size()
@@ -174,44 +175,42 @@ class Achievements:
                 text_y = popup_y + (popup_height - text_height) // 2
                 screen.blit(text_surface, (text_x, text_y))
 
-    def draw_achievements_menu(self, screen, scroll_y=0):
-        try:
-            FONT_CTA = pygame.font.Font("assets/fonts/OpenSans-Bold.ttf", 40)
-            FONT_BODY = pygame.font.Font("assets/fonts/OpenSans-Regular.ttf", 22)
-        except Exception as e:
-            print(f"Failed to load fonts in Achievements: {e}")
-            FONT_CTA = pygame.font.SysFont("Open Sans", 40, bold=True)
-            FONT_BODY = pygame.font.SysFont("Open Sans", 22)
-
-        try:
-            text_bg = pygame.image.load("assets/ui/ui_text.png").convert_alpha()
-        except Exception as e:
-            print(f"Failed to load ui_text.png in Achievements: {e}")
-            text_bg = pygame.Surface((550, 90))
-            text_bg.fill((100, 100, 100))
-        start_y = 150 + scroll_y  # Apply scroll offset
+    def render_achievements_page(self):
+        """Composite every achievement entry onto one tall surface; scrolling just moves the viewport."""
+        FONT_BODY = Fonts.get(22)
         items_per_column = 10
         column_width = 1800 // 3  # 600px per column
         bg_width = 550
         bg_height = 90
         spacing = 100
+        bg = pygame.transform.scale(self.ui_text_bg, (bg_width, bg_height))
+        page = Display.create_surface((1920, (items_per_column - 1) * spacing + bg_height), pygame.SRCALPHA)
         for i, (key, achievement) in enumerate(self.achievements.items()):
             column = i // items_per_column  # 0, 1, or 2
             row = i % items_per_column      # 0-9
             x_pos = 1920 // 2 - 1800 // 2 + column * column_width + 50
-            y_pos = start_y + row * spacing
-            # Only draw if within screen bounds (y=50 to 1080)
-            if y_pos + bg_height > 50 and y_pos < 1080:
-                bg_x = x_pos - 10 + (600 - bg_width) // 2
-                bg_y = y_pos - 10
-                bg = pygame.transform.scale(text_bg, (bg_width, bg_height))
-                screen.blit(bg, (bg_x, bg_y))
-                color = (249, 249, 242) if achievement["unlocked"] else (128, 131, 134)
-                name_text = FONT_BODY.render(achievement["name"], True, color)
-                name_x = bg_x + (bg_width - name_text.get_width()) // 2
-                screen.blit(name_text, (name_x, y_pos))
-                desc_text = FONT_BODY.render(achievement["description"], True, color)
-                desc_x = bg_x + (bg_width - desc_text.get_width()) // 2
-                screen.blit(desc_text, (desc_x, y_pos + 30))
-        title_text = FONT_CTA.render("Achievements", True, (249, 249, 242))
-        screen.blit(title_text, (1920 // 2 - title_text.get_width() // 2, 50))
\ No newline at end of file
+            y_pos = row * spacing + 10  # Page top is the top of the first background
+            bg_x = x_pos - 10 + (600 - bg_width) // 2
+            bg_y = y_pos - 10
+            page.blit(bg, (bg_x, bg_y))
+            color = (249, 249, 242) if achievement["unlocked"] else (128, 131, 134)
+            name_text = FONT_BODY.render(achievement["name"], True, color)
+            name_x = bg_x + (bg_width - name_text.get_width()) // 2
+            page.blit(name_text, (name_x, y_pos))
+            desc_text = FONT_BODY.render(achievement["description"], True, color)
+            desc_x = bg_x + (bg_width - desc_text.get_width()) // 2
+            page.blit(desc_text, (desc_x, y_pos + 30))
+        return page
+
+    def draw_achievements_menu(self, screen, scroll_y=0):
+        unlocked = tuple(achievement["unlocked"] for achievement in self.achievements.values())
+        if unlocked != self.page_unlocked:
+            self.page = self.render_achievements_page()
+            self.page_unlocked = unlocked
+        page_y = 150 + scroll_y - 10  # Apply scroll offset
+        visible_top = max(0, -page_y)
+        visible = pygame.Rect(0, visible_top, 1920, min(self.page.get_height(), 1080 - page_y) - visible_top)
+        if visible.height > 0:
+            screen.blit(self.page.subsurface(visible), (0, page_y + visible_top))
+        title_text = Fonts.get(40, bold=True).render("Achievements", True, (249, 249, 242))
+        screen.blit(title_text, (1920 // 2 - title_text.get_width() // 2, 50))
@@ -0,0 +1,130 @@
+import math
+import os
+import pygame
+from types import MappingProxyType
+from asset_bake import load_image
+
+class AnimationCache:
+    """Process-wide store of unit frame tables, keyed by (spritesheet path, scale factor).
+
+    Every unit of the same type shares one read-only table, so spawning a unit
+    no longer decodes and rescales its spritesheet from disk. A horizontally
+    mirrored copy of each table is built at the same time for units facing left,
+    along with a collision mask for every frame in both facings.
+    """
+    frame_width = 192
+    frame_height = 192
+    frames_per_state = 14
+    state_rows = {"idle": 0, "run": 1, "attack": 2, "die": 3}
+
+    tables = {}
+    missing_spritesheets = set()
+    hits = 0
+    misses = 0
+
+    @classmethod
+    def get_tables(cls, spritesheet_path, scale_factor):
+        """Return the shared (frames, mirrored frames, masks, mirrored masks) tables, or None if the sheet can't be loaded."""
+        key = (spritesheet_path, scale_factor)
+        tables = cls.tables.get(key)
+        if tables is not None:
+            cls.hits += 1
+            return tables
+        cls.misses += 1
+
+        if spritesheet_path in cls.missing_spritesheets:
+            return None
+        if not os.path.exists(spritesheet_path):
+            print(f"Error: Spritesheet not found at {spritesheet_path}")
+            cls.missing_spritesheets.add(spritesheet_path)
+            return None
+
+        try:
+            frames = cls.load_spritesheet(spritesheet_path, scale_factor)
+        except Exception as e:
+            print(f"Failed to load spritesheet {spritesheet_path}: {e}")
+            cls.missing_spritesheets.add(spritesheet_path)
+            return None
+        mirrored = cls.mirror_table(frames)
+        tables = (frames, mirrored, cls.mask_table(frames), cls.mask_table(mirrored))
+        cls.tables[key] = tables
+        return tables
+
+    @classmethod
+    def load_spritesheet(cls, spritesheet_path, scale_factor):
+        spritesheet = load_image(spritesheet_path, keep_shape=True)
+        scaled_size = (int(cls.frame_width * scale_factor), int(cls.frame_height * scale_factor))
+        animations = {}
+        for state, row in cls.state_rows.items():
+            frames = []
+            for i in range(cls.frames_per_state):
+                x = i * cls.frame_width
+                y = row * cls.frame_height
+                if x + cls.frame_width <= spritesheet.get_width() and y + cls.frame_height <= spritesheet.get_height():
+                    frame = spritesheet.subsurface((x, y, cls.frame_width, cls.frame_height))
+                    frames.append(pygame.transform.smoothscale(frame, scaled_size))
+            animations[state] = tuple(frames) if frames else (pygame.Surface(scaled_size),)
+        animations["hurt"] = (pygame.transform.smoothscale(animations["die"][0], scaled_size),)
+        return MappingProxyType(animations)
+
+    @staticmethod
+    def mirror_table(table):
+        return MappingProxyType({
+            state: tuple(pygame.transform.flip(frame, True, False) for frame in frames)
+            for state, frames in table.items()
+        })
+
+    @staticmethod
+    def mask_table(table):
+        return MappingProxyType({
+            state: tuple(pygame.mask.from_surface(frame) for frame in frames)
+            for state, frames in table.items()
+        })
+
+    @classmethod
+    def stats(cls):
+        lookups = cls.hits + cls.misses
+        return {
+            "entries": len(cls.tables),
+            "hits": cls.hits,
+            "misses": cls.misses,
+            "hit_rate": cls.hits / lookups if lookups else 0.0
+        }
+
+
+class ProjectileAtlas:
+    """Projectile sprites loaded once and pre-rotated into fixed angle buckets.
+
+    Each bucket holds a (rotated sprite, mask) pair, so a projectile in flight
+    only has to pick the bucket matching its velocity instead of rotating and
+    re-masking its sprite every tick.
+    """
+    angle_buckets = 72  # 5 degree steps
+    atlases = {}
+
+    @classmethod
+    def get(cls, sprite_path, size, fallback_color):
+        key = (sprite_path, size)
+        atlas = cls.atlases.get(key)
+        if atlas is None:
+            try:
+                sprite = load_image(sprite_path, keep_shape=True)
+                sprite = pygame.transform.scale(sprite, size)
+            except Exception as e:
+                print(f"Failed to load projectile sprite {sprite_path}: {e}")
+                sprite = pygame.Surface(size)
+                sprite.fill(fallback_color)
+            step = 360 / cls.angle_buckets
+            atlas = []
+            for bucket in range(cls.angle_buckets):
+                rotated = pygame.transform.rotate(sprite, bucket * step)
+                atlas.append((rotated, pygame.mask.from_surface(rotated)))
+            atlas = tuple(atlas)
+            cls.atlases[key] = atlas
+        return atlas
+
+    @classmethod
+    def lookup(cls, atlas, velocity_x, velocity_y):
+        """Return the (sprite, mask) pair whose angle is closest to the given velocity."""
+        angle = math.degrees(math.atan2(-velocity_y, velocity_x))
+        return atlas[round(angle * cls.angle_buckets / 360) % cls.angle_buckets]
@@ -0,0 +1,237 @@
+"""Offline bake step for display-ready art.
+
+Several images are cropped and rescaled every time a level or menu is built.
+Running this script from the project root writes those final versions into
+assets/baked/ along with a manifest.json, and the loaders below pick them up
+instead of resampling the source art. Delete assets/baked/ to go back to the
+original behaviour.
+
+Headless runs also keep the alpha shape of sprite art in assets/baked/shapes/,
+written the first time each image is needed, so their hit masks match the
+real game without decoding the art again.
+
+    python asset_bake.py
+"""
+import json
+import os
+import struct
+import zlib
+import pygame
+from headless import Headless
+
+BAKED_DIR = "assets/baked"
+MANIFEST_PATH = os.path.join(BAKED_DIR, "manifest.json")
+SHAPE_DIR = os.path.join(BAKED_DIR, "shapes")
+
+BATTLEFIELD_BACKGROUNDS = [
+    "assets/backgrounds/battlefield.png",
+    "assets/backgrounds/battlefield_zombies.png",
+    "assets/backgrounds/battlefield_undead.png"
+]
+BASE_SPRITES = [
+    "assets/buildings/Player/player_base.png",
+    "assets/buildings/Enemy/Bandits/Bandits_base.png",
+    "assets/buildings/Enemy/Zombies/Zombies_base.png",
+    "assets/buildings/Enemy/Undead/Undead_base.png"
+]
+FULLSCREEN_IMAGES = [
+    "assets/backgrounds/victory_background.png",
+    "assets/backgrounds/losing_background.png",
+    "assets/backgrounds/menu_background.png",
+    "assets/tutorial/slide_1.png",
+    "assets/tutorial/slide_2.png"
+]
+BATTLEFIELD_SIZE = (1920, 880)
+BATTLEFIELD_CROP = 0.90
+BASE_SCALE = (0.75, 0.52)
+ROCKET_SHEET = "assets/ui/ui_victory_rocket.png"
+ROCKET_FRAMES = 18
+ROCKET_FRAME_SIZE = 96
+
+
+class BakedAssets:
+    """Read side of the bake: looks up pre-scaled images listed in the manifest."""
+    manifest = None
+
+    @classmethod
+    def get_manifest(cls):
+        if cls.manifest is None:
+            try:
+                with open(MANIFEST_PATH, "r") as f:
+                    cls.manifest = json.load(f).get("entries", {})
+                print(f"Loaded baked asset manifest with {len(cls.manifest)} entries")
+            except FileNotFoundError:
+                cls.manifest = {}
+            except Exception as e:
+                print(f"Failed to read {MANIFEST_PATH}: {e}")
+                cls.manifest = {}
+        return cls.manifest
+
+    @classmethod
+    def load(cls, source_path, variant, alpha=True):
+        """Return the baked variant of source_path, or None if it isn't baked or is stale."""
+        entry = cls.get_manifest().get(f"{source_path}::{variant}")
+        if not entry:
+            return None
+        if Headless.enabled:
+            return placeholder(entry["size"], alpha)
+        try:
+            if os.path.getmtime(source_path) > entry["source_mtime"]:
+                return None  # Source art changed since the bake
+        except OSError:
+            pass
+        try:
+            image = pygame.image.load(entry["path"])
+            return image.convert_alpha() if alpha else image.convert()
+        except Exception as e:
+            print(f"Failed to load baked asset {entry['path']}: {e}")
+            return None
+
+
+class ShapeCache:
+    """Opaque/transparent shape of sprite art for headless placeholders.
+
+    A shape is the image's alpha thresholded the way pygame.mask.from_surface
+    does it, stored zlib-compressed next to the baked assets. Placeholders
+    built from it go through the same slicing, flipping and rotation as the
+    real art, so units and projectiles end up with the same hit masks.
+    """
+    alpha_threshold = bytes(255 if value > 127 else 0 for value in range(256))
+
+    @staticmethod
+    def path_for(source_path):
+        name = os.path.splitext(source_path.replace("assets/", "", 1))[0].replace("/", "_").replace(" ", "_")
+        return f"{SHAPE_DIR}/{name}.shape"
+
+    @classmethod
+    def load(cls, source_path):
+        """Return (size, one alpha byte per pixel), decoding the source only if no fresh shape is stored."""
+        shape_path = cls.path_for(source_path)
+        try:
+            if os.path.getmtime(shape_path) >= os.path.getmtime(source_path):
+                with open(shape_path, "rb") as f:
+                    data = f.read()
+                return struct.unpack(">II", data[:8]), zlib.decompress(data[8:])
+        except OSError:
+            pass
+        image = pygame.image.load(source_path)
+        size = image.get_size()
+        alpha = pygame.image.tobytes(image, "RGBA")[3::4].translate(cls.alpha_threshold)
+        try:
+            os.makedirs(SHAPE_DIR, exist_ok=True)
+            temp_path = f"{shape_path}.{os.getpid()}.tmp"  # Pool workers may store the same shape at once
+            with open(temp_path, "wb") as f:
+                f.write(struct.pack(">II", *size) + zlib.compress(alpha))
+            os.replace(temp_path, shape_path)
+        except OSError as e:
+            print(f"Failed to store shape for {source_path}: {e}")
+        return size, alpha
+
+    @classmethod
+    def placeholder(cls, source_path):
+        size, alpha = cls.load(source_path)
+        pixels = bytearray(b"\xff\x00\xff\x00" * (size[0] * size[1]))
+        pixels[3::4] = alpha
+        return pygame.image.frombytes(bytes(pixels), size, "RGBA")
+
+
+def image_size(path):
+    """Width and height of a PNG, read from its header without decoding the pixels."""
+    with open(path, "rb") as f:
+        header = f.read(24)
+    if header[:8] != b"\x89PNG\r\n\x1a\n":
+        return pygame.image.load(path).get_size()
+    return struct.unpack(">II", header[16:24])
+
+def placeholder(size, alpha=True):
+    """Opaque stand-in for an image, used in headless mode."""
+    image = pygame.Surface(size, pygame.SRCALPHA if alpha else 0)
+    image.fill((255, 0, 255, 255))
+    return image
+
+def load_image(path, alpha=True, keep_shape=False):
+    """Load an image ready for blitting, or a placeholder of the same size when headless.
+
+    keep_shape is for art whose hit masks matter: its headless placeholder is
+    transparent wherever the real image is.
+    """
+    if Headless.enabled:
+        if keep_shape and alpha:
+            return ShapeCache.placeholder(path)
+        return placeholder(image_size(path), alpha)
+    image = pygame.image.load(path)
+    return image.convert_alpha() if alpha else image.convert()
+
+
+def scale_steps(image, factors):
+    for factor in factors:
+        width, height = image.get_size()
+        image = pygame.transform.scale(image, (int(width * factor), int(height * factor)))
+    return image
+
+def scaled_variant(factors):
+    return "x" + "_x".join(str(factor) for factor in factors)
+
+def load_scaled_by(source_path, factors, alpha=True):
+    """Load an image and shrink it by each factor in turn, preferring a baked copy."""
+    baked = BakedAssets.load(source_path, scaled_variant(factors), alpha)
+    if baked is not None:
+        return baked
+    return scale_steps(load_image(source_path, alpha), factors)
+
+def load_scaled(source_path, size, alpha=True):
+    """Load an image scaled to size, preferring a baked copy."""
+    baked = BakedAssets.load(source_path, f"{size[0]}x{size[1]}", alpha)
+    if baked is not None:
+        return baked
+    if Headless.enabled:
+        return placeholder(size, alpha)
+    return pygame.transform.scale(load_image(source_path, alpha), size)
+
+def crop_battlefield(image):
+    crop_height = int(image.get_height() * BATTLEFIELD_CROP)
+    cropped = image.subsurface((0, 0, image.get_width(), crop_height))
+    return pygame.transform.scale(cropped, BATTLEFIELD_SIZE)
+
+def slice_rocket_frames(image):
+    strip = pygame.Surface((ROCKET_FRAMES * ROCKET_FRAME_SIZE, ROCKET_FRAME_SIZE), pygame.SRCALPHA)
+    for i in range(ROCKET_FRAMES):
+        frame = image.subsurface((i * 192, 0, 192, 192))
+        strip.blit(pygame.transform.scale(frame, (ROCKET_FRAME_SIZE, ROCKET_FRAME_SIZE)), (i * ROCKET_FRAME_SIZE, 0))
+    return strip
+
+
+def bake_recipes():
+    """Yield (source path, variant, bake function) for everything the loaders know how to use."""
+    for path in BATTLEFIELD_BACKGROUNDS:
+        yield path, "battlefield", crop_battlefield
+    for path in BASE_SPRITES:
+        yield path, scaled_variant(BASE_SCALE[:1]), lambda image: scale_steps(image, BASE_SCALE[:1])
+        yield path, scaled_variant(BASE_SCALE), lambda image: scale_steps(image, BASE_SCALE)
+    for path in FULLSCREEN_IMAGES:
+        yield path, "1920x1080", lambda image: pygame.transform.scale(image, (1920, 1080))
+    yield ROCKET_SHEET, f"frames_{ROCKET_FRAME_SIZE}", slice_rocket_frames
+
+def bake():
+    os.makedirs(BAKED_DIR, exist_ok=True)
+    entries = {}
+    for source_path, variant, bake_fn in bake_recipes():
+        if not os.path.exists(source_path):
+            print(f"Skipping missing source {source_path}")
+            continue
+        baked = bake_fn(pygame.image.load(source_path))
+        name = os.path.splitext(source_path.replace("assets/", "", 1))[0].replace("/", "_").replace(" ", "_")
+        out_path = f"{BAKED_DIR}/{name}__{variant}.png"
+        pygame.image.save(baked, out_path)
+        entries[f"{source_path}::{variant}"] = {
+            "path": out_path,
+            "size": list(baked.get_size()),
+            "source_mtime": os.path.getmtime(source_path)
+        }
+        print(f"Baked {source_path} ({variant}) -> {out_path} {baked.get_size()}")
+    with open(MANIFEST_PATH, "w") as f:
+        json.dump({"version": 1, "entries": entries}, f, indent=2)
+    print(f"Wrote {len(entries)} baked assets to {BAKED_DIR}")
+
+if __name__ == "__main__":
+    bake()
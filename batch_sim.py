@@ -0,0 +1,212 @@
+"""Headless battle sweeps for balance tuning.
+
+Runs complete battles with no window or audio across a pool of worker
+processes and writes one row per configuration (level, unit upgrade level,
+base upgrade level, spawn policy) with the win rate, mean time to win and
+the base HP left on both sides. Battles end when either base falls or the
+time limit runs out; story sequences after the enemy base falls are not
+played. Every configuration runs with the same list of random seeds, so a
+sweep is repeatable. Unit and projectile hit masks keep the real sprite
+shapes (see asset_bake.ShapeCache), so ranged combat plays as in the game.
+Units are simulated as objects, as in the game, unless --core is given.
+
+    python batch_sim.py --levels 1-25 --unit-upgrades 0,5,10 --runs 20 --out sweep.csv
+"""
+import argparse
+import csv
+import itertools
+import json
+import multiprocessing
+import os
+import random
+import sys
+import time
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+import pygame
+from headless import Headless
+from simclock import SimClock
+from game_logic import Game
+from menu import MainMenu
+from units import Player_PeasantUnit, Player_SpearmanUnit, Player_ArcherUnit, Player_WarriorUnit, Player_TankUnit
+
+UNIT_TYPES = {
+    "Peasant": Player_PeasantUnit,
+    "Spearman": Player_SpearmanUnit,
+    "Archer": Player_ArcherUnit,
+    "Warrior": Player_WarriorUnit,
+    "Tank": Player_TankUnit
+}
+
+
+class RoundRobinPolicy:
+    """Buy each allowed unit type in turn, each as soon as it is affordable."""
+    def __init__(self, unit_types):
+        self.unit_types = sorted(unit_types, key=lambda unit_type: unit_type.cost)
+        self.next_index = 0
+
+    def step(self, game):
+        unit_type = self.unit_types[self.next_index]
+        if game.spawn_unit(unit_type):
+            self.next_index = (self.next_index + 1) % len(self.unit_types)
+
+class CheapestPolicy(RoundRobinPolicy):
+    """Spend every seed on the cheapest unit type."""
+    def step(self, game):
+        game.spawn_unit(self.unit_types[0])
+
+class StrongestPolicy(RoundRobinPolicy):
+    """Save up for the most expensive unit type and only ever buy that."""
+    def step(self, game):
+        game.spawn_unit(self.unit_types[-1])
+
+SPAWN_POLICIES = {
+    "round_robin": RoundRobinPolicy,
+    "cheapest": CheapestPolicy,
+    "strongest": StrongestPolicy
+}
+
+
+class BatchWorker:
+    """Per-process battle runner; the menu and screen are built once per worker."""
+    main_menu = None
+    screen = None
+    clock = None
+
+    @classmethod
+    def init(cls, use_core, quiet):
+        Headless.enable()
+        if quiet:
+            sys.stdout = open(os.devnull, "w")  # The game logs every attack; nobody reads it in a sweep
+        Game.combat_core_enabled = use_core
+        cls.screen = pygame.display.get_surface()
+        cls.clock = pygame.time.Clock()
+        cls.main_menu = MainMenu(cls.screen, cls.clock)
+
+    @classmethod
+    def set_upgrades(cls, unit_level, base_level):
+        """Put every upgrade stat at the given level, keeping costs and increases from the menu's data."""
+        menu = cls.main_menu
+        for upgrades in menu.unit_upgrades.values():
+            for data in upgrades.values():
+                data["level"] = unit_level
+        for upgrades in menu.base_upgrades.values():
+            for data in upgrades.values():
+                data["level"] = base_level
+
+    @classmethod
+    def run(cls, job):
+        """Play one battle to the end and return its outcome."""
+        config, seed, max_ticks = job
+        level, unit_level, base_level, policy_name, unit_names = config
+        random.seed(seed)
+        SimClock.time = 0.0
+        menu = cls.main_menu
+        menu.max_level = 26  # Past every first-time story sequence
+        menu.unit_types = [UNIT_TYPES[name] for name in unit_names]
+        cls.set_upgrades(unit_level, base_level)
+        game = Game(level, menu, cls.screen, cls.clock)
+        game.show_intro = False
+        policy = SPAWN_POLICIES[policy_name](menu.unit_types)
+        ticks = 0
+        while ticks < max_ticks and game.player_base.health > 0 and game.enemy_base.health > 0:
+            policy.step(game)
+            game.update()
+            ticks += 1
+        return config, {
+            "won": game.enemy_base.health <= 0 and game.player_base.health > 0,
+            "timeout": ticks >= max_ticks,
+            "seconds": (SimClock.now() - game.start_time) / 1000,
+            "player_base_hp": max(0, game.player_base.health),
+            "enemy_base_hp": max(0, game.enemy_base.health),
+            "faction": game.enemy_faction
+        }
+
+
+def parse_int_list(text):
+    """Parse "1,3,5-8" into [1, 3, 5, 6, 7, 8]."""
+    values = []
+    for part in text.split(","):
+        if "-" in part:
+            start, end = part.split("-")
+            values.extend(range(int(start), int(end) + 1))
+        else:
+            values.append(int(part))
+    return values
+
+def summarize(config, outcomes):
+    level, unit_level, base_level, policy_name, unit_names = config
+    wins = [outcome for outcome in outcomes if outcome["won"]]
+    return {
+        "level": level,
+        "faction": outcomes[0]["faction"],
+        "unit_upgrades": unit_level,
+        "base_upgrades": base_level,
+        "policy": policy_name,
+        "units": "+".join(unit_names),
+        "runs": len(outcomes),
+        "wins": len(wins),
+        "timeouts": sum(outcome["timeout"] for outcome in outcomes),
+        "win_rate": round(len(wins) / len(outcomes), 3),
+        "mean_time_to_win": round(sum(outcome["seconds"] for outcome in wins) / len(wins), 1) if wins else None,
+        "mean_player_base_hp": round(sum(outcome["player_base_hp"] for outcome in outcomes) / len(outcomes), 1),
+        "mean_enemy_base_hp": round(sum(outcome["enemy_base_hp"] for outcome in outcomes) / len(outcomes), 1)
+    }
+
+def write_rows(rows, path, output_format):
+    out = open(path, "w", newline="") if path else sys.stdout
+    try:
+        if output_format == "json":
+            json.dump(rows, out, indent=2)
+            out.write("\n")
+        else:
+            writer = csv.DictWriter(out, fieldnames=list(rows[0].keys()))
+            writer.writeheader()
+            writer.writerows(rows)
+    finally:
+        if path:
+            out.close()
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run headless battles in parallel and report win rates per configuration.")
+    parser.add_argument("--levels", default="1-25", help="levels to play, e.g. 1-5,10")
+    parser.add_argument("--unit-upgrades", default="0", help="upgrade level applied to every unit stat")
+    parser.add_argument("--base-upgrades", default="0", help="upgrade level applied to every base and tower stat")
+    parser.add_argument("--policies", default="round_robin", help=f"spawn policies: {', '.join(SPAWN_POLICIES)}")
+    parser.add_argument("--units", default=",".join(UNIT_TYPES), help=f"unit types the policy may buy: {', '.join(UNIT_TYPES)}")
+    parser.add_argument("--runs", type=int, default=10, help="battles per configuration")
+    parser.add_argument("--seed", type=int, default=0, help="first random seed; run i uses seed + i")
+    parser.add_argument("--max-minutes", type=float, default=20, help="battle time after which a run counts as a timeout")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="worker processes")
+    parser.add_argument("--core", action="store_true", help="simulate units with the NumPy combat core; its tick rules differ from the game's, so results shift")
+    parser.add_argument("--format", choices=("csv", "json"), help="output format; defaults to the --out extension, else csv")
+    parser.add_argument("--out", help="file to write; stdout if omitted")
+    parser.add_argument("--verbose", action="store_true", help="keep the game's own logging")
+    args = parser.parse_args(argv)
+
+    unit_names = tuple(name.strip() for name in args.units.split(","))
+    for name in unit_names:
+        if name not in UNIT_TYPES:
+            parser.error(f"unknown unit type {name}")
+    policies = [name.strip() for name in args.policies.split(",")]
+    for name in policies:
+        if name not in SPAWN_POLICIES:
+            parser.error(f"unknown spawn policy {name}")
+    output_format = args.format or ("json" if args.out and args.out.endswith(".json") else "csv")
+
+    configs = list(itertools.product(parse_int_list(args.levels), parse_int_list(args.unit_upgrades),
+                                     parse_int_list(args.base_upgrades), policies, [unit_names]))
+    max_ticks = int(args.max_minutes * 60 * SimClock.tick_rate)
+    jobs = [(config, args.seed + run, max_ticks) for config in configs for run in range(args.runs)]
+    outcomes = {config: [] for config in configs}
+
+    start = time.time()
+    with multiprocessing.Pool(args.workers, BatchWorker.init, (args.core, not args.verbose)) as pool:
+        for done, (config, outcome) in enumerate(pool.imap_unordered(BatchWorker.run, jobs), 1):
+            outcomes[config].append(outcome)
+            if done % max(1, len(jobs) // 20) == 0 or done == len(jobs):
+                print(f"{done}/{len(jobs)} battles in {time.time() - start:.1f}s", file=sys.stderr)
+
+    write_rows([summarize(config, outcomes[config]) for config in configs], args.out, output_format)
+
+if __name__ == "__main__":
+    main()
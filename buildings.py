@@ -1,21 +1,22 @@
 import pygame
+from asset_bake import load_scaled_by
+from fonts import Fonts
+from healthbar import HealthBar
 
 class Base:
     base_health = 1000  # Default health, used as a fallback or initial value
 
-    def __init__(self, x, y, health, sprite_path, is_player):
+    def __init__(self, x, y, health, sprite_path, is_player, scale=(0.75,)):
         self.x = x
         self.y = y
         self.health = health  # Instance-specific health
         self.max_health = health  # Set max_health to the initial health value
         self.sprite_path = sprite_path
         self.is_player = is_player
+        self.scale = scale
+        self.health_bar = HealthBar(150, 15, (0, 255, 0), (255, 0, 0), Fonts.get_sys("Arial", 16), 20, border_color=(0, 0, 0))
         try:
-            self.sprite = pygame.image.load(sprite_path).convert_alpha()
-            orig_width, orig_height = self.sprite.get_size()
-            new_width = int(orig_width * 0.75)
-            new_height = int(orig_height * 0.75)
-            self.sprite = pygame.transform.scale(self.sprite, (new_width, new_height))
+            self.sprite = load_scaled_by(sprite_path, scale)
         except Exception as e:
             print(f"Failed to load base sprite {sprite_path}: {e}")
             self.sprite = pygame.Surface((150, 300))
@@ -26,11 +27,7 @@ class Base:
         if self.health <= 0:
             destroyed_path = self.sprite_path.replace(".png", "_destroyed.png")
             try:
-                self.sprite = pygame.image.load(destroyed_path).convert_alpha()
-                orig_width, orig_height = self.sprite.get_size()
-                new_width = int(orig_width * 0.75)
-                new_height = int(orig_height * 0.75)
-                self.sprite = pygame.transform.scale(self.sprite, (new_width, new_height))
+                self.sprite = load_scaled_by(destroyed_path, self.scale)
             except Exception as e:
                 print(f"Failed to load destroyed base sprite {destroyed_path}: {e}")
 
@@ -43,19 +40,13 @@ class Base:
 
     def draw(self, screen):
         screen.blit(self.sprite, (self.x, self.y))
+        self.draw_health_bar(screen)
+
+    def draw_health_bar(self, screen):
         if self.health > 0:
-            health_bar_width = 150
-            health_bar_height = 15
-            health_ratio = max(0, self.health / self.max_health)
-            health_bar_fill = health_bar_width * health_ratio
-            health_bar_x = self.x + (self.sprite.get_width() - health_bar_width) // 2
+            health_bar_x = self.x + (self.sprite.get_width() - self.health_bar.width) // 2
             health_bar_y = self.y - 30
-            pygame.draw.rect(screen, (255, 0, 0), (health_bar_x, health_bar_y, health_bar_width, health_bar_height))
-            pygame.draw.rect(screen, (0, 255, 0), (health_bar_x, health_bar_y, health_bar_fill, health_bar_height))
-            pygame.draw.rect(screen, (0, 0, 0), (health_bar_x, health_bar_y, health_bar_width, health_bar_height), 1)
-            hp_font = pygame.font.SysFont("Arial", 16)
-            hp_text = hp_font.render(f"{int(self.health)}/{int(self.max_health)}", True, (255, 255, 255))
-            screen.blit(hp_text, (health_bar_x + (health_bar_width - hp_text.get_width()) // 2, health_bar_y - 20))
+            self.health_bar.draw(screen, health_bar_x, health_bar_y, self.health, self.max_health)
  
 
             
@@ -63,16 +54,10 @@ class VisualBase:
     def __init__(self, x, y, sprite_path, flip=False, scale=(0.75, 0.52)):
         self.x = x
         self.y = y
-        self.sprite = pygame.image.load(sprite_path).convert_alpha()
-        # First scale to 0.75 (same as Base)
-        orig_width, orig_height = self.sprite.get_size()
-        self.sprite = pygame.transform.scale(self.sprite, (int(orig_width * scale[0]), int(orig_height * scale[0])))
-        # Flip after first scaling (same as Base in Game.__init__)
+        # Scale to 0.75 then 0.52 (same as the primary Base in Game.__init__)
+        self.sprite = load_scaled_by(sprite_path, scale)
         if flip:
             self.sprite = pygame.transform.flip(self.sprite, True, False)
-        # Then scale to 0.52
-        orig_width, orig_height = self.sprite.get_size()
-        self.sprite = pygame.transform.scale(self.sprite, (int(orig_width * scale[1]), int(orig_height * scale[1])))
 
     def draw(self, screen):
         screen.blit(self.sprite, (self.x, self.y))
\ No newline at end of file
@@ -1,49 +1,157 @@
 import pygame
+from bisect import bisect_left, bisect_right
 from buildings import Base  # Explicit import for type safety
 
-def find_closest_target(unit, buckets, bucket_size, base):
+class SpatialIndex:
+    """Units bucketed by x position, kept up to date as units spawn, move and die.
+
+    buckets maps a bucket number to the units standing in it, in the shape the
+    collision checks below use. Each bucket is an insertion-ordered dict used as
+    a set, so moving a unit between buckets or dropping it is O(1).
+
+    Every unit stands on the same row, so each faction is also kept as an
+    x-sorted lane (parallel lists of x positions and units). Nearest-enemy
+    queries bisect into the other factions' lanes instead of scanning buckets.
+    Units off the battlefield are tracked but left out of buckets and lanes.
+
+    refresh_targets() runs the targeting stage once per tick: every unit and
+    tower gets its nearest in-range enemy stored in targets, and movement,
+    attack start and towers all read it through target_of(). A unit that
+    moves is re-targeted from where it stops.
+    """
+    def __init__(self, bucket_size, width=1920):
+        self.bucket_size = bucket_size
+        self.width = width
+        self.last_bucket = width // bucket_size
+        self.buckets = {}
+        self.unit_buckets = {}  # unit -> bucket number, or None while off the battlefield
+        self.lanes = {}  # faction -> ([x, ...], [unit, ...]) sorted by x
+        self.lane_x = {}  # unit -> x it is filed under in its lane
+        self.targets = {}  # unit -> nearest in-range enemy or base from this tick's targeting stage
+
+    def bucket_for(self, x):
+        if not -192 <= x <= self.width:
+            return None
+        return max(0, min(int(x // self.bucket_size), self.last_bucket))
+
+    def insert(self, unit):
+        bucket = self.bucket_for(unit.x)
+        self.unit_buckets[unit] = bucket
+        if bucket is not None:
+            self.buckets.setdefault(bucket, {})[unit] = None
+            self.lane_insert(unit)
+
+    def remove(self, unit):
+        bucket = self.unit_buckets.pop(unit, None)
+        if bucket is not None:
+            self.buckets[bucket].pop(unit, None)
+            self.lane_remove(unit)
+
+    def update(self, unit):
+        """Refile unit after its x changed. Cheap when it hasn't moved."""
+        bucket = self.bucket_for(unit.x)
+        old_bucket = self.unit_buckets.get(unit)
+        if bucket != old_bucket:
+            if old_bucket is not None:
+                self.buckets[old_bucket].pop(unit, None)
+            self.unit_buckets[unit] = bucket
+            if bucket is not None:
+                self.buckets.setdefault(bucket, {})[unit] = None
+        if unit in self.lane_x:
+            if bucket is not None and self.lane_x[unit] == unit.x:
+                return
+            self.lane_remove(unit)
+        if bucket is not None:
+            self.lane_insert(unit)
+
+    def lane_insert(self, unit):
+        xs, lane_units = self.lanes.setdefault(unit.faction, ([], []))
+        i = bisect_right(xs, unit.x)
+        xs.insert(i, unit.x)
+        lane_units.insert(i, unit)
+        self.lane_x[unit] = unit.x
+
+    def lane_remove(self, unit):
+        x = self.lane_x.pop(unit)
+        xs, lane_units = self.lanes[unit.faction]
+        i = bisect_left(xs, x)
+        while lane_units[i] is not unit:
+            i += 1
+        del xs[i]
+        del lane_units[i]
+
+    def nearest_enemy(self, unit, max_distance):
+        """Return (distance, unit) for the closest living enemy within max_distance, or (None, None)."""
+        x = unit.x
+        best_distance = None
+        best = None
+        for faction, (xs, lane_units) in self.lanes.items():
+            if faction == unit.faction:
+                continue
+            i = bisect_left(xs, x)
+            # Walk outwards from x on both sides, stopping at the first living unit or the range edge
+            j = i - 1
+            while j >= 0 and x - xs[j] <= max_distance:
+                if lane_units[j].state != "die":
+                    if best is None or x - xs[j] < best_distance:
+                        best_distance, best = x - xs[j], lane_units[j]
+                    break
+                j -= 1
+            j = i
+            while j < len(xs) and xs[j] - x <= max_distance:
+                if lane_units[j].state != "die":
+                    if best is None or xs[j] - x < best_distance:
+                        best_distance, best = xs[j] - x, lane_units[j]
+                    break
+                j += 1
+        return best_distance, best
+
+    def refresh_targets(self, units, player_base, enemy_base):
+        """Work out every unit's nearest in-range target once for this tick."""
+        self.targets = {
+            unit: find_closest_target(unit, self, enemy_base if unit.direction == 1 else player_base)
+            for unit in units
+        }
+
+    def target_of(self, unit, base):
+        """Return unit's target from the targeting stage, dropping one that has died since."""
+        if unit not in self.targets:
+            return find_closest_target(unit, self, base)  # Spawned after this tick's targeting stage
+        target = self.targets[unit]
+        if target is None:
+            return None
+        if isinstance(target, Base):
+            return target if target.health > 0 else None
+        return target if target.state != "die" else None
+
+    def __len__(self):
+        return len(self.unit_buckets)
+
+def find_closest_target(unit, index, base):
     """
     Find the closest enemy unit or base within the unit's attack range from its current position.
     
     Args:
         unit: The unit object.
-        buckets: Dictionary of spatial buckets containing units.
-        bucket_size: Size of each spatial bucket.
+        index: The SpatialIndex holding every unit on the battlefield.
         base: The enemy base (for player units) or player base (for enemy units).
     
     Returns:
         The closest target within attack range, or None if no target is found.
     """
     attack_range = unit.attack_range
-    # Determine buckets to check based on attack range
-    left_x = unit.x - attack_range
-    right_x = unit.x + attack_range
-    left_bucket = int(left_x // bucket_size)
-    right_bucket = int(right_x // bucket_size)
-    
-    potential_targets = []
-    
-    # Check units in nearby buckets
-    for b in range(left_bucket, right_bucket + 1):
-        if b in buckets:
-            for other in buckets[b]:
-                if other.faction != unit.faction and other.state != "die":
-                    distance = abs(unit.x - other.x)
-                    if distance <= attack_range:
-                        potential_targets.append((distance, other))
+    distance, target = index.nearest_enemy(unit, attack_range)
     
     # Check the base
     # Use rect edge for consistency with in_attack_range
     base_x = base.get_rect().right if unit.direction == -1 else base.get_rect().left
     base_distance = abs(unit.x - base_x)
     if base_distance <= attack_range and base.health > 0:
-        potential_targets.append((base_distance, base))    
-    if potential_targets:
-        potential_targets.sort(key=lambda x: x[0])
-        return potential_targets[0][1]
-    return None
+        if target is None or base_distance < distance:
+            return base
+    return target
 
-def check_player_collisions(unit, buckets, bucket_size, enemy_base):
+def check_player_collisions(unit, index, enemy_base):
     """
     Collision logic for player units (direction == 1).
     
@@ -54,7 +162,7 @@ def check_player_collisions(unit, buckets, bucket_size, enemy_base):
         - target: Unit or base to attack, or None.
     """
     # Check if there's a target within attack range from current position
-    target = find_closest_target(unit, buckets, bucket_size, enemy_base)
+    target = index.target_of(unit, enemy_base)
     if target:
         new_state = "attack"
         new_x = unit.x  # Stay in place if attacking
@@ -63,7 +171,8 @@ def check_player_collisions(unit, buckets, bucket_size, enemy_base):
     # If no target in range, proceed with movement and collision checks
     new_x = unit.x + (unit.speed + 1) * unit.direction
     unit_rect = pygame.Rect(new_x + 3, unit.y, 120, 192)  # Offset as in V2.29
-    bucket_x = int(new_x // bucket_size)
+    buckets = index.buckets
+    bucket_x = int(new_x // index.bucket_size)
     check_buckets = [bucket_x - 1, bucket_x, bucket_x + 1]
     
     blocking_unit = None  # Same faction, ahead
@@ -112,7 +221,7 @@ def check_player_collisions(unit, buckets, bucket_size, enemy_base):
     new_state = "run" if unit.state != "hurt" else "hurt"
     return new_x, new_state, None
 
-def check_enemy_collisions(unit, buckets, bucket_size, player_base):
+def check_enemy_collisions(unit, index, player_base):
     """
     Collision logic for enemy units (direction == -1).
     
@@ -123,7 +232,7 @@ def check_enemy_collisions(unit, buckets, bucket_size, player_base):
         - target: Unit or base to attack, or None.
     """
     # Check if there's a target within attack range from current position
-    target = find_closest_target(unit, buckets, bucket_size, player_base)
+    target = index.target_of(unit, player_base)
     if target:
         new_x = unit.x
         if target == player_base:
@@ -137,7 +246,8 @@ def check_enemy_collisions(unit, buckets, bucket_size, player_base):
     if unit_rect.colliderect(player_base.get_rect()):
         new_x = player_base.get_rect().left  # x=125
         return new_x, "attack", player_base
-    bucket_x = int(new_x // bucket_size)
+    buckets = index.buckets
+    bucket_x = int(new_x // index.bucket_size)
     check_buckets = [bucket_x - 1, bucket_x, bucket_x + 1]
     
     blocking_unit = None  # Same faction, ahead (smaller x)
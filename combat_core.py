@@ -0,0 +1,429 @@
+from buildings import Base
+from simclock import SimClock
+from sounds import SoundBank
+
+try:
+    import numpy as np
+except ImportError:
+    np = None  # The core is optional; without NumPy the game keeps simulating unit objects one by one
+
+
+IDLE, RUN, ATTACK, HURT, DIE = range(5)
+STATE_NAMES = ("idle", "run", "attack", "hurt", "die")
+STATE_CODES = {name: code for code, name in enumerate(STATE_NAMES)}
+NO_TARGET = -1
+BASE_TARGET = -2
+PLAYER_SIDE, ENEMY_SIDE = 0, 1
+
+
+class CombatCore:
+    """Struct-of-arrays simulation of every non-tower unit in a battle.
+
+    Position, health, speed, attack stats, timers, side, state and animation
+    frame live in NumPy columns, one slot per unit. step() runs a whole tick
+    as vectorized per-side operations: animation timers and attack frames,
+    melee damage, nearest-enemy targeting, attack start, movement, blocking
+    and base collisions. The Unit objects stay around as thin views for
+    drawing, projectiles and game events; after each step only the views
+    whose slots changed are written back.
+
+    The rules follow Unit.update_animation, Unit.move and the collision checks,
+    except that a whole tick sees the positions from its start instead of each
+    unit seeing the ones already moved before it.
+    """
+    columns = {
+        "x": "f8", "health": "f8", "speed": "f8", "attack_power": "f8", "attack_range": "f8",
+        "attack_cooldown": "f8", "attack_frame_delay": "f8", "base_frame_delay": "f8",
+        "last_attack": "i8", "last_update": "i8", "hurt_start": "i8",
+        "side": "i1", "state": "i1", "frame": "i4", "target": "i4",
+        "is_attacking": "?", "ranged": "?", "attack_once": "?"
+    }
+    pushed = ("x", "health", "state", "frame", "is_attacking", "target")  # Columns push() writes to the views
+    unit_width = 120
+    hurt_duration = 200
+    field_left = -192
+    field_right = 1920
+    player_x_limit = 1920 - 120
+
+    @staticmethod
+    def available():
+        return np is not None
+
+    def __init__(self, capacity=64):
+        self.count = 0
+        self.views = []
+        self.slots = {}  # unit -> slot
+        self.frame_counts = np.ones((capacity, len(STATE_NAMES)), dtype="i4")
+        for name, dtype in self.columns.items():
+            setattr(self, name, np.zeros(capacity, dtype=dtype))
+
+    def grow(self):
+        capacity = len(self.x) * 2
+        for name in self.columns:
+            column = getattr(self, name)
+            grown = np.zeros(capacity, dtype=column.dtype)
+            grown[:self.count] = column[:self.count]
+            setattr(self, name, grown)
+        frame_counts = np.ones((capacity, len(STATE_NAMES)), dtype="i4")
+        frame_counts[:self.count] = self.frame_counts[:self.count]
+        self.frame_counts = frame_counts
+
+    def add(self, unit):
+        """Take over simulating unit, starting from its current attributes."""
+        if self.count == len(self.x):
+            self.grow()
+        slot = self.count
+        self.count += 1
+        self.views.append(unit)
+        self.slots[unit] = slot
+        self.pull(unit, slot)
+        self.frame_counts[slot] = [len(unit.animations.get(name) or ()) or 1 for name in STATE_NAMES]
+        self.side[slot] = PLAYER_SIDE if unit.direction == 1 else ENEMY_SIDE
+        self.ranged[slot] = unit.ranged
+        self.attack_once[slot] = unit.attack_once
+        unit.combat_core = self
+
+    def remove(self, unit):
+        slot = self.slots.pop(unit, None)
+        if slot is None:
+            return
+        unit.combat_core = None
+        last = self.count - 1
+        self.count = last
+        # Nobody can still be targeting a unit that is removed after its death animation
+        targeting = np.flatnonzero(self.target[:last + 1] == slot)
+        self.target[targeting] = NO_TARGET
+        for attacker in targeting.tolist():
+            self.views[attacker].attack_target = None
+        if slot != last:
+            moved = self.views[last]
+            for name in self.columns:
+                column = getattr(self, name)
+                column[slot] = column[last]
+            self.frame_counts[slot] = self.frame_counts[last]
+            self.target[:last][self.target[:last] == last] = slot
+            self.views[slot] = moved
+            self.slots[moved] = slot
+        self.views.pop()
+
+    def pull(self, unit, slot):
+        """Copy a view's simulation attributes into its slot."""
+        self.x[slot] = unit.x
+        self.health[slot] = unit.health
+        self.speed[slot] = unit.speed
+        self.attack_power[slot] = unit.attack_power
+        self.attack_range[slot] = unit.attack_range
+        self.attack_cooldown[slot] = unit.attack_cooldown
+        self.attack_frame_delay[slot] = unit.attack_frame_delay
+        self.base_frame_delay[slot] = unit.base_frame_delay
+        self.last_attack[slot] = unit.last_attack
+        self.last_update[slot] = unit.last_update
+        self.hurt_start[slot] = unit.hurt_start or 0
+        self.state[slot] = STATE_CODES.get(unit.state, IDLE)
+        self.frame[slot] = unit.frame
+        self.is_attacking[slot] = unit.is_attacking
+        if isinstance(unit.attack_target, Base):
+            self.target[slot] = BASE_TARGET
+        else:
+            self.target[slot] = self.slots.get(unit.attack_target, NO_TARGET)
+
+    def take_damage(self, unit, damage):
+        """Unit.take_damage for a unit the core owns, e.g. when an arrow lands on it."""
+        slot = self.slots[unit]
+        self.apply_damage(np.array([slot]), np.array([damage], dtype="f8"), SimClock.now())
+        self.push_slot(slot)
+
+    def apply_damage(self, slots, damage, now):
+        """Vectorized Unit.take_damage: damage[i] lands on slots[i]."""
+        n = self.count
+        total = np.bincount(slots, weights=damage, minlength=n)[:n]
+        state = self.state[:n]
+        hit = (total > 0) & (state != DIE)
+        self.health[:n][hit] -= total[hit]
+        died = hit & (self.health[:n] <= 0)
+        hurt = hit & ~died & (state != ATTACK)
+        self.health[:n][died] = 0
+        state[died] = DIE
+        self.frame[:n][died | hurt] = 0
+        self.is_attacking[:n][died] = False
+        self.target[:n][died] = NO_TARGET
+        state[hurt] = HURT
+        self.hurt_start[:n][hurt] = now
+
+    def step(self, now, player_base, enemy_base):
+        """Simulate one tick. Returns the projectiles ranged units fired and the views whose x or state changed."""
+        n = self.count
+        if n == 0:
+            return [], []
+        projectiles = []
+        before = {name: getattr(self, name)[:n].copy() for name in self.pushed}
+        bases = (enemy_base, player_base)  # Indexed by side: the base each side attacks
+        state = self.state[:n]
+        frame = self.frame[:n]
+        target = self.target[:n]
+        is_attacking = self.is_attacking[:n]
+
+        # Animation timers, as in Unit.update_animation
+        attacking = state == ATTACK
+        frame_delay = np.where(attacking, self.attack_frame_delay[:n], self.base_frame_delay[:n])
+        due = (now - self.last_update[:n]) >= frame_delay
+        self.last_update[:n][due] = now
+        attack_due = due & attacking
+        hurt_due = due & (state == HURT) & ~is_attacking
+        die_due = due & (state == DIE)
+        cycle_due = due & ~attack_due & ~hurt_due & ~die_due
+        counts = self.frame_counts[:n]
+
+        frame[attack_due] += 1
+        strikes = np.flatnonzero(attack_due & (frame == 7) & is_attacking & (target != NO_TARGET))
+        if len(strikes):
+            projectiles = self.strike(strikes, bases)
+
+        attack_over = attack_due & (frame > counts[:, ATTACK] - 1)
+        frame[attack_over] = 0
+        target = self.target[:n]
+        target_gone = (target == NO_TARGET) | ((target >= 0) & (state[np.maximum(target, 0)] == DIE))
+        base_health = np.array([bases[PLAYER_SIDE].health, bases[ENEMY_SIDE].health])
+        target_gone |= (target == BASE_TARGET) & (base_health[self.side[:n]] <= 0)
+        stop = attack_over & (target_gone | self.attack_once[:n])
+        is_attacking[stop] = False
+        target[stop] = NO_TARGET
+        state[stop] = IDLE
+
+        frame[hurt_due] = 0
+        state[hurt_due & (now - self.hurt_start[:n] >= self.hurt_duration)] = IDLE
+        frame[die_due] = np.minimum(frame[die_due] + 1, counts[die_due, DIE] - 1)
+        frame[cycle_due] = (frame[cycle_due] + 1) % counts[cycle_due, state[cycle_due]]
+
+        # Melee strikes on units land together once every animation has advanced
+        if len(strikes):
+            melee = ~self.ranged[strikes] & (self.target[strikes] >= 0)
+            if melee.any():
+                self.apply_damage(self.target[strikes[melee]], self.attack_power[strikes[melee]], now)
+
+        # Targeting: nearest living enemy in range on the other side, or the base edge
+        x = self.x[:n]
+        alive = (state != DIE) & (x >= self.field_left) & (x <= self.field_right)
+        side = self.side[:n]
+        nearest = np.full(n, NO_TARGET, dtype="i4")
+        nearest_distance = np.full(n, np.inf)
+        lanes = []
+        for s in (PLAYER_SIDE, ENEMY_SIDE):
+            members = np.flatnonzero(alive & (side == s))
+            order = np.argsort(x[members], kind="stable")
+            lanes.append((x[members][order], members[order]))
+        for s in (PLAYER_SIDE, ENEMY_SIDE):
+            seekers = np.flatnonzero(side == s)
+            enemy_x, enemy_slots = lanes[1 - s]
+            if len(enemy_x) and len(seekers):
+                nearest_distance[seekers], nearest[seekers] = self.closest(x[seekers], enemy_x, enemy_slots)
+        in_range = nearest_distance <= self.attack_range[:n]
+        nearest[~in_range] = NO_TARGET
+        nearest_distance[~in_range] = np.inf
+
+        base_x = np.array([enemy_base.get_rect().left, player_base.get_rect().right], dtype="f8")[side]
+        base_distance = np.abs(x - base_x)
+        to_base = (base_distance <= self.attack_range[:n]) & (base_health[side] > 0) & (base_distance < nearest_distance)
+        nearest[to_base] = BASE_TARGET
+
+        # Movement and attack start, as in Unit.move and the collision checks
+        movers = (state != ATTACK) & (state != DIE)
+        has_target = movers & (nearest != NO_TARGET)
+        creeping = has_target & (side == ENEMY_SIDE) & (nearest == BASE_TARGET)
+        if creeping.any():
+            creep_x = player_base.get_rect().right - self.attack_range[:n]
+            creep = creeping & (x > creep_x)
+            x[creep] = np.maximum(creep_x[creep], x[creep] - self.speed[:n][creep])
+        attack_slots = np.flatnonzero(has_target)
+        attack_targets = nearest[has_target]
+
+        walkers = np.flatnonzero(movers & ~has_target)
+        if len(walkers):
+            more_slots, more_targets = self.walk(walkers, lanes, player_base, enemy_base)
+            attack_slots = np.concatenate((attack_slots, more_slots))
+            attack_targets = np.concatenate((attack_targets, more_targets))
+        self.start_attacks(attack_slots, attack_targets, now)
+
+        clamped = (side == PLAYER_SIDE) & (x >= self.player_x_limit)
+        x[clamped] = self.player_x_limit
+        state[clamped] = IDLE
+
+        changed = np.zeros(n, dtype="?")
+        for name, column in before.items():
+            changed |= getattr(self, name)[:n] != column
+        self.push(bases, np.flatnonzero(changed))
+        moved = np.flatnonzero((x != before["x"]) | (state != before["state"]))
+        return projectiles, [self.views[slot] for slot in moved.tolist()]
+
+    @staticmethod
+    def closest(xs, lane_x, lane_slots):
+        """For each x, the distance to and slot of the nearest entry in the sorted lane."""
+        right = np.searchsorted(lane_x, xs)
+        left = np.maximum(right - 1, 0)
+        right = np.minimum(right, len(lane_x) - 1)
+        left_distance = np.abs(xs - lane_x[left])
+        right_distance = np.abs(lane_x[right] - xs)
+        pick_left = left_distance <= right_distance
+        return np.where(pick_left, left_distance, right_distance), np.where(pick_left, lane_slots[left], lane_slots[right])
+
+    def walk(self, walkers, lanes, player_base, enemy_base):
+        """Move units with nothing in range; returns the (slots, targets) that walked into an enemy or base."""
+        x = self.x
+        state = self.state
+        side = self.side[walkers]
+        direction = np.where(side == PLAYER_SIDE, 1.0, -1.0)
+        old_x = x[walkers]
+        speed = self.speed[walkers]
+        new_x = old_x + (speed + 1) * direction
+        new_state = np.where(state[walkers] == HURT, HURT, RUN)
+        width = self.unit_width
+        attack_slot = np.full(len(walkers), NO_TARGET, dtype="i4")
+        moving = np.ones(len(walkers), dtype="?")
+
+        # Enemy units bump into the player base before anything else
+        player_rect = player_base.get_rect()
+        hits_player_base = (side == ENEMY_SIDE) & (new_x + 3 < player_rect.right) & (new_x + 3 + width > player_rect.left)
+        new_x[hits_player_base] = player_rect.left
+        attack_slot[hits_player_base] = BASE_TARGET
+        moving &= ~hits_player_base
+
+        # Walking into an enemy unit stops right in front of it and starts an attack
+        for s in (PLAYER_SIDE, ENEMY_SIDE):
+            group = np.flatnonzero(moving & (side == s))
+            enemy_x, enemy_slots = lanes[1 - s]
+            if not len(group) or not len(enemy_x):
+                continue
+            distance, enemy = self.closest(new_x[group] + 3, enemy_x, enemy_slots)
+            bumped = distance < width
+            group = group[bumped]
+            enemy = enemy[bumped]
+            new_x[group] = x[enemy] - width * direction[group]
+            attack_slot[group] = enemy
+            moving[group] = False
+
+        # Same-side unit just ahead: queue up behind it, or follow at its pace
+        for s in (PLAYER_SIDE, ENEMY_SIDE):
+            group = np.flatnonzero(moving & (side == s))
+            lane_x, lane_slots = lanes[s]
+            if not len(group) or not len(lane_x):
+                continue
+            if s == PLAYER_SIDE:
+                ahead = np.searchsorted(lane_x, old_x[group], side="right")
+                valid = ahead < len(lane_x)
+            else:
+                ahead = np.searchsorted(lane_x, old_x[group], side="left") - 1
+                valid = ahead >= 0
+            group = group[valid]
+            blocker = lane_slots[ahead[valid]]
+            blocker_x = x[blocker]
+            blocked = np.abs(new_x[group] + 3 - blocker_x) < width
+            group = group[blocked]
+            blocker = blocker[blocked]
+            blocker_x = blocker_x[blocked]
+            if not len(group):
+                continue
+            standing = (state[blocker] == IDLE) | (state[blocker] == ATTACK)
+            behind_x = blocker_x - width * direction[group]
+            if s == PLAYER_SIDE:
+                new_x[group] = np.where(standing, behind_x, np.minimum(old_x[group] + speed[group], behind_x))
+            else:
+                new_x[group] = np.where(standing, old_x[group], np.maximum(old_x[group] - speed[group], behind_x))
+            new_state[group] = np.where(standing & (new_state[group] != HURT), IDLE, new_state[group])
+            following = group[~standing]
+            self.speed[walkers[following]] = np.minimum(speed[following], self.speed[blocker[~standing]])
+            moving[group] = False
+
+        # Player units walking into the enemy base
+        enemy_rect = enemy_base.get_rect()
+        hits_enemy_base = moving & (side == PLAYER_SIDE) & (new_x + 3 < enemy_rect.right) & (new_x + 3 + width > enemy_rect.left)
+        new_x[hits_enemy_base] = enemy_rect.left - width
+        attack_slot[hits_enemy_base] = BASE_TARGET
+
+        x[walkers] = new_x
+        attackers = attack_slot != NO_TARGET
+        state[walkers[~attackers]] = new_state[~attackers]  # Attackers only change state once the attack starts
+        return walkers[attackers], attack_slot[attackers]
+
+    def start_attacks(self, slots, targets, now):
+        """Vectorized Unit.attack."""
+        ready = (self.state[slots] != DIE) & ~self.is_attacking[slots] & (now - self.last_attack[slots] >= self.attack_cooldown[slots])
+        slots = slots[ready]
+        self.target[slots] = targets[ready]
+        self.is_attacking[slots] = True
+        self.state[slots] = ATTACK
+        self.frame[slots] = 0
+        self.last_attack[slots] = now
+
+    def strike(self, strikers, bases):
+        """Attack frame sounds, melee hits on a base, and projectiles for ranged units."""
+        projectiles = []
+        targets = self.target[strikers]
+        melee = ~self.ranged[strikers]
+        for slot, target, is_melee in zip(strikers.tolist(), targets.tolist(), melee.tolist()):
+            unit = self.views[slot]
+            SoundBank.play(unit.attack_sound)
+            if target == BASE_TARGET:
+                base = bases[self.side[slot]]
+                if is_melee:
+                    if base.health > 0:
+                        base.take_damage(float(self.attack_power[slot]))
+                    continue
+                unit.attack_target = base
+            elif is_melee:
+                continue
+            else:
+                unit.attack_target = self.views[target]
+            unit.x = float(self.x[slot])
+            projectiles.append(unit.make_projectile())
+        return projectiles
+
+    def push_slot(self, slot):
+        unit = self.views[slot]
+        unit.health = float(self.health[slot])
+        unit.state = STATE_NAMES[self.state[slot]]
+        unit.frame = int(self.frame[slot])
+        unit.is_attacking = bool(self.is_attacking[slot])
+        target = self.target[slot]
+        if target >= 0:
+            unit.attack_target = self.views[target]
+        elif target == NO_TARGET:
+            unit.attack_target = None
+        unit.hurt_start = int(self.hurt_start[slot])
+
+    def push(self, bases, slots=None):
+        """Write positions, state and health back to the views in slots, or to every view."""
+        if slots is None:
+            slots = np.arange(self.count)
+        views = self.views
+        for slot, x, health, state, frame, is_attacking, target, side in zip(
+                slots.tolist(), self.x[slots].tolist(), self.health[slots].tolist(), self.state[slots].tolist(),
+                self.frame[slots].tolist(), self.is_attacking[slots].tolist(), self.target[slots].tolist(), self.side[slots].tolist()):
+            unit = views[slot]
+            unit.x = x
+            unit.health = health
+            unit.state = STATE_NAMES[state]
+            unit.frame = frame
+            unit.is_attacking = is_attacking
+            if target >= 0:
+                unit.attack_target = views[target]
+            elif target == BASE_TARGET:
+                unit.attack_target = bases[side]
+            else:
+                unit.attack_target = None
+
+    def release(self, player_base, enemy_base):
+        """Hand every unit back to the object simulation with its full state."""
+        bases = (enemy_base, player_base)
+        self.push(bases)
+        for slot, unit in enumerate(self.views[:self.count]):
+            unit.speed = float(self.speed[slot])
+            unit.last_attack = int(self.last_attack[slot])
+            unit.last_update = int(self.last_update[slot])
+            unit.hurt_start = int(self.hurt_start[slot]) if self.state[slot] == HURT else None
+            unit.combat_core = None
+        self.views = []
+        self.slots = {}
+        self.count = 0
+
+    def __len__(self):
+        return self.count
@@ -1,6 +1,10 @@
 import pygame
 from story import Story  # Import the new Story class
 from units import Bandit_Razor, Player_ArcherUnit, Player_TankUnit # Add this import
+from sounds import SoundBank
+from fonts import Fonts
+from asset_bake import load_image
+from renderer import Display
 
 
 class EventHandler:
@@ -11,17 +15,17 @@ class EventHandler:
         self.text_index = 0
         self.next_button = pygame.Rect(1920 // 2 - 100, 880 // 2 + 100, 200, 60)
         self.okay_button = pygame.Rect(0, 0, 250, 80)  # For show_end_story
+        self.click_sound = SoundBank.get("assets/sounds/UI/button_click.ogg")
         try:
-            self.click_sound = pygame.mixer.Sound("assets/sounds/UI/button_click.ogg")
-            self.text_bg = pygame.image.load("assets/ui/ui_text.png").convert_alpha()
-            self.button_bg = pygame.image.load("assets/ui/ui_buttons.png").convert_alpha()
-            self.next_button_bg = pygame.image.load("assets/ui/ui_text.png").convert_alpha()
+            self.text_bg = load_image("assets/ui/ui_text.png")
+            self.button_bg = load_image("assets/ui/ui_buttons.png")
+            self.next_button_bg = load_image("assets/ui/ui_text.png")
             self.next_button_bg = pygame.transform.scale(self.next_button_bg, (200, 60))
-            self.storyteller_img = pygame.image.load("assets/faces/storyteller.png").convert_alpha()
+            self.storyteller_img = load_image("assets/faces/storyteller.png")
             self.storyteller_img = pygame.transform.scale(self.storyteller_img, (200, 200))
-            self.bandit_king_img = pygame.image.load("assets/faces/bandit_king_face.png").convert_alpha()  # New image
+            self.bandit_king_img = load_image("assets/faces/bandit_king_face.png")  # New image
             self.bandit_king_img = pygame.transform.scale(self.bandit_king_img, (200, 200))
-            self.tank_img = pygame.image.load("assets/faces/player_tank_face.png").convert_alpha()  # New Tank face
+            self.tank_img = load_image("assets/faces/player_tank_face.png")  # New Tank face
             self.tank_img = pygame.transform.scale(self.tank_img, (200, 200))
         except Exception as e:
             print(f"Failed to load assets in EventHandler: {e}")
@@ -62,6 +66,7 @@ class EventHandler:
                             unit.is_retreating = False
                             unit.speed = original_speed  # Restores upgraded speed
                             unit.finished_moving = True  # Movement complete
+                        self.game.spatial_index.update(unit)
             if all_done:
                 self.game.units_moving_back = False
                 print("All units finished moving")
@@ -97,6 +102,7 @@ class EventHandler:
                     self.current_text = self.game.story.get_event_story("king_threat")
                     self.text_index = 0
                     print("Both units and king finished moving, king_threat triggered")
+            self.game.spatial_index.update(self.game.bandit_king)
             return True
         return False
 
@@ -180,20 +186,14 @@ class EventHandler:
         if not (showing_intro_or_event or showing_end):
             return
 
-        try:
-            FONT_CTA = pygame.font.Font("assets/fonts/OpenSans-Bold.ttf", 40)
-            FONT_BODY = pygame.font.Font("assets/fonts/OpenSans-Regular.ttf", 32)
-            FONT_SMALL = pygame.font.Font("assets/fonts/OpenSans-Bold.ttf", 24)
-        except Exception as e:
-            print(f"Failed to load fonts: {e}")
-            FONT_CTA = pygame.font.SysFont("Open Sans", 40, bold=True)
-            FONT_BODY = pygame.font.SysFont("Open Sans", 32)
-            FONT_SMALL = pygame.font.SysFont("Open Sans", 24, bold=True)
+        FONT_CTA = Fonts.get(40, bold=True)
+        FONT_BODY = Fonts.get(32)
+        FONT_SMALL = Fonts.get(24, bold=True)
 
         PADDING = 40
 
         if showing_intro_or_event and self.text_index < len(self.current_text):
-            overlay = pygame.Surface((1200, 400))
+            overlay = Display.create_surface((1200, 400))
             overlay.fill((0, 0, 0))
             overlay.set_alpha(200)
             overlay_x = 1920 // 2 - 600
@@ -229,7 +229,7 @@ class EventHandler:
                                    self.next_button.y + (self.next_button.height - next_text.get_height()) // 2))
 
         elif showing_end:
-            overlay = pygame.Surface((1920, 1080))
+            overlay = Display.create_surface((1920, 1080))
             overlay.fill((0, 0, 0))
             overlay.set_alpha(200)
             screen.blit(overlay, (0, 0))
@@ -0,0 +1,80 @@
+import pygame
+from collections import OrderedDict
+
+class TextCache:
+    """LRU cache of rendered text surfaces keyed by (font, string, color).
+
+    HP labels, button captions and menu headings repeat every frame, so they
+    are rendered once and the same surface is blitted after that. Surfaces
+    handed out are shared and must not be drawn on.
+    """
+    max_entries = 512
+    entries = OrderedDict()
+    hits = 0
+    misses = 0
+
+    @classmethod
+    def render(cls, font, text, antialias, color, background=None):
+        key = (font, text, antialias, tuple(color), tuple(background) if background is not None else None)
+        surface = cls.entries.get(key)
+        if surface is not None:
+            cls.hits += 1
+            cls.entries.move_to_end(key)
+            return surface
+        cls.misses += 1
+        surface = font.render(text, antialias, color, background)
+        cls.entries[key] = surface
+        if len(cls.entries) > cls.max_entries:
+            cls.entries.popitem(last=False)
+        return surface
+
+    @classmethod
+    def stats(cls):
+        lookups = cls.hits + cls.misses
+        return {
+            "entries": len(cls.entries),
+            "hits": cls.hits,
+            "misses": cls.misses,
+            "hit_rate": cls.hits / lookups if lookups else 0.0
+        }
+
+
+class CachedFont:
+    """A pygame Font whose render() goes through the TextCache."""
+    def __init__(self, font):
+        self.font = font
+
+    def render(self, text, antialias, color, background=None):
+        return TextCache.render(self.font, text, antialias, color, background)
+
+    def __getattr__(self, name):
+        return getattr(self.font, name)
+
+
+class Fonts:
+    """Registry that opens each (face, size, style) once for the whole game."""
+    font_dir = "assets/fonts"
+    fonts = {}
+
+    @classmethod
+    def get(cls, size, bold=False):
+        """Open Sans from assets/fonts, falling back to the system font if the file can't be loaded."""
+        style = "Bold" if bold else "Regular"
+        key = ("OpenSans", size, style)
+        font = cls.fonts.get(key)
+        if font is None:
+            try:
+                font = pygame.font.Font(f"{cls.font_dir}/OpenSans-{style}.ttf", size)
+            except Exception as e:
+                print(f"Failed to load font OpenSans-{style}: {e}")
+                font = pygame.font.SysFont("Open Sans", size, bold=bold)
+            font = cls.fonts[key] = CachedFont(font)
+        return font
+
+    @classmethod
+    def get_sys(cls, name, size, bold=False):
+        key = (name, size, "Bold" if bold else "Regular")
+        font = cls.fonts.get(key)
+        if font is None:
+            font = cls.fonts[key] = CachedFont(pygame.font.SysFont(name, size, bold=bold))
+        return font
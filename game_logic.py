@@ -1,61 +1,110 @@
 import pygame
 import random
+from array import array
 import asyncio
 import sys
 from levels import Level
 from buildings import Base, VisualBase
+from asset_bake import BakedAssets, BASE_SCALE, ROCKET_SHEET, ROCKET_FRAMES, ROCKET_FRAME_SIZE, crop_battlefield, load_image, load_scaled, slice_rocket_frames
 from ui import UI
-from units import Player_ArcherUnit, Bandit_King, Bandit_Razor, CartUnit, Player_TankUnit, PlayerTowerArcher, ZombieTowerArcher, UndeadTowerMage
+from units import FactionPreloader, Player_ArcherUnit, Bandit_King, Bandit_Razor, CartUnit, Player_TankUnit, PlayerTowerArcher, ZombieTowerArcher, UndeadTowerMage
 from factions import Player, Bandits, Undead, Zombies
-from collisions import find_closest_target
+from collisions import SpatialIndex, find_closest_target
+from combat_core import CombatCore
 from eventhandler import EventHandler
 from story import Story
-
-class SeedDrop:
-    def __init__(self, x, y, value):
-        self.x = x + random.uniform(-5, 5)
-        self.start_y  = y + 50
-        self.y = self.start_y  # Current y position
-        self.target_y = self.start_y + 50  # Drop 100px down from start
-        self.value = value
-        self.creation_time = pygame.time.get_ticks()
-        self.lifetime = 2500
-        self.alpha = 255
-        self.drop_speed = 3.0  # Pixels per frame (adjustable)
-        self.x_speed = random.uniform(-2.5, 2.5)  # Random horizontal spread, -1.5 to +1.5 px/frame
-
-        try:
-            self.sprite = pygame.image.load("assets/images/seed.png").convert_alpha()
-            self.sprite = pygame.transform.scale(self.sprite, (55, 55))
-        except:
-            self.sprite = pygame.Surface((55, 55))
-            self.sprite.fill((249, 249, 242))
+from fonts import Fonts
+from renderer import Display, DirtyRectRenderer, RenderQueue, StaticLayer, draw_rect
+from simclock import SimClock
+
+class SeedDrops:
+    """Every seed drop in the battle, kept as one particle system.
+
+    Position, speed, drop target and spawn time live in flat arrays, one slot
+    per drop, and all drops share a single seed sprite that is pre-baked at a
+    few alpha levels for the fade-out. Drawing is one Surface.blits call.
+    """
+    lifetime = 2500
+    fade_time = 1000  # Drops fade out over the last second of their life
+    drop_speed = 3.0  # Pixels per simulation tick
+    alpha_steps = 16
+    frames = None  # Shared sprite at each alpha step, index alpha_steps is fully opaque
+
+    def __init__(self):
+        self.x = array("f")
+        self.y = array("f")
+        self.target_y = array("f")
+        self.x_speed = array("f")
+        self.spawn_time = array("l")
+        self.frame = array("B")
+        self.get_frames()
+
+    @classmethod
+    def get_frames(cls):
+        if cls.frames is None:
+            try:
+                sprite = load_image("assets/images/seed.png")
+                sprite = pygame.transform.scale(sprite, (55, 55))
+            except Exception as e:
+                print(f"Failed to load seed sprite: {e}")
+                sprite = pygame.Surface((55, 55))
+                sprite.fill((249, 249, 242))
+            frames = []
+            for step in range(cls.alpha_steps + 1):
+                frame = sprite.copy()
+                frame.set_alpha(255 * step // cls.alpha_steps)
+                frames.append(frame)
+            frames[-1] = sprite
+            cls.frames = tuple(frames)
+        return cls.frames
+
+    def __len__(self):
+        return len(self.x)
+
+    def spawn(self, x, y, count):
+        now = SimClock.now()
+        for _ in range(count):
+            self.x.append(x + random.uniform(-5, 5))
+            self.y.append(y + 50)
+            self.target_y.append(y + 100)  # Drop 50px below where it appears
+            self.x_speed.append(random.uniform(-2.5, 2.5))  # Random horizontal spread
+            self.spawn_time.append(now)
+            self.frame.append(self.alpha_steps)
 
     def update(self):
-        elapsed = pygame.time.get_ticks() - self.creation_time
-        # Handle dropping and spreading
-        if self.y < self.target_y:
-            self.y += self.drop_speed  # Move down
-            self.x += self.x_speed    # Spread horizontally
-            if self.y > self.target_y:
-                self.y = self.target_y  # Clamp to target
-        # Handle fading
-        if elapsed > self.lifetime - 1000:
-            self.alpha = max(0, 255 * (self.lifetime - elapsed) / 1000)
-            self.sprite.set_alpha(int(self.alpha))
+        now = SimClock.now()
+        live = [i for i, spawn_time in enumerate(self.spawn_time) if now - spawn_time < self.lifetime]
+        if len(live) != len(self.spawn_time):
+            for name in ("x", "y", "target_y", "x_speed", "spawn_time", "frame"):
+                column = getattr(self, name)
+                setattr(self, name, array(column.typecode, [column[i] for i in live]))
+
+        x, y, target_y, x_speed = self.x, self.y, self.target_y, self.x_speed
+        for i, elapsed in enumerate(now - spawn_time for spawn_time in self.spawn_time):
+            if y[i] < target_y[i]:
+                y[i] = min(y[i] + self.drop_speed, target_y[i])
+                x[i] += x_speed[i]
+            if elapsed > self.lifetime - self.fade_time:
+                alpha = max(0, 255 * (self.lifetime - elapsed) / self.fade_time)
+                self.frame[i] = int(alpha * self.alpha_steps / 255)
+
+    def get_rects(self):
+        width, height = self.frames[0].get_size()
+        return [pygame.Rect(int(x), int(y), width, height) for x, y in zip(self.x, self.y)]
+
+    def get_blits(self):
+        frames = self.frames
+        return [(frames[frame], (x, y)) for frame, x, y in zip(self.frame, self.x, self.y)]
 
     def draw(self, screen):
-        screen.blit(self.sprite, (self.x, self.y))
-
-    def is_expired(self):
-        return pygame.time.get_ticks() - self.creation_time >= self.lifetime
+        screen.blits(self.get_blits(), doreturn=False)
 
 class Tower:
     def __init__(self, x, y, sprite_path, base_width, base_height):
         self.x = x
         self.y = y
         try:
-            self.sprite = pygame.image.load(sprite_path).convert_alpha()
+            self.sprite = load_image(sprite_path)
             self.sprite = pygame.transform.scale(self.sprite, (int(base_width * 0.7), int(base_height * 0.7)))
         except Exception as e:
             print(f"Failed to load tower sprite {sprite_path}: {e}")
@@ -70,7 +119,7 @@ class Wall:
         self.x = x
         self.y = y
         try:
-            self.sprite = pygame.image.load(sprite_path).convert_alpha()
+            self.sprite = load_image(sprite_path)
             orig_width, orig_height = self.sprite.get_size()
             new_width = int(orig_width * 0.75 * 0.9)
             new_height = int(orig_height * 0.75 * 0.9)
@@ -88,7 +137,7 @@ class Prison:
         self.x = x
         self.y = y
         try:
-            self.sprite = pygame.image.load("assets/images/prison.png").convert_alpha()
+            self.sprite = load_image("assets/images/prison.png")
             self.sprite = pygame.transform.scale(self.sprite, (200, 200))
             print(f"Loaded prison.png successfully, size: {self.sprite.get_size()}")
         except Exception as e:
@@ -104,7 +153,7 @@ class PrisonBars:
         self.x = x
         self.y = y
         try:
-            self.sprite = pygame.image.load("assets/images/prison_bars.png").convert_alpha()
+            self.sprite = load_image("assets/images/prison_bars.png")
             self.sprite = pygame.transform.scale(self.sprite, (200, 200))
             print(f"Loaded prison_bars.png successfully, size: {self.sprite.get_size()}")
         except Exception as e:
@@ -117,6 +166,9 @@ class PrisonBars:
 
 class Game:
     BUCKET_SIZE = 400
+    dirty_rect_rendering = True  # Present only changed regions instead of flipping the whole screen
+    combat_core_enabled = False  # Simulate units in the NumPy CombatCore when NumPy is installed
+    frame_rate = 60  # Render cap; the simulation runs at SimClock.tick_rate regardless
     FACTION_MAP = {
         "Player": Player(),
         "Bandits": Bandits(),
@@ -131,6 +183,8 @@ class Game:
         self.player_faction = "Player"
         self.level = Level(level_number)
         self.enemy_faction = self.level.faction
+        FactionPreloader.prefetch(self.player_faction)
+        FactionPreloader.prefetch(self.enemy_faction)
         self.seeds = 50
 
         # Calculate player base health with upgrades
@@ -140,12 +194,14 @@ class Game:
         # Set passive income
         total_locked = self.main_menu.get_total_locked_superseeds()
         self.passive_income = 0.1 + total_locked * 0.0005
-        print(f"Total Superseeds locked: {total_locked}. Passive income set to {self.passive_income} seeds/frame ({self.passive_income * 60} seeds/sec)")
+        print(f"Total Superseeds locked: {total_locked}. Passive income set to {self.passive_income} seeds/tick ({self.passive_income * SimClock.tick_rate} seeds/sec)")
 
         self.units = []
         self.enemy_units = []
+        self.spatial_index = SpatialIndex(self.BUCKET_SIZE)
+        self.combat_core = CombatCore() if self.combat_core_enabled and CombatCore.available() else None
         self.buildings = []
-        self.seed_drops = []
+        self.seed_drops = SeedDrops()
         self.arrows = []
         self.xp = 0
         self.max_xp = 100
@@ -167,7 +223,7 @@ class Game:
         self.volume = self.main_menu.volume
         self.selected_unit = None
 
-        self.static_surface = pygame.Surface((1920, 1080)).convert()
+        self.static_surface = Display.create_surface((1920, 1080)).convert()
         if self.enemy_faction == "Zombies":
             bg_path = "assets/backgrounds/battlefield_zombies.png"
         elif self.enemy_faction == "Undead":
@@ -175,34 +231,31 @@ class Game:
         else:
             bg_path = "assets/backgrounds/battlefield.png"
         try:
-            battlefield = pygame.image.load(bg_path).convert()
-            orig_height = battlefield.get_height()
-            crop_height = int(orig_height * 0.90)
-            battlefield = battlefield.subsurface((0, 0, battlefield.get_width(), crop_height))
-            self.static_surface.blit(pygame.transform.scale(battlefield, (1920, 880)), (0, 0))
+            battlefield = BakedAssets.load(bg_path, "battlefield", alpha=False)
+            if battlefield is None:
+                battlefield = crop_battlefield(load_image(bg_path, alpha=False))
+            self.static_surface.blit(battlefield, (0, 0))
         except Exception as e:
             print(f"Failed to load {bg_path}: {e}")
             self.static_surface.fill((14, 39, 59))
-        pygame.draw.rect(self.static_surface, (14, 39, 59), (0, 880, 1920, 160))
+        draw_rect(self.static_surface, (14, 39, 59), (0, 880, 1920, 160))
 
         try:
-            self.victory_background = pygame.image.load("assets/backgrounds/victory_background.png").convert()
-            self.victory_background = pygame.transform.scale(self.victory_background, (1920, 1080))
+            self.victory_background = load_scaled("assets/backgrounds/victory_background.png", (1920, 1080), alpha=False)
         except Exception as e:
             print(f"Failed to load victory_background.png: {e}")
             self.victory_background = pygame.Surface((1920, 1080))
             self.victory_background.fill((0, 255, 0))
 
         try:
-            self.defeat_background = pygame.image.load("assets/backgrounds/losing_background.png").convert()
-            self.defeat_background = pygame.transform.scale(self.defeat_background, (1920, 1080))
+            self.defeat_background = load_scaled("assets/backgrounds/losing_background.png", (1920, 1080), alpha=False)
         except Exception as e:
             print(f"Failed to load losing_background.png: {e}")
             self.defeat_background = pygame.Surface((1920, 1080))
             self.defeat_background.fill((255, 0, 0))
 
         try:
-            self.ui_title = pygame.image.load("assets/ui/ui_title.png").convert_alpha()
+            self.ui_title = load_image("assets/ui/ui_title.png")
             self.ui_title = pygame.transform.scale(self.ui_title, (350, 100))
         except Exception as e:
             print(f"Failed to load ui_title.png: {e}")
@@ -210,7 +263,7 @@ class Game:
             self.ui_title.fill((128, 128, 128))
 
         try:
-            self.storyteller_happy = pygame.image.load("assets/faces/storyteller_happy.png").convert_alpha()
+            self.storyteller_happy = load_image("assets/faces/storyteller_happy.png")
             self.storyteller_happy = pygame.transform.scale(self.storyteller_happy, (200, 200))
         except Exception as e:
             print(f"Failed to load storyteller_happy.png: {e}")
@@ -218,7 +271,7 @@ class Game:
             self.storyteller_happy.fill((0, 255, 0))
 
         try:
-            self.storyteller_angry = pygame.image.load("assets/faces/storyteller_angry.png").convert_alpha()
+            self.storyteller_angry = load_image("assets/faces/storyteller_angry.png")
             self.storyteller_angry = pygame.transform.scale(self.storyteller_angry, (200, 200))
         except Exception as e:
             print(f"Failed to load storyteller_angry.png: {e}")
@@ -226,12 +279,11 @@ class Game:
             self.storyteller_angry.fill((255, 0, 0))
 
         try:
-            rocket_sheet = pygame.image.load("assets/ui/ui_victory_rocket.png").convert_alpha()
-            self.rocket_frames = []
-            for i in range(18):
-                frame = rocket_sheet.subsurface((i * 192, 0, 192, 192))
-                frame = pygame.transform.scale(frame, (96, 96))
-                self.rocket_frames.append(frame)
+            rocket_strip = BakedAssets.load(ROCKET_SHEET, f"frames_{ROCKET_FRAME_SIZE}")
+            if rocket_strip is None:
+                rocket_strip = slice_rocket_frames(load_image(ROCKET_SHEET))
+            self.rocket_frames = [rocket_strip.subsurface((i * ROCKET_FRAME_SIZE, 0, ROCKET_FRAME_SIZE, ROCKET_FRAME_SIZE))
+                                  for i in range(ROCKET_FRAMES)]
         except Exception as e:
             print(f"Failed to load ui_victory_rocket.png: {e}")
             self.rocket_frames = [pygame.Surface((96, 96)) for _ in range(18)]
@@ -244,10 +296,8 @@ class Game:
 
         # Player base (primary)
         self.player_base = Base(x=50, y=505, health=player_base_health,
-                                sprite_path="assets/buildings/Player/player_base.png", is_player=True)
+                                sprite_path="assets/buildings/Player/player_base.png", is_player=True, scale=BASE_SCALE)
         self.player_base.sprite = pygame.transform.flip(self.player_base.sprite, True, False)
-        orig_width, orig_height = self.player_base.sprite.get_size()
-        self.player_base.sprite = pygame.transform.scale(self.player_base.sprite, (int(orig_width * 0.52), int(orig_height * 0.52)))
         # Debug log for player base left rect
         print(f"Player base left rect: {self.player_base.get_rect().left}px")
         
@@ -261,11 +311,7 @@ class Game:
         # Enemy base (primary)
         enemy_base_path = f"assets/buildings/Enemy/{self.enemy_faction}/{self.enemy_faction}_base.png"
         level_scale = 1 + 0.1 * (self.level.level_number - 1)
-        self.enemy_base = Base(x=1470, y=495, health=Base.base_health * level_scale, sprite_path=enemy_base_path, is_player=False)
-
-
-        orig_width, orig_height = self.enemy_base.sprite.get_size()
-        self.enemy_base.sprite = pygame.transform.scale(self.enemy_base.sprite, (int(orig_width * 0.52), int(orig_height * 0.52)))
+        self.enemy_base = Base(x=1470, y=495, health=Base.base_health * level_scale, sprite_path=enemy_base_path, is_player=False, scale=BASE_SCALE)
 
         # Enemy second base (visual only)
         self.enemy_base_2 = VisualBase(x=1470, y=495,
@@ -313,7 +359,13 @@ class Game:
             self.prison_bars = None
 
         self.ui = UI(self, 1920)
-        self.last_enemy_spawn = pygame.time.get_ticks()
+        self.renderer = DirtyRectRenderer(screen) if self.dirty_rect_rendering else None
+        self.static_layer = StaticLayer(self.static_surface)
+        self.render_queue = RenderQueue(("towers", "units", "seed_drops", "projectiles", "cart"))
+        self.last_hud_state = None
+        self.last_panel_state = None
+        self.last_base_state = None
+        self.last_enemy_spawn = SimClock.now()
         self.game_over = False
         self.won = False
         self.fade_alpha = 0
@@ -331,7 +383,7 @@ class Game:
         self.show_bandit_surrender = False
         self.show_surrender_part_two = False
         self.show_king_threat = False
-        self.start_time = pygame.time.get_ticks()
+        self.start_time = SimClock.now()
         self.surrender_triggered = False
         self.main_menu.achievements.check_achievements("game_started", {})
         self.story = Story()
@@ -344,14 +396,42 @@ class Game:
         self.scale_factor = 1.0
 
         try:
-            self.menu_button_bg = pygame.image.load("assets/ui/ui_buttons.png").convert_alpha()
-            self.ui_text_bg = pygame.image.load("assets/ui/ui_text.png").convert_alpha()
+            self.menu_button_bg = load_image("assets/ui/ui_buttons.png")
+            self.ui_text_bg = load_image("assets/ui/ui_text.png")
         except Exception as e:
             print(f"Failed to load ui assets: {e}")
             self.menu_button_bg = pygame.Surface((60, 40))
             self.menu_button_bg.fill((147, 208, 207))
             self.ui_text_bg = pygame.Surface((200, 60))
             self.ui_text_bg.fill((147, 208, 207))
+        self.menu_button_image = pygame.transform.scale(self.menu_button_bg, (self.menu_button.width, self.menu_button.height))
+        self.end_layers = {}  # Static part of the victory/defeat screen keyed by self.won, built on first use
+        self.end_frame = None  # Scratch surface the end screen is composed on while it fades in
+
+    def render_end_layer(self, font_title, font_body):
+        """Render everything on the end screen except the animated rockets."""
+        layer = Display.create_surface((1920, 1080)).convert()
+        layer.blit(self.victory_background if self.won else self.defeat_background, (0, 0))
+
+        title_y = 880 // 2 - self.ui_title.get_height() // 2 - 50
+        storyteller_x = 1920 // 2 - self.storyteller_happy.get_width() // 2
+        storyteller_y = title_y - self.storyteller_happy.get_height() - 10
+        layer.blit(self.storyteller_happy if self.won else self.storyteller_angry, (storyteller_x, storyteller_y))
+
+        result_text = font_title.render("Victory" if self.won else "Defeat", True, (255, 255, 255))
+        title_x = 1920 // 2 - self.ui_title.get_width() // 2
+        layer.blit(self.ui_title, (title_x, title_y))
+        text_x = 1920 // 2 - result_text.get_width() // 2
+        text_y = 880 // 2 - result_text.get_height() // 2 - 50
+        layer.blit(result_text, (text_x, text_y))
+
+        return_bg = pygame.transform.scale(self.ui_text_bg, (self.return_button.width, self.return_button.height))
+        layer.blit(return_bg, (self.return_button.x, self.return_button.y))
+        return_text = font_body.render("Return to Menu", True, (249, 249, 242))
+        button_text_x = self.return_button.x + (self.return_button.width - return_text.get_width()) // 2
+        button_text_y = self.return_button.y + (self.return_button.height - return_text.get_height()) // 2
+        layer.blit(return_text, (button_text_x, button_text_y))
+        return layer
 
     def spawn_unit(self, unit_type):
         if self.seeds >= unit_type.cost:
@@ -384,6 +464,9 @@ class Game:
             new_unit.speed += movement_speed_increase
             
             self.units.append(new_unit)
+            self.spatial_index.insert(new_unit)
+            if self.combat_core is not None:
+                self.combat_core.add(new_unit)
             self.main_menu.achievements.check_achievements("unit_spawned", {"unit": new_unit})
             return new_unit
 
@@ -407,6 +490,9 @@ class Game:
         new_unit.attack_power *= faction.attack_mod * level_scale
         new_unit.speed *= faction.speed_mod  # Speed doesn’t scale with level
         self.enemy_units.append(new_unit)
+        self.spatial_index.insert(new_unit)
+        if self.combat_core is not None:
+            self.combat_core.add(new_unit)
 
     def spawn_bandit_king(self):
         if self.bandit_king is None and not self.show_bandit_intro:
@@ -416,6 +502,7 @@ class Game:
             king_class = Bandit_King
             self.enemy_units.append(king_class(self.level.faction, self.enemy_base.x + 50))
             self.bandit_king = self.enemy_units[-1]
+            self.spatial_index.insert(self.bandit_king)
             self.bandit_king.finished_moving = False
             self.enemy_spawns_stopped = True
             self.surrender_triggered = False
@@ -426,6 +513,7 @@ class Game:
             razor_unit = Bandit_Razor(self.enemy_faction, 1920 - 100)
             razor_unit.speed = 3
             self.enemy_units.append(razor_unit)
+            self.spatial_index.insert(razor_unit)
             print(f"Spawned Bandit Razor at x={razor_unit.x} with speed={razor_unit.speed}")
             target_x = self.bandit_king.x - 50 if self.bandit_king else 1200
             self.cart = CartUnit(2000, 880 - 150, target_x)
@@ -494,19 +582,20 @@ class Game:
                 "Zombie_Melee": 10, "Zombie_Archer": 15, "Zombie_Tank": 25, "Zombie_Assassin": 20,
                 "Bandit_King": 100}.get(unit.name, 10)
 
-    def get_buckets(self, units):
-        buckets = {}
-        for unit in units:
-            if unit.state != "die" and -192 <= unit.x <= 1920:
-                bucket_x = max(0, min(int(unit.x // self.BUCKET_SIZE), 1920 // self.BUCKET_SIZE))
-                buckets.setdefault(bucket_x, []).append(unit)
-        return buckets
-
     def is_paused_by_event(self):
         return (self.show_intro or self.show_end_story or self.show_bandit_intro or 
                 self.show_surrender_part_two or self.show_king_threat or self.show_bandit_surrender or self.show_tank_rescue)
 
+    def snapshot_positions(self):
+        """Remember where units and projectiles were before this tick, so frames drawn between ticks can interpolate."""
+        for unit in self.units + self.enemy_units:
+            unit.prev_x = unit.x
+        for arrow in self.arrows:
+            arrow.prev_x, arrow.prev_y = arrow.x, arrow.y
+
     def update(self):
+        """Advance the battle by one fixed simulation tick."""
+        self.snapshot_positions()
         if self.game_over:
             self.fade_alpha = min(self.fade_alpha + self.fade_speed, 255)
             if self.won:
@@ -515,19 +604,34 @@ class Game:
                     self.rocket_frame = 0
             return True
 
+        # Stream the level's factions in while the intro is up, then load whatever is left before the battle
+        if self.show_intro:
+            FactionPreloader.step()
+        else:
+            FactionPreloader.finish()
+
         if self.menu_open or self.is_paused_by_event():
             return True
 
+        SimClock.advance()
         self.seeds += self.passive_income
         if self.frame_count % 60 == 0:
             self.frame_count = 0
+        # Scripted sequences move units by hand, so the core hands them back to the object simulation for good
+        if self.combat_core is not None and (self.bandit_king or self.cart or self.king_moving or self.units_moving_back):
+            self.combat_core.release(self.player_base, self.enemy_base)
+            self.combat_core = None
         all_units = self.units + self.enemy_units
-        buckets = self.get_buckets(all_units)
+        index = self.spatial_index
+        if self.combat_core is None:
+            index.refresh_targets(self.player_towers + self.enemy_towers + all_units, self.player_base, self.enemy_base)
+        else:
+            index.refresh_targets(self.player_towers + self.enemy_towers, self.player_base, self.enemy_base)
         self.event_handler.update()
         
         for tower in self.player_towers + self.enemy_towers:
             if not self.game_over and not self.is_paused_by_event():
-                tower.move(all_units, self.enemy_base, self.player_base, buckets, self.BUCKET_SIZE)
+                tower.move(all_units, self.enemy_base, self.player_base, index)
                 arrow = tower.update()  # Capture the arrow
                 if arrow:
                     self.arrows.append(arrow)
@@ -570,48 +674,68 @@ class Game:
             if not self.game_over and not self.is_paused_by_event():
                 tower.update()  # Update tower animations
 
-        for unit in self.units[:]:
-            if (self.cart and (self.cart.moving or self.show_surrender_part_two) or 
-                self.king_moving or 
-                (self.bandit_king and not self.bandit_king.finished_moving and all_units_finished)):
-                unit.is_attacking = False
-                unit.attack_target = None
-                unit.update_animation()
-            elif self.units_moving_back:
-                unit.is_attacking = False
-                unit.attack_target = None
-                unit.update_animation()
-            else:
-                arrow = unit.update_animation()
-                if arrow:
-                    self.arrows.append(arrow)
-                unit.move(all_units, self.enemy_base, self.player_base, buckets, self.BUCKET_SIZE)
-                if unit.x >= 1920 - 120:
-                    unit.x = 1920 - 120
-                    unit.state = "idle"
-                nearest_target = find_closest_target(unit, buckets, self.BUCKET_SIZE, self.enemy_base)
-                if nearest_target and unit.state != "attack":
-                    unit.attack(nearest_target)
-        self.units[:] = [unit for unit in self.units if not (unit.state == "die" and unit.frame >= len(unit.animations["die"]) - 1)]
-
-        for enemy in self.enemy_units[:]:
-            if ((self.cart and (self.cart.moving or self.show_surrender_part_two) or 
-                 self.king_moving or self.units_moving_back or 
-                 (self.bandit_king and not self.bandit_king.finished_moving and all_units_finished)) and 
-                not isinstance(enemy, Bandit_Razor)):
-                if enemy == self.bandit_king and not self.king_moving and self.units_moving_back:
-                    enemy.state = "idle"
-                enemy.is_attacking = False
-                enemy.attack_target = None
-                enemy.update_animation()
-            else:
-                arrow = enemy.update_animation()
-                if arrow:
-                    self.arrows.append(arrow)
-                enemy.move(all_units, self.enemy_base, self.player_base, buckets, self.BUCKET_SIZE)
-                nearest_target = find_closest_target(enemy, buckets, self.BUCKET_SIZE, self.player_base)
-                if nearest_target and enemy.state != "attack":
-                    enemy.attack(nearest_target)
+        if self.combat_core is not None:
+            projectiles, moved = self.combat_core.step(SimClock.now(), self.player_base, self.enemy_base)
+            self.arrows.extend(projectiles)
+            for unit in moved:
+                self.spatial_index.update(unit)
+        else:
+            for unit in self.units[:]:
+                if (self.cart and (self.cart.moving or self.show_surrender_part_two) or 
+                    self.king_moving or 
+                    (self.bandit_king and not self.bandit_king.finished_moving and all_units_finished)):
+                    unit.is_attacking = False
+                    unit.attack_target = None
+                    unit.update_animation()
+                elif self.units_moving_back:
+                    unit.is_attacking = False
+                    unit.attack_target = None
+                    unit.update_animation()
+                else:
+                    arrow = unit.update_animation()
+                    if arrow:
+                        self.arrows.append(arrow)
+                    moved_from = unit.x
+                    unit.move(all_units, self.enemy_base, self.player_base, index)
+                    if unit.x >= 1920 - 120:
+                        unit.x = 1920 - 120
+                        unit.state = "idle"
+                    self.spatial_index.update(unit)
+                    if unit.x != moved_from:  # Re-target from where it stopped so it can attack this tick
+                        index.targets[unit] = find_closest_target(unit, index, self.enemy_base)
+                    nearest_target = index.target_of(unit, self.enemy_base)
+                    if nearest_target and unit.state != "attack":
+                        unit.attack(nearest_target)
+        dead_units = [unit for unit in self.units if unit.state == "die" and unit.frame >= len(unit.animations["die"]) - 1]
+        for unit in dead_units:
+            self.spatial_index.remove(unit)
+            if self.combat_core is not None:
+                self.combat_core.remove(unit)
+        self.units[:] = [unit for unit in self.units if unit not in dead_units]
+
+        if self.combat_core is None:
+            for enemy in self.enemy_units[:]:
+                if ((self.cart and (self.cart.moving or self.show_surrender_part_two) or 
+                     self.king_moving or self.units_moving_back or 
+                     (self.bandit_king and not self.bandit_king.finished_moving and all_units_finished)) and 
+                    not isinstance(enemy, Bandit_Razor)):
+                    if enemy == self.bandit_king and not self.king_moving and self.units_moving_back:
+                        enemy.state = "idle"
+                    enemy.is_attacking = False
+                    enemy.attack_target = None
+                    enemy.update_animation()
+                else:
+                    arrow = enemy.update_animation()
+                    if arrow:
+                        self.arrows.append(arrow)
+                    moved_from = enemy.x
+                    enemy.move(all_units, self.enemy_base, self.player_base, index)
+                    self.spatial_index.update(enemy)
+                    if enemy.x != moved_from:  # Re-target from where it stopped so it can attack this tick
+                        index.targets[enemy] = find_closest_target(enemy, index, self.player_base)
+                    nearest_target = index.target_of(enemy, self.player_base)
+                    if nearest_target and enemy.state != "attack":
+                        enemy.attack(nearest_target)
 
         dead_enemies = [enemy for enemy in self.enemy_units if enemy.state == "die" and enemy.frame >= len(enemy.animations["die"]) - 1]
         for enemy in dead_enemies:
@@ -627,19 +751,19 @@ class Game:
             seeds_gained = self.get_seed_reward(enemy)
             self.seeds += seeds_gained
             self.xp += self.get_xp_reward(enemy)
-            for _ in range(seeds_gained):
-                seed_drop = SeedDrop(enemy.x, enemy.y, 1)
-                self.seed_drops.append(SeedDrop(enemy.x, enemy.y, 1))
+            self.seed_drops.spawn(enemy.x, enemy.y, seeds_gained)
             self.main_menu.achievements.check_achievements("unit_killed", {"unit": enemy, "killer": "Player"})
             self.main_menu.achievements.check_achievements("seeds_collected", {"seeds": seeds_gained})
+        for enemy in dead_enemies:
+            self.spatial_index.remove(enemy)
+            if self.combat_core is not None:
+                self.combat_core.remove(enemy)
         self.enemy_units[:] = [enemy for enemy in self.enemy_units if enemy not in dead_enemies]
 
-        self.seed_drops[:] = [drop for drop in self.seed_drops if not drop.is_expired()]
-        for drop in self.seed_drops:
-            drop.update()
+        self.seed_drops.update()
         self.arrows[:] = [arrow for arrow in self.arrows if not arrow.update(all_units)]
 
-        now = pygame.time.get_ticks()
+        now = SimClock.now()
         if not self.enemy_spawns_stopped and now - self.last_enemy_spawn >= 10000:
             self.spawn_enemy_unit()
             self.last_enemy_spawn = now
@@ -702,8 +826,11 @@ class Game:
 
     async def run(self):
         running = True
+        accumulator = SimClock.step_ms  # Run one tick before the first frame
+        self.clock.tick()
         while running:
             for event in pygame.event.get():
+                Display.map_event(event)
                 if event.type == pygame.QUIT:
                     running = False
                     self.main_menu.save_player_data()
@@ -714,18 +841,72 @@ class Game:
                     self.main_menu.show_levels = False
                     self.main_menu.save_player_data()
             
-            if not self.update():
-                running = False
-                self.main_menu.active = True
-                self.main_menu.show_levels = False
-            
+            # Run however many fixed simulation ticks the last frame took, then draw in between the last two
+            accumulator += self.clock.tick(self.frame_rate)
+            ticks = 0
+            while running and accumulator >= SimClock.step_ms:
+                if not self.update():
+                    running = False
+                    self.main_menu.active = True
+                    self.main_menu.show_levels = False
+                accumulator -= SimClock.step_ms
+                ticks += 1
+                if ticks >= SimClock.max_catch_up:
+                    accumulator = 0  # Too far behind to catch up; slow down rather than stall drawing
+            SimClock.alpha = min(accumulator / SimClock.step_ms, 1.0)
+
             self.draw(self.screen)
-            self.clock.tick(30)
-            pygame.display.flip()
+            self.present()
             await asyncio.sleep(0)
         
         return "menu"
 
+    def present(self):
+        if self.renderer:
+            self.mark_dirty_regions()
+            self.renderer.present()
+        else:
+            Display.flip()
+
+    def mark_dirty_regions(self):
+        """Tell the renderer which parts of the frame just drawn can differ from the last one."""
+        renderer = self.renderer
+        if self.game_over or self.menu_open or self.is_paused_by_event():
+            renderer.mark_all()
+            return
+
+        for unit in self.units + self.enemy_units + self.player_towers + self.enemy_towers:
+            renderer.mark("units", unit.get_draw_rect())
+        if self.imprisoned_tank:
+            renderer.mark("units", self.imprisoned_tank.get_draw_rect())
+        if self.cart:
+            renderer.mark("units", self.cart.sprite.get_rect(topleft=(self.cart.x, self.cart.y)))
+        for arrow in self.arrows:
+            if arrow.active:
+                renderer.mark("projectiles", arrow.get_draw_rect())
+        for rect in self.seed_drops.get_rects():
+            renderer.mark("seed_drops", rect)
+
+        base_state = (self.player_base.health, self.player_base.sprite, self.enemy_base.health, self.enemy_base.sprite)
+        if base_state != self.last_base_state:
+            self.last_base_state = base_state
+            for base in (self.player_base, self.enemy_base):
+                health_bar_x = base.x + (base.sprite.get_width() - base.health_bar.width) // 2
+                bar_rect = pygame.Rect(health_bar_x, base.y - 50, base.health_bar.width, 50)
+                renderer.mark("bases", bar_rect.union(base.sprite.get_rect(topleft=(base.x, base.y))))
+
+        hud_state = (int(self.seeds), int(self.xp), self.max_xp)
+        if hud_state != self.last_hud_state:
+            self.last_hud_state = hud_state
+            renderer.mark("hud", (0, 0, 400, 50))  # Seeds counter
+            renderer.mark("hud", (1920 // 2 - 150, 60, 300, 70))  # XP bar
+        panel_state = self.ui.get_panel_state()
+        if panel_state != self.last_panel_state:
+            self.last_panel_state = panel_state
+            renderer.mark("hud", (0, 860, 1920, 220))
+        if self.main_menu.achievements.popup_queue:
+            renderer.mark("dialogs", (0, 40, 1920, 90))
+
     def handle_event(self, event):
         if event.type == pygame.MOUSEBUTTONDOWN:
             if event.button == 1:
@@ -772,107 +953,95 @@ class Game:
                             self.apply_upgrade(self.selected_unit, upgrade)
         return None
 
+    def update_static_layer(self):
+        """Refresh the cached battlefield layer if a base sprite, tower or the prison changed."""
+        below = [(self.player_base.sprite, (self.player_base.x, self.player_base.y)),
+                 (self.enemy_base.sprite, (self.enemy_base.x, self.enemy_base.y))]
+        above = [(self.player_base_2.sprite, (self.player_base_2.x, self.player_base_2.y)),
+                 (self.enemy_base_2.sprite, (self.enemy_base_2.x, self.enemy_base_2.y))]
+        if self.prison:
+            above.append((self.prison.sprite, (self.prison.x, self.prison.y)))
+        towers = [pygame.Rect(tower.x, tower.y, int(192 * tower.scale_factor), int(192 * tower.scale_factor))
+                  for tower in self.player_towers + self.enemy_towers]
+        if self.static_layer.update(below, above, towers) and self.renderer:
+            self.renderer.mark_all()
+
     def draw(self, screen):
-        screen.blit(self.static_surface, (0, 0))
-        self.player_base.draw(screen)
-        self.enemy_base.draw(screen)
+        self.update_static_layer()
+        self.static_layer.draw(screen)
+        self.player_base.draw_health_bar(screen)
+        self.enemy_base.draw_health_bar(screen)
+        queue = self.render_queue
         for tower in self.player_towers + self.enemy_towers:
-            tower.draw(screen)   
-        self.player_base_2.draw(screen)
-        self.enemy_base_2.draw(screen)
-            
-        if self.prison:
-            print(f"Drawing prison at ({self.prison.x}, {self.prison.y})")
-            self.prison.draw(screen)
+            queue.extend("towers", tower.get_blits())
+        queue.submit(screen)
+        self.static_layer.draw_front(screen)
+
         if self.imprisoned_tank:
             print(f"Drawing Player_TankUnit at ({self.imprisoned_tank.x}, {self.imprisoned_tank.y})")
-            # Draw only the sprite without health bar, flipped horizontally
-            current_animation = self.imprisoned_tank.animations[self.imprisoned_tank.state]
+            # Draw only the sprite without health bar, facing left
+            current_animation = self.imprisoned_tank.get_animations(True)[self.imprisoned_tank.state]
             frame = current_animation[int(self.imprisoned_tank.frame) % len(current_animation)]
-            flipped_frame = pygame.transform.flip(frame, True, False)  # Flip horizontally (True), not vertically (False)
-            screen.blit(flipped_frame, (self.imprisoned_tank.x, self.imprisoned_tank.y))
+            screen.blit(frame, (self.imprisoned_tank.x, self.imprisoned_tank.y))
         if self.prison_bars:
             print(f"Drawing prison bars at ({self.prison_bars.x}, {self.prison_bars.y})")
             self.prison_bars.draw(screen)
         for unit in self.units + self.enemy_units:
-            if -192 <= unit.x <= 1920 and not hasattr(unit, 'is_tower'):  # Exclude towers
-                unit.draw(screen)
-                if unit == self.selected_unit:
-                    pygame.draw.rect(screen, (255, 255, 0), unit.get_rect(), 2)
-        for drop in self.seed_drops:
-            drop.draw(screen)
-        for arrow in self.arrows:
-            arrow.draw(screen)
+            if -192 <= unit.x <= 1920 and not unit.is_tower:  # Exclude towers
+                queue.extend("units", unit.get_blits())
+        queue.extend("seed_drops", self.seed_drops.get_blits())
+        queue.extend("projectiles", [(arrow.rotated_sprite, arrow.get_draw_rect()) for arrow in self.arrows if arrow.active])
         if self.cart:
-            self.cart.draw(screen)
-        try:
-            FONT_CTA = pygame.font.Font("assets/fonts/OpenSans-Bold.ttf", 28)
-            FONT_BODY = pygame.font.Font("assets/fonts/OpenSans-Regular.ttf", 24)
-        except Exception as e:
-            print(f"Failed to load fonts in Game: {e}")
-            FONT_CTA = pygame.font.SysFont("Open Sans", 28, bold=True)
-            FONT_BODY = pygame.font.SysFont("Open Sans", 24)
+            queue.add("cart", self.cart.sprite, (self.cart.x, self.cart.y))
+        queue.submit(screen)
+        if self.selected_unit and -192 <= self.selected_unit.x <= 1920:
+            draw_rect(screen, (255, 255, 0), self.selected_unit.get_rect(), 2)
+        FONT_CTA = Fonts.get(28, bold=True)
+        FONT_BODY = Fonts.get(24)
         
         self.ui.draw(screen)
 
         if self.game_over:
-            end_screen = pygame.Surface((1920, 1080), pygame.SRCALPHA)
-            if self.won:
-                end_screen.blit(self.victory_background, (0, 0))
-            else:
-                end_screen.blit(self.defeat_background, (0, 0))
-            
-            title_y = 880 // 2 - self.ui_title.get_height() // 2 - 50
-            storyteller_x = 1920 // 2 - self.storyteller_happy.get_width() // 2
-            storyteller_y = title_y - self.storyteller_happy.get_height() - 10
-            if self.won:
-                end_screen.blit(self.storyteller_happy, (storyteller_x, storyteller_y))
+            end_layer = self.end_layers.get(self.won)
+            if end_layer is None:
+                end_layer = self.end_layers[self.won] = self.render_end_layer(FONT_CTA, FONT_BODY)
+            if self.fade_alpha >= 255:
+                end_screen = screen  # Fully faded in, so compose straight onto the screen
             else:
-                end_screen.blit(self.storyteller_angry, (storyteller_x, storyteller_y))
-
-            result_text = FONT_CTA.render("Victory" if self.won else "Defeat", True, (255, 255, 255))
-            title_x = 1920 // 2 - self.ui_title.get_width() // 2
-            end_screen.blit(self.ui_title, (title_x, title_y))
-            text_x = 1920 // 2 - result_text.get_width() // 2
-            text_y = 880 // 2 - result_text.get_height() // 2 - 50
-            end_screen.blit(result_text, (text_x, text_y))
-
-            return_bg = pygame.transform.scale(self.ui_text_bg, (self.return_button.width, self.return_button.height))
-            end_screen.blit(return_bg, (self.return_button.x, self.return_button.y))
-            return_text = FONT_BODY.render("Return to Menu", True, (249, 249, 242))
-            button_text_x = self.return_button.x + (self.return_button.width - return_text.get_width()) // 2
-            button_text_y = self.return_button.y + (self.return_button.height - return_text.get_height()) // 2
-            end_screen.blit(return_text, (button_text_x, button_text_y))
+                if self.end_frame is None:
+                    self.end_frame = Display.create_surface((1920, 1080), pygame.SRCALPHA)
+                end_screen = self.end_frame
+            end_screen.blit(end_layer, (0, 0))
 
             if self.won:
                 current_frame = int(self.rocket_frame) % len(self.rocket_frames)
                 for pos_x, pos_y in self.rocket_positions:
                     end_screen.blit(self.rocket_frames[current_frame], (pos_x, pos_y))
 
-            end_screen.set_alpha(self.fade_alpha)
-            screen.blit(end_screen, (0, 0))
+            if end_screen is not screen:
+                end_screen.set_alpha(self.fade_alpha)
+                screen.blit(end_screen, (0, 0))
         elif not self.show_intro and not self.show_end_story and not self.show_bandit_intro and not self.show_surrender_part_two and not self.show_king_threat:
-            menu_bg = pygame.transform.scale(self.menu_button_bg, (self.menu_button.width, self.menu_button.height))
-            screen.blit(menu_bg, (self.menu_button.x, self.menu_button.y))
+            screen.blit(self.menu_button_image, (self.menu_button.x, self.menu_button.y))
             menu_text = FONT_CTA.render("Menu", True, (249, 249, 242))
             screen.blit(menu_text, (self.menu_button.x + (self.menu_button.width - menu_text.get_width()) // 2, self.menu_button.y + (self.menu_button.height - menu_text.get_height()) // 2))
 
             if self.menu_open:
                 for option, rect in self.menu_options.items():
-                    pygame.draw.rect(screen, (128, 131, 134), rect)
+                    draw_rect(screen, (128, 131, 134), rect)
                     text = FONT_BODY.render(option, True, (249, 249, 242))
                     screen.blit(text, (rect.x + 10, rect.y + 10))
                 
                 if self.show_options_submenu:
                     options_window_rect = pygame.Rect(1920 // 2 - 150, 1080 // 2 - 100, 300, 200)
-                    pygame.draw.rect(screen, (14, 39, 59), options_window_rect)
-                    pygame.draw.rect(screen, (147, 208, 207), options_window_rect, 2)
+                    draw_rect(screen, (14, 39, 59), options_window_rect)
+                    draw_rect(screen, (147, 208, 207), options_window_rect, 2)
                     for option, rect in self.options_submenu_buttons.items():
-                        pygame.draw.rect(screen, (128, 131, 134), rect)
+                        draw_rect(screen, (128, 131, 134), rect)
                         text = FONT_BODY.render(option, True, (249, 249, 242))
                         screen.blit(text, (rect.x + 10, rect.y + 10))
-                    pygame.draw.rect(screen, (128, 131, 134), self.volume_slider)
-                    pygame.draw.rect(screen, (147, 208, 207), self.volume_handle)
+                    draw_rect(screen, (128, 131, 134), self.volume_slider)
+                    draw_rect(screen, (147, 208, 207), self.volume_handle)
                     volume_text = FONT_BODY.render(f"Volume: {int(self.volume * 100)}%", True, (249, 249, 242))
                     screen.blit(volume_text, (1920 // 2 - volume_text.get_width() // 2, 1080 // 2 - 80))
 
@@ -884,8 +1053,8 @@ class Game:
             xp_ratio = min(self.xp / self.max_xp, 1.0)
             xp_fill_width = xp_bar_width * xp_ratio
             xp_bar_rect = pygame.Rect(1920 // 2 - xp_bar_width // 2, 100, xp_bar_width, xp_bar_height)
-            pygame.draw.rect(screen, (128, 131, 134), xp_bar_rect)
-            pygame.draw.rect(screen, (0, 255, 255), (xp_bar_rect.x, xp_bar_rect.y, xp_fill_width, xp_bar_height))
+            draw_rect(screen, (128, 131, 134), xp_bar_rect)
+            draw_rect(screen, (0, 255, 255), (xp_bar_rect.x, xp_bar_rect.y, xp_fill_width, xp_bar_height))
             xp_text = FONT_BODY.render(f"XP: {int(self.xp)}/{int(self.max_xp)}", True, (249, 249, 242))
             screen.blit(xp_text, (xp_bar_rect.x + xp_bar_width // 2 - xp_text.get_width() // 2, xp_bar_rect.y - 30))
         
@@ -0,0 +1,28 @@
+import os
+import pygame
+
+class Headless:
+    """Battle simulation with no window, no audio and no decoded art.
+
+    enable() has to run before anything loads assets. It puts SDL on its dummy
+    video and audio drivers and opens a 1x1 display so convert() keeps working.
+    While enabled, load_image() hands out placeholders the size of the real art
+    (read from the PNG header), so unit rects match a normal game. Unit and
+    projectile sprites also keep their real alpha shape through ShapeCache, so
+    hit masks match too. SoundBank returns no sounds and player data is never
+    saved.
+    """
+    enabled = False
+
+    @classmethod
+    def enable(cls):
+        if cls.enabled:
+            return
+        os.environ["SDL_VIDEODRIVER"] = "dummy"
+        os.environ["SDL_AUDIODRIVER"] = "dummy"
+        # Leave SIGINT/SIGTERM alone so scripts and process pools can stop a headless run
+        os.environ["SDL_NO_SIGNAL_HANDLERS"] = "1"
+        pygame.display.init()
+        pygame.font.init()
+        pygame.display.set_mode((1, 1))
+        cls.enabled = True
@@ -0,0 +1,47 @@
+import pygame
+
+class HealthBar:
+    """Health bar and "hp/max" label composited into one surface per entity.
+
+    The surface is rebuilt only when the health or max health it was drawn
+    for changes, so an entity whose health is steady costs a single blit.
+    """
+    def __init__(self, width, height, fill_color, back_color, font, label_gap, border_color=None):
+        self.width = width
+        self.height = height
+        self.fill_color = fill_color
+        self.back_color = back_color
+        self.border_color = border_color
+        self.font = font
+        self.label_gap = label_gap  # Distance from the top of the label to the top of the bar
+        self.surface = None
+        self.offset = (0, 0)
+        self.drawn_for = None
+
+    def get_blit(self, x, y, health, max_health):
+        """(surface, position) that draws the bar with its top-left corner at (x, y)."""
+        if self.drawn_for != (health, max_health):
+            self.render(health, max_health)
+            self.drawn_for = (health, max_health)
+        return self.surface, (x + self.offset[0], y + self.offset[1])
+
+    def draw(self, screen, x, y, health, max_health):
+        screen.blit(*self.get_blit(x, y, health, max_health))
+
+    def render(self, health, max_health):
+        label = self.font.render(f"{int(health)}/{int(max_health)}", True, (255, 255, 255))
+        label_x = (self.width - label.get_width()) // 2
+        left = min(0, label_x)
+        top = -self.label_gap
+        right = max(self.width, label_x + label.get_width())
+        bottom = max(self.height, top + label.get_height())
+
+        self.surface = pygame.Surface((right - left, bottom - top), pygame.SRCALPHA)
+        bar = pygame.Rect(-left, -top, self.width, self.height)
+        health_ratio = max(0, health / max_health)
+        pygame.draw.rect(self.surface, self.back_color, bar)
+        pygame.draw.rect(self.surface, self.fill_color, (bar.x, bar.y, self.width * health_ratio, self.height))
+        if self.border_color:
+            pygame.draw.rect(self.surface, self.border_color, bar, 1)
+        self.surface.blit(label, (bar.x + label_x, 0))
+        self.offset = (left, top)
@@ -2,13 +2,14 @@ import asyncio
 import pygame
 from menu import MainMenu
 from game_logic import Game
-from units import preload_all_animations
+from units import FactionPreloader
+from renderer import Display
 
 async def main():
     pygame.init()
     pygame.font.init()
     pygame.mixer.init()
-    screen = pygame.display.set_mode((1920, 1080), pygame.SRCALPHA)
+    Display.set_scale(1.0)
     pygame.display.set_caption("Rise of Superseed")
     clock = pygame.time.Clock()
 
@@ -18,17 +19,21 @@ async def main():
     except Exception as e:
         print(f"Failed to load Menu.ogg: {e}")
 
-    preload_all_animations()
-    main_menu = MainMenu(screen, clock)
+    FactionPreloader.preload("Player")  # Enemy factions load when their level starts
+    main_menu = MainMenu(Display.surface, clock)
+    if main_menu.render_scale != Display.scale:
+        Display.set_scale(main_menu.render_scale)
     running = True
     game = None
     music_started = False
 
     while running:
+        frame_changed = True
         if main_menu.active:
             main_menu.update()
-            main_menu.draw(screen)
+            frame_changed = main_menu.draw(Display.surface)
             for event in pygame.event.get():
+                Display.map_event(event)
                 if event.type == pygame.QUIT:
                     running = False
                 elif event.type == pygame.MOUSEBUTTONDOWN:
@@ -42,9 +47,10 @@ async def main():
                     print(f"MainMenu handle_event returned: {result}")
                     if isinstance(result, int):
                         print(f"Starting game with level {result}")
-                        game = Game(result, main_menu, screen, clock)
+                        game = Game(result, main_menu, Display.surface, clock)
                         await game.run()
                         main_menu.active = True
+                        main_menu.invalidate()
                         game = None
                     elif result == "exit":
                         running = False
@@ -52,6 +58,7 @@ async def main():
                     main_menu.handle_event(event)
         else:
             for event in pygame.event.get():
+                Display.map_event(event)
                 if event.type == pygame.QUIT:
                     running = False
                 elif event.type == pygame.MOUSEBUTTONDOWN and game:
@@ -59,9 +66,10 @@ async def main():
 
             if game:
                 game.update()
-                game.draw(screen)
+                game.draw(Display.surface)
 
-        pygame.display.flip()
+        if frame_changed:
+            Display.flip()
         clock.tick(60)
         await asyncio.sleep(0)
 
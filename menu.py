@@ -6,6 +6,11 @@ from buildings import Base
 from units import Player_PeasantUnit, Player_SpearmanUnit, Player_ArcherUnit, Player_WarriorUnit, Player_TankUnit, PlayerTowerArcher
 from game_logic import Game
 from achievements import Achievements
+from sounds import SoundBank
+from asset_bake import load_image, load_scaled
+from headless import Headless
+from fonts import Fonts
+from renderer import Display, draw_rect
 
 # Detect Pygbag environment
 IS_Pygbag = hasattr(sys, 'platform') and ('emscripten' in sys.platform.lower() or 'javascript' in sys.platform.lower())
@@ -23,6 +28,7 @@ class MainMenu:
         self.clock = clock
         self.active = True
         self.achievements = Achievements()
+        self.render_scale = 1.0  # Overwritten by load_player_data when a save has one
         self.superseeds, self.max_level, self.unit_upgrades, self.base_upgrades, self.volume, _, self.unit_types = self.load_player_data()
         print(f"Initialized self.max_level: {self.max_level}")  # Debug print
             
@@ -30,13 +36,11 @@ class MainMenu:
         self.show_tutorial = self.max_level <= 1  # Show tutorial for new players
         self.tutorial_index = 0 if self.show_tutorial else -1  # Start at step 0
         try:
-            slide_1 = pygame.image.load("assets/tutorial/slide_1.png").convert_alpha()
-            slide_2 = pygame.image.load("assets/tutorial/slide_2.png").convert_alpha()
-            self.right_arrow = pygame.image.load("assets/tutorial/RightArrow.png").convert_alpha()
-            self.left_arrow = pygame.image.load("assets/tutorial/LeftArrow.png").convert_alpha()
+            slide_1 = load_scaled("assets/tutorial/slide_1.png", (1920, 1080))
+            slide_2 = load_scaled("assets/tutorial/slide_2.png", (1920, 1080))
+            self.right_arrow = load_image("assets/tutorial/RightArrow.png")
+            self.left_arrow = load_image("assets/tutorial/LeftArrow.png")
             # Scale images (adjust as needed)
-            slide_1 = pygame.transform.scale(slide_1, (1920, 1080))
-            slide_2 = pygame.transform.scale(slide_2, (1920, 1080))
             self.right_arrow = pygame.transform.scale(self.right_arrow, (70, 100))
             self.left_arrow = pygame.transform.scale(self.left_arrow, (70, 100))
         except Exception as e:
@@ -111,7 +115,7 @@ class MainMenu:
         
         try:            
             # Load player_base sprite for Base button
-            base_sprite = pygame.image.load("assets/buildings/Player/player_base.png").convert_alpha()
+            base_sprite = load_image("assets/buildings/Player/player_base.png")
             self.base_sprite = pygame.transform.scale(base_sprite, (int(base_sprite.get_width() * 0.15), int(base_sprite.get_height() * 0.15)))
         except Exception as e:
             print(f"Failed to load sprites: {e}")
@@ -141,10 +145,12 @@ class MainMenu:
         self.refresh_unit_buttons()
         
         self.scroll_y = 0
+        self.view_cache = Display.create_surface((1920, 1080)).convert()
+        self.view_dirty = True
+        self.popup_was_showing = False
         
         try:
-            self.background = pygame.image.load("assets/backgrounds/menu_background.png").convert()
-            self.background = pygame.transform.scale(self.background, (1920, 1080))
+            self.background = load_scaled("assets/backgrounds/menu_background.png", (1920, 1080), alpha=False)
         except Exception as e:
             print(f"Failed to load menu background: {e}")
             self.background = pygame.Surface((1920, 1080))
@@ -171,6 +177,7 @@ class MainMenu:
             "Units": pygame.Rect(start_x + 150, 100, 140, 70)
         }
         self.options_buttons = {
+            "Render Scale": pygame.Rect(1920 // 2 - 200, 480, 400, 80),
             "Back": pygame.Rect(1920 // 2 - 200, 600, 400, 80)
         }
         self.back_button = pygame.Rect(1920 - 250, 1080 - 120, 200, 80)
@@ -179,7 +186,8 @@ class MainMenu:
         self.volume_slider = pygame.Rect(1920 // 2 - 150, 400, 300, 20)
         self.volume_handle = pygame.Rect(1920 // 2 + 140, 395, 20, 30)  # Initial at 100%
         self.volume = self.volume if self.volume is not None else 1.0  # Load saved or default to 1.0
-        pygame.mixer.music.set_volume(self.volume * 0.5)  # Real volume: 0.0 to 0.5
+        if pygame.mixer.get_init():
+            pygame.mixer.music.set_volume(self.volume * 0.5)  # Real volume: 0.0 to 0.5
         
         default_upgrades = {
             "Peasant": {
@@ -247,16 +255,14 @@ class MainMenu:
         self.next_button = pygame.Rect(1920 // 2 + 150, 1080 - 180, 150, 80)
         
         self.scale_factor = 1.0
+        self.click_sound = SoundBank.get("assets/sounds/UI/button_click.ogg")
+        self.back_sound = SoundBank.get("assets/sounds/UI/button_back.ogg")
         try:
-            self.click_sound = pygame.mixer.Sound("assets/sounds/UI/button_click.ogg")
-            self.back_sound = pygame.mixer.Sound("assets/sounds/UI/button_back.ogg")
-            self.button_bg = pygame.image.load("assets/ui/ui_buttons.png").convert_alpha()
-            self.unit_button_bg = pygame.image.load("assets/ui/ui_buybuttons.png").convert_alpha()
-            self.text_bg = pygame.image.load("assets/ui/ui_text.png").convert_alpha()
+            self.button_bg = load_image("assets/ui/ui_buttons.png")
+            self.unit_button_bg = load_image("assets/ui/ui_buybuttons.png")
+            self.text_bg = load_image("assets/ui/ui_text.png")
         except Exception as e:
             print(f"Failed to load menu assets: {e}")
-            self.click_sound = None
-            self.back_sound = None
             self.button_bg = pygame.Surface((100, 30))
             self.button_bg.fill((147, 208, 207))
             self.unit_button_bg = pygame.Surface((150, 150))
@@ -266,19 +272,22 @@ class MainMenu:
         
         # Load menu.png for top left corner
         try:
-            self.menu_icon = pygame.image.load("assets/images/menu.png").convert_alpha()
+            self.menu_icon = load_image("assets/images/menu.png")
         except Exception as e:
             print(f"Failed to load menu.png: {e}")
             self.menu_icon = pygame.Surface((50, 50))  # Fallback placeholder
             self.menu_icon.fill((255, 0, 0))  # Red to indicate error
 
     def save_player_data(self):
+        if Headless.enabled:
+            return  # Simulated battles must not touch the player's save
         data = {
             "superseeds": int(round(self.superseeds)),
             "max_level": self.max_level,
             "unit_upgrades": self.unit_upgrades,
             "base_upgrades": self.base_upgrades,
             "volume": round(self.volume, 2),
+            "render_scale": self.render_scale,
             "achievements": {key: {"unlocked": value["unlocked"]} for key, value in self.achievements.achievements.items()},
             "unit_types": [unit_type.__name__ for unit_type in self.unit_types]
         }
@@ -395,6 +404,8 @@ class MainMenu:
         # Process data only if loaded successfully
         superseeds = data.get("superseeds", 100)
         max_level = data.get("max_level", 1)
+        if data.get("render_scale") in Display.scales:
+            self.render_scale = data["render_scale"]
         unit_upgrades = data.get("unit_upgrades", default_unit_upgrades)
         for unit, default_stats in default_unit_upgrades.items():
             if unit not in unit_upgrades:
@@ -476,20 +487,19 @@ class MainMenu:
 
 
     def handle_event(self, event):
+        self.invalidate()  # Any click or scroll may change what the current view shows
         if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
             mouse_x, mouse_y = event.pos
             if self.show_tutorial and self.tutorial_index >= 0:
                 if self.right_arrow_rect.collidepoint(mouse_x, mouse_y):
-                    if self.click_sound:
-                        self.click_sound.play()
+                    SoundBank.play(self.click_sound, SoundBank.PRIORITY_UI)
                     self.tutorial_index += 1
                     if self.tutorial_index >= len(self.tutorial_steps):
                         self.show_tutorial = False
                         self.tutorial_index = -1
                     return None
                 elif self.tutorial_index > 0 and self.left_arrow_rect.collidepoint(mouse_x, mouse_y):
-                    if self.click_sound:
-                        self.click_sound.play()
+                    SoundBank.play(self.click_sound, SoundBank.PRIORITY_UI)
                     self.tutorial_index -= 1
                     return None
                 return None  # Block other interactions during tutorial
@@ -497,8 +507,7 @@ class MainMenu:
             if not self.show_upgrades and not self.show_levels and not self.show_achievements and not self.show_options:
                 for button, rect in self.menu_buttons.items():
                     if rect.collidepoint(mouse_x, mouse_y):
-                        if self.click_sound:
-                            self.click_sound.play()
+                        SoundBank.play(self.click_sound, SoundBank.PRIORITY_UI)
                         if button == "Select Level":
                             self.show_levels = True
                         elif button == "Upgrades":
@@ -518,10 +527,16 @@ class MainMenu:
                 for button, rect in self.options_buttons.items():
                     if rect.collidepoint(mouse_x, mouse_y):
                         sound = self.back_sound if button == "Back" else self.click_sound
-                        if sound:
-                            sound.play()
+                        SoundBank.play(sound, SoundBank.PRIORITY_UI)
                         if button == "Back":
                             self.show_options = False
+                        elif button == "Render Scale":
+                            # Cycle 100% -> 75% -> 50%; lower scales present a smaller frame
+                            self.render_scale = Display.scales[(Display.scales.index(self.render_scale) + 1) % len(Display.scales)]
+                            Display.set_scale(self.render_scale)
+                            self.view_cache = Display.create_surface((1920, 1080)).convert()
+                            self.achievements.page_unlocked = None  # Re-render the achievements page at the new scale
+                            self.save_player_data()
                         return None
                 if self.volume_slider.collidepoint(mouse_x, mouse_y):
                     self.volume_handle.x = max(self.volume_slider.x, min(mouse_x - 10, self.volume_slider.x + self.volume_slider.width - 20))
@@ -534,14 +549,12 @@ class MainMenu:
             
             elif self.show_upgrades:
                 if self.back_button.collidepoint(mouse_x, mouse_y):
-                    if self.back_sound:
-                        self.back_sound.play()
+                    SoundBank.play(self.back_sound, SoundBank.PRIORITY_UI)
                     self.show_upgrades = False
                     return None
                 for category, rect in self.category_buttons.items():
                     if rect.collidepoint(mouse_x, mouse_y):
-                        if self.click_sound:
-                            self.click_sound.play()
+                        SoundBank.play(self.click_sound, SoundBank.PRIORITY_UI)
                         self.current_category = category
                         return None
                 if self.current_category == "Base":
@@ -551,8 +564,7 @@ class MainMenu:
                         print(f"Checking {subcategory} button at rect: {rect}")  # Debug print for button rect
                         if rect.collidepoint(mouse_x, mouse_y):
                             print(f"Clicked {subcategory} button")  # Debug print for click detection
-                            if self.click_sound:
-                                self.click_sound.play()
+                            SoundBank.play(self.click_sound, SoundBank.PRIORITY_UI)
                             self.current_base_subcategory = subcategory
                             print(f"Set current_base_subcategory to: {self.current_base_subcategory}")  # Debug print for subcategory
                             return None
@@ -563,8 +575,7 @@ class MainMenu:
                         for i, (upgrade, data) in enumerate(self.base_upgrades["Base"].items()):
                             rect = pygame.Rect(1920 // 2 - 350, start_y + i * 110, 700, 100)
                             if rect.collidepoint(mouse_x, mouse_y) and self.superseeds >= data["cost"] and data["level"] < 20:
-                                if self.click_sound:
-                                    self.click_sound.play()
+                                SoundBank.play(self.click_sound, SoundBank.PRIORITY_UI)
                                 self.superseeds -= data["cost"]
                                 data["level"] += 1
                                 self.apply_base_upgrade(upgrade)
@@ -580,8 +591,7 @@ class MainMenu:
                         for i, (upgrade, data) in enumerate(self.base_upgrades["Tower"].items()):
                             rect = pygame.Rect(1920 // 2 - 295, start_y + i * 110, 590, 100)
                             if rect.collidepoint(mouse_x, mouse_y) and self.superseeds >= data["cost"] and data["level"] < 20:
-                                if self.click_sound:
-                                    self.click_sound.play()
+                                SoundBank.play(self.click_sound, SoundBank.PRIORITY_UI)
                                 self.superseeds -= data["cost"]
                                 data["level"] += 1
                                 self.apply_base_upgrade(upgrade)
@@ -595,8 +605,7 @@ class MainMenu:
                 elif self.current_category == "Units":
                     for unit_type, button in self.unit_buttons.items():
                         if button["rect"].collidepoint(mouse_x, mouse_y):
-                            if self.click_sound:
-                                self.click_sound.play()
+                            SoundBank.play(self.click_sound, SoundBank.PRIORITY_UI)
                             self.selected_unit_type = unit_type
                             return None
                     unit_name = self.selected_unit_type.__name__.replace("Player_", "").replace("Unit", "")
@@ -604,8 +613,7 @@ class MainMenu:
                     for i, (upgrade, data) in enumerate(self.unit_upgrades[unit_name].items()):
                         rect = pygame.Rect(1920 // 2 - 295, start_y + i * 110, 590, 100)
                         if rect.collidepoint(mouse_x, mouse_y) and self.superseeds >= data["cost"] and data["level"] < 20:
-                            if self.click_sound:
-                                self.click_sound.play()
+                            SoundBank.play(self.click_sound, SoundBank.PRIORITY_UI)
                             self.superseeds -= data["cost"]
                             data["level"] += 1
                             self.save_player_data()
@@ -619,27 +627,23 @@ class MainMenu:
             
             elif self.show_levels:
                 if self.back_button.collidepoint(mouse_x, mouse_y):
-                    if self.back_sound:
-                        self.back_sound.play()
+                    SoundBank.play(self.back_sound, SoundBank.PRIORITY_UI)
                     self.show_levels = False
                     return None
                 if self.prev_button.collidepoint(mouse_x, mouse_y) and self.current_section > 0:
-                    if self.click_sound:
-                        self.click_sound.play()
+                    SoundBank.play(self.click_sound, SoundBank.PRIORITY_UI)
                     self.current_section -= 1
                     return None
                 if self.next_button.collidepoint(mouse_x, mouse_y) and self.current_section < 4:
                     section_start = self.current_section * 5 + 1
                     section_end = min(section_start + 4, 25)
                     if self.max_level >= section_end:
-                        if self.click_sound:
-                            self.click_sound.play()
+                        SoundBank.play(self.click_sound, SoundBank.PRIORITY_UI)
                         self.current_section += 1
                     return None
                 for level, rect in self.level_buttons.items():
                     if rect.collidepoint(mouse_x, mouse_y) and level <= self.max_level:
-                        if self.click_sound:
-                            self.click_sound.play()
+                        SoundBank.play(self.click_sound, SoundBank.PRIORITY_UI)
                         section_start = self.current_section * 5 + 1
                         section_end = section_start + 4
                         if section_start <= level <= section_end:
@@ -649,8 +653,7 @@ class MainMenu:
             
             elif self.show_achievements:
                 if self.back_button.collidepoint(mouse_x, mouse_y):
-                    if self.back_sound:
-                        self.back_sound.play()
+                    SoundBank.play(self.back_sound, SoundBank.PRIORITY_UI)
                     self.show_achievements = False
                     return None
     
@@ -693,18 +696,31 @@ class MainMenu:
                         total_locked += data["cost"] * data["level"]
         return total_locked
         
+    def invalidate(self):
+        self.view_dirty = True
+
     def draw(self, screen):
+        """Blit the cached view, re-rendering it first if it was invalidated.
+
+        Returns False when nothing changed since the last frame, so the caller can skip the flip.
+        """
+        popup_showing = bool(self.achievements.popup_queue)
+        if self.view_dirty:
+            self.render_view(self.view_cache)
+            self.view_dirty = False
+        elif not popup_showing and not self.popup_was_showing:
+            return False
+        screen.blit(self.view_cache, (0, 0))
+        self.achievements.draw_popup(screen)
+        self.popup_was_showing = popup_showing
+        return True
+
+    def render_view(self, screen):
         screen.blit(self.background, (0, 0))
         screen.blit(self.menu_icon, (1400, 75))
-        try:
-            FONT_CTA = pygame.font.Font("assets/fonts/OpenSans-Bold.ttf", 40)
-            FONT_TITLE = pygame.font.Font("assets/fonts/OpenSans-Bold.ttf", 60)  # Larger font for title
-            FONT_BODY = pygame.font.Font("assets/fonts/OpenSans-Regular.ttf", 25)
-        except Exception as e:
-            print(f"Failed to load fonts in MainMenu: {e}")
-            FONT_CTA = pygame.font.SysFont("Open Sans", 40, bold=True)
-            FONT_TITLE = pygame.font.SysFont("Open Sans", 60, bold=True)
-            FONT_BODY = pygame.font.SysFont("Open Sans", 25)
+        FONT_CTA = Fonts.get(40, bold=True)
+        FONT_TITLE = Fonts.get(60, bold=True)  # Larger font for title
+        FONT_BODY = Fonts.get(25)
                         
         
         if not self.show_upgrades and not self.show_levels and not self.show_achievements and not self.show_options:
@@ -720,10 +736,11 @@ class MainMenu:
             for button, rect in self.options_buttons.items():
                 bg = pygame.transform.scale(self.button_bg, (rect.width, rect.height))
                 screen.blit(bg, (rect.x, rect.y))
-                text = FONT_CTA.render(button, True, (249, 249, 242))
+                label = f"Render Scale: {int(self.render_scale * 100)}%" if button == "Render Scale" else button
+                text = FONT_CTA.render(label, True, (249, 249, 242))
                 screen.blit(text, (rect.x + (rect.width - text.get_width()) // 2, rect.y + (rect.height - text.get_height()) // 2))
-            pygame.draw.rect(screen, (128, 131, 134), self.volume_slider)
-            pygame.draw.rect(screen, (147, 208, 207), self.volume_handle)
+            draw_rect(screen, (128, 131, 134), self.volume_slider)
+            draw_rect(screen, (147, 208, 207), self.volume_handle)
             volume_text = FONT_BODY.render(f"Volume: {int(self.volume * 100)}%", True, (249, 249, 242))
             screen.blit(volume_text, (1920 // 2 - volume_text.get_width() // 2, 350))
         
@@ -761,7 +778,7 @@ class MainMenu:
                         screen.blit(greyed, (button["rect"].x, button["rect"].y))
                     screen.blit(button["sprite"], button["sprite_pos"])
                     if subcategory == self.current_base_subcategory:
-                        pygame.draw.rect(screen, (147, 208, 207), button["rect"], 2)
+                        draw_rect(screen, (147, 208, 207), button["rect"], 2)
                 
                 if self.current_base_subcategory == "Base":
                     start_y = 650 - (len(self.base_upgrades["Base"]) * 110) // 2
@@ -806,7 +823,7 @@ class MainMenu:
                         screen.blit(greyed, (button["rect"].x, button["rect"].y))
                     screen.blit(button["sprite"], button["sprite_pos"])
                     if unit_type == self.selected_unit_type:
-                        pygame.draw.rect(screen, (147, 208, 207), button["rect"], 2)
+                        draw_rect(screen, (147, 208, 207), button["rect"], 2)
                 unit_name = self.selected_unit_type.__name__.replace("Player_", "").replace("Unit", "")
                 start_y = 650 - (len(self.unit_upgrades[unit_name]) * 110) // 2
                 for i, (upgrade, data) in enumerate(self.unit_upgrades[unit_name].items()):
@@ -884,7 +901,7 @@ class MainMenu:
             step = self.tutorial_steps[self.tutorial_index]
             if isinstance(step, str):  # Text step
                 screen.blit(self.background, (0, 0))  # Use menu_background as base
-                overlay = pygame.Surface((1920, 1080))
+                overlay = Display.create_surface((1920, 1080))
                 overlay.fill((0, 0, 0))
                 overlay.set_alpha(200)
                 screen.blit(overlay, (0, 0))
@@ -901,9 +918,4 @@ class MainMenu:
             screen.blit(self.right_arrow, (self.right_arrow_rect.x + 25, self.right_arrow_rect.y))
             # Draw left arrow on steps 1-5 (not step 0)
             if self.tutorial_index > 0:
-                screen.blit(self.left_arrow, (self.left_arrow_rect.x - 25, self.left_arrow_rect.y))
-
-
-
-
-        self.achievements.draw_popup(screen)
\ No newline at end of file
+                screen.blit(self.left_arrow, (self.left_arrow_rect.x - 25, self.left_arrow_rect.y))
\ No newline at end of file
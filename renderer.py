@@ -0,0 +1,318 @@
+import weakref
+import pygame
+from fractions import Fraction
+
+
+class ScaledSurface:
+    """A drawing target addressed in 1920x1080 game coordinates but stored at a render scale.
+
+    blit/blits/fill/subsurface take game coordinates and write into target,
+    which is the scaled size. Each source surface is shrunk on its first blit
+    and the copy is reused while the source lives. That works because the
+    game replaces text, health bars and button fills instead of redrawing them
+    in place; surfaces that are redrawn (the static layer, menu view, end
+    screen) are ScaledSurfaces themselves and are blitted target to target.
+    """
+    scaled_sources = weakref.WeakKeyDictionary()  # source -> (scale, shrunk copy)
+
+    def __init__(self, target, scale, size=None):
+        self.target = target
+        self.scale = scale
+        self.size = size or (round(target.get_width() / scale), round(target.get_height() / scale))
+
+    @classmethod
+    def shrink(cls, source, scale):
+        cached = cls.scaled_sources.get(source)
+        if cached is not None and cached[0] == scale:
+            return cached[1]
+        size = (max(1, round(source.get_width() * scale)), max(1, round(source.get_height() * scale)))
+        if source.get_bitsize() >= 24 and source.get_colorkey() is None:
+            scaled = pygame.transform.smoothscale(source, size)
+        else:
+            scaled = pygame.transform.scale(source, size)
+            if source.get_colorkey() is not None:
+                scaled.set_colorkey(source.get_colorkey())
+        if source.get_alpha() is not None:
+            scaled.set_alpha(source.get_alpha())
+        cls.scaled_sources[source] = (scale, scaled)
+        return scaled
+
+    def source_for(self, source):
+        if isinstance(source, ScaledSurface):
+            return source.target if source.scale == self.scale else self.shrink(source.target, self.scale / source.scale)
+        return self.shrink(source, self.scale)
+
+    def scale_point(self, dest):
+        return (round(dest[0] * self.scale), round(dest[1] * self.scale))
+
+    def scale_rect(self, rect):
+        rect = pygame.Rect(rect)
+        left, top = self.scale_point(rect.topleft)
+        right, bottom = self.scale_point(rect.bottomright)
+        return pygame.Rect(left, top, right - left, bottom - top)
+
+    def blit(self, source, dest, area=None, special_flags=0):
+        if area is not None:
+            area = self.scale_rect(area)
+        return self.target.blit(self.source_for(source), self.scale_point(dest), area, special_flags)
+
+    def blits(self, blit_sequence, doreturn=True):
+        return self.target.blits([(self.source_for(source), self.scale_point(dest)) for source, dest in blit_sequence], doreturn)
+
+    def fill(self, color, rect=None, special_flags=0):
+        return self.target.fill(color, None if rect is None else self.scale_rect(rect), special_flags)
+
+    def subsurface(self, rect):
+        rect = pygame.Rect(rect)
+        return ScaledSurface(self.target.subsurface(self.scale_rect(rect).clip(self.target.get_rect())), self.scale, rect.size)
+
+    def copy(self):
+        return ScaledSurface(self.target.copy(), self.scale, self.size)
+
+    def convert(self):
+        return ScaledSurface(self.target.convert(), self.scale, self.size)
+
+    def convert_alpha(self):
+        return ScaledSurface(self.target.convert_alpha(), self.scale, self.size)
+
+    def set_alpha(self, value):
+        self.target.set_alpha(value)
+
+    def get_alpha(self):
+        return self.target.get_alpha()
+
+    def get_size(self):
+        return self.size
+
+    def get_width(self):
+        return self.size[0]
+
+    def get_height(self):
+        return self.size[1]
+
+    def get_rect(self, **kwargs):
+        rect = pygame.Rect((0, 0), self.size)
+        for key, value in kwargs.items():
+            setattr(rect, key, value)
+        return rect
+
+
+def draw_rect(surface, color, rect, width=0):
+    """pygame.draw.rect that also draws on a ScaledSurface in game coordinates."""
+    if isinstance(surface, ScaledSurface):
+        rect = surface.scale_rect(rect)
+        width = max(1, round(width * surface.scale)) if width else 0
+        surface = surface.target
+    return pygame.draw.rect(surface, color, rect, width)
+
+
+class Display:
+    """The game window, drawn at a render scale and presented at 1920x1080.
+
+    Everything draws into Display.surface in 1920x1080 coordinates. At a
+    render scale below 1.0 that surface is a ScaledSurface whose pixels are
+    the smaller size, so every frame is composed at the lower resolution.
+    A full present is one upscale into the window; a partial one upscales
+    only the dirty rects. map_event() maps mouse positions from the window
+    to game coordinates.
+    """
+    logical_size = (1920, 1080)
+    scales = (1.0, 0.75, 0.5)
+    scale = 1.0
+    scale_step = 1  # Dirty rects are widened to multiples of this so they map onto whole offscreen pixels
+    window = None
+    surface = None
+
+    @classmethod
+    def set_scale(cls, scale):
+        cls.scale = scale
+        cls.scale_step = Fraction(scale).limit_denominator(16).denominator
+        cls.window = pygame.display.set_mode(cls.logical_size, pygame.SRCALPHA)
+        if scale == 1.0:
+            cls.surface = cls.window
+        else:
+            cls.surface = cls.create_surface(cls.logical_size).convert()
+        return cls.surface
+
+    @classmethod
+    def create_surface(cls, size, flags=0):
+        """A surface for size in game coordinates, stored at the current render scale."""
+        if cls.scale == 1.0:
+            return pygame.Surface(size, flags)
+        return ScaledSurface(pygame.Surface((round(size[0] * cls.scale), round(size[1] * cls.scale)), flags), cls.scale, size)
+
+    @classmethod
+    def is_scaled(cls):
+        return cls.surface is not cls.window
+
+    @classmethod
+    def flip(cls):
+        if cls.is_scaled():
+            pygame.transform.scale(cls.surface.target, cls.window.get_size(), cls.window)
+        pygame.display.flip()
+
+    @classmethod
+    def update(cls, rects):
+        if cls.is_scaled():
+            rects = [cls.upscale_rect(rect) for rect in rects]
+        pygame.display.update(rects)
+
+    @classmethod
+    def upscale_rect(cls, rect):
+        """Upscale the offscreen pixels under one dirty rect into the window and return the window rect."""
+        step = cls.scale_step
+        left, top = rect.left // step * step, rect.top // step * step
+        right = min(-(-rect.right // step) * step, cls.logical_size[0])
+        bottom = min(-(-rect.bottom // step) * step, cls.logical_size[1])
+        target = pygame.Rect(left, top, right - left, bottom - top)
+        source = pygame.Rect(int(left * cls.scale), int(top * cls.scale), int(target.width * cls.scale), int(target.height * cls.scale))
+        pygame.transform.scale(cls.surface.target.subsurface(source), target.size, cls.window.subsurface(target))
+        return target
+
+    @classmethod
+    def map_event(cls, event):
+        """Convert a mouse event's window position into game coordinates."""
+        window_size = cls.window.get_size() if cls.window else cls.logical_size
+        if window_size != cls.logical_size and hasattr(event, "pos"):
+            event.pos = (event.pos[0] * cls.logical_size[0] // window_size[0], event.pos[1] * cls.logical_size[1] // window_size[1])
+        return event
+
+
+class DirtyRectRenderer:
+    """Presents only the parts of the screen that changed since the last frame.
+
+    Each frame the scene marks the rects its layers touched (units,
+    projectiles, seed drops, HUD, dialogs). present() pushes those plus last
+    frame's rects, so anything that moved or vanished is cleared, with
+    pygame.display.update(rects). Overlapping rects are merged first, and
+    when the area they cover gets large a plain full flip is cheaper and is
+    used instead.
+    """
+    full_flip_ratio = 0.5  # Fraction of the screen above which a full flip is used
+
+    def __init__(self, screen):
+        self.screen_rect = screen.get_rect()
+        self.layers = {}
+        self.previous_rects = []
+        self.full_redraw = True
+        self.last_full_redraw = False
+        self.frames = 0
+        self.full_flips = 0
+
+    def mark(self, layer, rect):
+        rect = pygame.Rect(rect).clip(self.screen_rect)
+        if rect.width and rect.height:
+            self.layers.setdefault(layer, []).append(rect)
+
+    def mark_all(self):
+        self.full_redraw = True
+
+    @staticmethod
+    def merge_rects(rects):
+        """Union overlapping rects until none overlap, so shared area is pushed and counted once.
+
+        A unit's rect from last frame folds into this frame's, and units
+        crowded into the same lane become one band instead of a stack.
+        """
+        merged = sorted(rects, key=lambda rect: rect.x)
+        changed = True
+        while changed:
+            changed = False
+            result = []
+            for rect in merged:
+                index = rect.collidelist(result)
+                if index == -1:
+                    result.append(pygame.Rect(rect))
+                else:
+                    result[index].union_ip(rect)
+                    changed = True
+            merged = result
+        return merged
+
+    def present(self):
+        current_rects = [rect for rects in self.layers.values() for rect in rects]
+        rects = self.merge_rects(current_rects + self.previous_rects)
+        dirty_area = sum(rect.width * rect.height for rect in rects)  # Merged rects are disjoint
+        self.frames += 1
+        # The frame after a full redraw is full too, so whatever covered the screen (dialogs, menus) gets cleared
+        if self.full_redraw or self.last_full_redraw or dirty_area > self.full_flip_ratio * self.screen_rect.width * self.screen_rect.height:
+            Display.flip()
+            self.full_flips += 1
+        elif rects:
+            Display.update(rects)
+        self.previous_rects = current_rects
+        self.layers = {}
+        self.last_full_redraw = self.full_redraw
+        self.full_redraw = False
+
+    def stats(self):
+        return {
+            "frames": self.frames,
+            "full_flips": self.full_flips,
+            "partial_updates": self.frames - self.full_flips
+        }
+
+
+class StaticLayer:
+    """The battlefield background with the scenery that rarely changes baked in.
+
+    Sprites drawn under the animated towers go straight onto one opaque
+    surface. Sprites drawn over the towers join it too unless they overlap a
+    tower (or an earlier sprite that had to stay on top), in which case they
+    are kept as separate blits so the draw order doesn't change. The surface
+    is rebuilt only when the sprites, their positions or the towers change.
+    """
+    def __init__(self, background):
+        self.background = background
+        self.surface = None
+        self.front = []
+        self.key = None
+        self.rebuilds = 0
+
+    def update(self, below, above, occluders):
+        """below/above are lists of (sprite, pos) in draw order; occluders are the rects of what sits between them."""
+        occluders = [tuple(rect) for rect in occluders]
+        key = (tuple(below), tuple(above), tuple(occluders))
+        if key == self.key:
+            return False
+        self.key = key
+        self.rebuilds += 1
+
+        self.surface = self.background.copy()
+        for sprite, pos in below:
+            self.surface.blit(sprite, pos)
+        self.front = []
+        blocking = [pygame.Rect(rect) for rect in occluders]
+        for sprite, pos in above:
+            rect = sprite.get_rect(topleft=pos)
+            if rect.collidelist(blocking) != -1:
+                self.front.append((sprite, pos))
+                blocking.append(rect)
+            else:
+                self.surface.blit(sprite, pos)
+        return True
+
+    def draw(self, screen):
+        screen.blit(self.surface, (0, 0))
+
+    def draw_front(self, screen):
+        for sprite, pos in self.front:
+            screen.blit(sprite, pos)
+
+
+class RenderQueue:
+    """Collects (surface, position) pairs per layer and submits each layer with one Surface.blits call."""
+    def __init__(self, layers):
+        self.layers = {layer: [] for layer in layers}  # Submitted in this order
+
+    def add(self, layer, surface, pos):
+        self.layers[layer].append((surface, pos))
+
+    def extend(self, layer, blits):
+        self.layers[layer].extend(blits)
+
+    def submit(self, screen):
+        for blits in self.layers.values():
+            if blits:
+                screen.blits(blits, doreturn=False)
+                blits.clear()
@@ -1,5 +1,6 @@
 import pygame
 import sys
+from simclock import SimClock
 from units import (Player_PeasantUnit, Player_SpearmanUnit, Player_ArcherUnit, Player_WarriorUnit, Player_TankUnit,
                   Bandit_Razor, Bandit_Madman, Bandit_Archer, Bandit_Tank, Bandit_King,
                   Zombie_Melee, Zombie_Archer, Zombie_Tank, Zombie_Assassin, Zombie_Farmer,
@@ -119,7 +120,7 @@ while running:
         #screen.blit(name_text, (name_x, name_y))
 
     pygame.display.flip()
-    clock.tick(30)  # 30 FPS
+    SimClock.advance(clock.tick(30))  # 30 FPS; unit animations run on the simulation clock
 
 pygame.quit()
 sys.exit()
\ No newline at end of file
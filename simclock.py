@@ -0,0 +1,27 @@
+class SimClock:
+    """Battle time in milliseconds, advanced one fixed step per simulation tick.
+
+    Unit cooldowns and animation timers, seed drop lifetimes and enemy spawn
+    timing read SimClock.now() instead of the wall clock, so a battle plays at
+    the same speed however fast or slowly it is drawn. alpha is how far past
+    the last tick the current frame is drawn, for interpolating positions.
+    """
+    tick_rate = 30  # Simulation ticks per second; per-tick speeds are tuned for this
+    step_ms = 1000 / tick_rate
+    max_catch_up = 5  # Most ticks run for one rendered frame before the backlog is dropped
+    time = 0.0
+    alpha = 1.0
+
+    @classmethod
+    def now(cls):
+        return int(cls.time)
+
+    @classmethod
+    def advance(cls, ms=None):
+        cls.time += cls.step_ms if ms is None else ms
+
+    @classmethod
+    def lerp(cls, previous, current):
+        if cls.alpha >= 1.0:
+            return current
+        return previous + (current - previous) * cls.alpha
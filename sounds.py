@@ -0,0 +1,94 @@
+import pygame
+from headless import Headless
+
+class SoundBank:
+    """Decode-once sound store that plays through a fixed pool of mixer channels.
+
+    Every .ogg is decoded the first time it is requested and the same Sound is
+    handed to everyone after that. Playback goes through play(), which caps how
+    many copies of one sound can ring at once and, when the pool is full, steals
+    the oldest voice of the lowest priority instead of piling up more channels.
+    """
+    PRIORITY_COMBAT = 0
+    PRIORITY_UI = 10
+
+    channel_count = 16
+    default_max_voices = 3
+
+    sounds = {}
+    failed_paths = set()
+    max_voices = {}
+    channels = []
+    voices = []  # (sound, priority, start tick) per channel, parallel to channels
+
+    @classmethod
+    def get(cls, path, max_voices=None):
+        """Return the shared Sound for path, or None if it can't be loaded."""
+        if Headless.enabled:
+            return None
+        sound = cls.sounds.get(path)
+        if sound is None:
+            if path in cls.failed_paths:
+                return None
+            try:
+                sound = pygame.mixer.Sound(path)
+            except Exception as e:
+                print(f"Failed to load sound {path}: {e}")
+                cls.failed_paths.add(path)
+                return None
+            cls.sounds[path] = sound
+        if max_voices is not None:
+            cls.max_voices[sound] = max_voices
+        return sound
+
+    @classmethod
+    def init_channels(cls):
+        if cls.channels:
+            return True
+        if not pygame.mixer.get_init():
+            return False
+        if pygame.mixer.get_num_channels() < cls.channel_count:
+            pygame.mixer.set_num_channels(cls.channel_count)
+        # Keep the pool out of reach of plain Sound.play() calls
+        pygame.mixer.set_reserved(cls.channel_count)
+        cls.channels = [pygame.mixer.Channel(i) for i in range(cls.channel_count)]
+        cls.voices = [None] * cls.channel_count
+        return True
+
+    @classmethod
+    def play(cls, sound, priority=PRIORITY_COMBAT):
+        """Play sound on a pooled channel. Returns the Channel, or None if the voice was dropped."""
+        if sound is None or not cls.init_channels():
+            return None
+
+        free_index = None
+        victim_index = None
+        same_sound = 0
+        for i, channel in enumerate(cls.channels):
+            if not channel.get_busy():
+                cls.voices[i] = None
+                if free_index is None:
+                    free_index = i
+                continue
+            voice_sound, voice_priority, voice_start = cls.voices[i] or (None, cls.PRIORITY_COMBAT, 0)
+            if voice_sound is sound:
+                same_sound += 1
+            if victim_index is None:
+                victim_index = i
+            else:
+                _, victim_priority, victim_start = cls.voices[victim_index] or (None, cls.PRIORITY_COMBAT, 0)
+                if (voice_priority, voice_start) < (victim_priority, victim_start):
+                    victim_index = i
+
+        if same_sound >= cls.max_voices.get(sound, cls.default_max_voices):
+            return None
+        if free_index is None:
+            victim = cls.voices[victim_index]
+            if victim is not None and victim[1] > priority:
+                return None
+            free_index = victim_index
+
+        channel = cls.channels[free_index]
+        channel.play(sound)
+        cls.voices[free_index] = (sound, priority, pygame.time.get_ticks())
+        return channel
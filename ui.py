@@ -1,13 +1,18 @@
 import pygame
+from sounds import SoundBank
+from fonts import Fonts
+from asset_bake import load_image
 from units import Player_PeasantUnit, Player_SpearmanUnit, Player_ArcherUnit, Player_WarriorUnit, Player_TankUnit
 
 class Button:
+    fill_steps = 36  # Seed-progress fill moves in 5px steps on a 180px wide button
+
     def __init__(self, x, y, width, height, text, ui_instance):
         self.rect = pygame.Rect(x, y, width, height)
         self.text = text
         self.ui = ui_instance
         try:
-            base_image = pygame.image.load("assets/ui/ui_buybuttons.png").convert_alpha()
+            base_image = load_image("assets/ui/ui_buybuttons.png")
             base_image = pygame.transform.scale(base_image, (width, height))
             self.normal = base_image
             self.greyed = pygame.transform.scale(base_image.copy(), (width, height))
@@ -19,29 +24,42 @@ class Button:
             self.greyed = pygame.Surface((width, height), pygame.SRCALPHA)
             self.normal.fill((100, 100, 100))
             self.greyed.fill((50, 50, 50))
-        self.font = pygame.font.SysFont("Arial", 24)
+        self.font = Fonts.get_sys("Arial", 24)
         self.text_surface = self.font.render(text, True, (249, 249, 242))
+        self.fill_mask = pygame.Surface((width, height), pygame.SRCALPHA)
+        self.fill_image = None
+        self.fill_image_step = None
         self.hovered = False
         self.clicked = False
-        try:
-            self.click_sound = pygame.mixer.Sound("assets/sounds/UI/button_click.ogg")
-            self.back_sound = pygame.mixer.Sound("assets/sounds/UI/button_back.ogg")
-            print("Successfully loaded button sounds")
-        except Exception as e:
-            print(f"Failed to load button sounds: {e}")
-            self.click_sound = None
-            self.back_sound = None
+        self.click_sound = SoundBank.get("assets/sounds/UI/button_click.ogg")
+        self.back_sound = SoundBank.get("assets/sounds/UI/button_back.ogg")
 
     def update(self, mouse_pos, mouse_clicked):
         self.hovered = self.rect.collidepoint(mouse_pos)
         if self.hovered and mouse_clicked and not self.clicked:
             sound = self.back_sound if self.text.lower() == "back" else self.click_sound
-            if sound:
-                sound.play()
+            SoundBank.play(sound, SoundBank.PRIORITY_UI)
             self.clicked = True
         elif not mouse_clicked:
             self.clicked = False
 
+    def get_fill_step(self, fill_ratio):
+        return self.fill_steps if fill_ratio >= 1.0 else int(self.fill_steps * max(0, fill_ratio))
+
+    def get_fill_image(self, fill_ratio):
+        """The button image dimmed past the seed-progress fill, recomposited only when the fill step changes."""
+        step = self.get_fill_step(fill_ratio)
+        if step != self.fill_image_step:
+            self.fill_image_step = step
+            self.fill_image = self.normal.copy()
+            if step < self.fill_steps:
+                self.fill_mask.fill((255, 255, 255, int(255 * 0.25)))
+                fill_width = self.rect.width * step // self.fill_steps
+                if fill_width > 0:
+                    pygame.draw.rect(self.fill_mask, (255, 255, 255, 255), (0, 0, fill_width, self.rect.height))
+                self.fill_image.blit(self.fill_mask, (0, 0), special_flags=pygame.BLEND_RGBA_MULT)
+        return self.fill_image
+
     def draw(self, screen, button_image):
         screen.blit(button_image, (self.rect.x, self.rect.y))
         text_x = self.rect.x + (self.rect.width - self.text_surface.get_width()) // 2
@@ -67,10 +85,10 @@ class UI:
         self.seeds_text_surface = None
         self.unit_icons = {}
         try:
-            self.background = pygame.image.load("assets/ui/ui_background.png").convert_alpha()
+            self.background = load_image("assets/ui/ui_background.png")
             bg_height = self.screen_height - 880
             self.background = pygame.transform.scale(self.background, (self.screen_width, bg_height))
-            self.background_overlay = pygame.image.load("assets/ui/ui_background_overlay.png").convert_alpha()
+            self.background_overlay = load_image("assets/ui/ui_background_overlay.png")
             overlay_height = bg_height
             self.background_overlay = pygame.transform.scale(self.background_overlay, (self.screen_width, overlay_height))
             print("Successfully loaded UI background images")
@@ -82,7 +100,7 @@ class UI:
             self.background_overlay.fill((0, 0, 0, 0))
         self.setup_buttons()
         self.preload_icons()
-        self.font = pygame.font.SysFont("Arial", 24)
+        self.font = Fonts.get_sys("Arial", 24)
 
     def setup_buttons(self):
         button_width = 180
@@ -116,6 +134,15 @@ class UI:
                 button.update(mouse_pos, False)
         return None
 
+    def get_fill_ratio(self, unit_type):
+        seeds = self.game.seeds
+        cost = unit_type.cost
+        return 1.0 if seeds >= cost else (seeds / cost if cost > 0 else 1.0)
+
+    def get_panel_state(self):
+        """Everything the bottom panel's look depends on; it only changes when this does."""
+        return tuple(button.get_fill_step(self.get_fill_ratio(unit_type)) for button, unit_type in self.buy_buttons)
+
     def draw(self, screen):
         bg_y = 880
         screen.blit(self.background, (0, bg_y))
@@ -128,25 +155,7 @@ class UI:
             screen.blit(self.seeds_text_surface, (10, 10))
 
         for button, unit_type in self.buy_buttons:
-            seeds = self.game.seeds
-            cost = unit_type.cost
-            fill_ratio = 1.0 if seeds >= cost else (seeds / cost if cost > 0 else 1.0)
-
-            button_image = button.normal.copy()
-
-            if fill_ratio < 1.0:
-                alpha_mask = pygame.Surface((button.rect.width, button.rect.height), pygame.SRCALPHA)
-                fill_width = int(button.rect.width * fill_ratio)
-                alpha_mask.fill((255, 255, 255, int(255 * 0.25)))
-                if fill_ratio > 0:
-                    pygame.draw.rect(alpha_mask, (255, 255, 255, 255), (0, 0, fill_width, button.rect.height))
-                button_image.blit(alpha_mask, (0, 0), special_flags=pygame.BLEND_RGBA_MULT)
-
-            center_x, center_y = button.rect.width // 2, button.rect.height // 2
-            rgba = button_image.get_at((center_x, center_y))
-            alpha = button_image.get_alpha() if button_image.get_alpha() is not None else 255
-
-            button.draw(screen, button_image)
+            button.draw(screen, button.get_fill_image(self.get_fill_ratio(unit_type)))
 
             icon = self.unit_icons[unit_type]
             icon_x = button.rect.x + (button.rect.width - icon.get_width()) // 2
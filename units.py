@@ -3,26 +3,27 @@ import math
 import os
 import random
 from factions import Player, Bandits, Undead, Zombies
+from animations import AnimationCache, ProjectileAtlas
+from sounds import SoundBank
 from collisions import *
-
-def preload_all_animations():
-    for unit_type in [Player_PeasantUnit, Player_SpearmanUnit, Player_ArcherUnit, Player_WarriorUnit, Player_TankUnit,
-                      Bandit_Razor, Bandit_Madman, Bandit_Archer, Bandit_Tank, Bandit_King,
-                      Zombie_Archer, Zombie_Assassin, Zombie_Farmer, Zombie_Melee, Zombie_Tank,
-                      Undead_Axeman, Undead_King, Undead_Mage, Undead_Samurai, Undead_Warrior]:
-        faction = "Player" if unit_type in [Player_PeasantUnit, Player_SpearmanUnit, Player_ArcherUnit, Player_WarriorUnit, Player_TankUnit] else \
-                  "Bandits" if unit_type in [Bandit_Razor, Bandit_Madman, Bandit_Archer, Bandit_Tank, Bandit_King] else \
-                  "Undead" if unit_type in [Undead_Axeman, Undead_King, Undead_Mage, Undead_Samurai, Undead_Warrior] else "Zombies"
-        unit = unit_type(faction, 0)
-        unit.load_animations()
+from fonts import Fonts
+from healthbar import HealthBar
+from simclock import SimClock
+from asset_bake import load_image
 
 class Unit:
     hurt_duration = 200
-    missing_spritesheets = set()
+    is_tower = False
+    shows_health_bar = True
+    ranged = False  # Fires a projectile on its attack frame instead of striking the target directly
+    attack_once = False  # Stops attacking after one swing instead of looping until the target dies
+    combat_core = None  # CombatCore simulating this unit, if any
+    attack_sound_path = "assets/sounds/Units/melee_sword.ogg"
 
     def __init__(self, faction, x):
         self.faction = faction
         self.x = x
+        self.prev_x = x  # x as of the previous simulation tick, for drawing between ticks
         self.initial_x = x
         self.y = 688
         self.health = self.base_health
@@ -33,11 +34,14 @@ class Unit:
         self.attack_cooldown = self.base_attack_cooldown
         self.direction = 1 if (faction == "Player" or (hasattr(faction, 'name') and faction.name == "Player")) else -1
         self.animations = {}
+        self.mirrored_animations = {}
+        self.masks = {}
+        self.mirrored_masks = {}
         self.state = "idle"
         self.frame = 0
         self.base_frame_delay = 100
         self.attack_frame_delay = self.base_attack_cooldown / 14
-        self.last_update = pygame.time.get_ticks()
+        self.last_update = SimClock.now()
         self.attack_target = None
         self.is_attacking = False
         self.last_attack = 0
@@ -45,55 +49,25 @@ class Unit:
         self.last_range_check = 0
         self.is_retreating = False
         self.scale_factor = 1.0
-        self.attack_sound = None
+        self.health_bar = HealthBar(int(114 * self.scale_factor), int(10 * self.scale_factor),
+                                    (0, 255, 0) if self.direction == 1 else (255, 0, 0), (100, 100, 100),
+                                    Fonts.get_sys("Arial", int(16 * self.scale_factor)), int(20 * self.scale_factor))
+        self.attack_sound = SoundBank.get(self.attack_sound_path)
         self.death_sound = None
         self.is_zombie = False
         self.finished_moving = False
-        try:
-            self.attack_sound = pygame.mixer.Sound("assets/sounds/Units/melee_sword.ogg")
-        except Exception as e:
-            print(f"Failed to load default melee_sword.ogg: {e}")
         self.load_animations()
 
     def load_animations(self):
         faction_name = self.faction if isinstance(self.faction, str) else self.faction.name
         faction_folder = faction_name.capitalize()
         spritesheet_path = f"assets/sprites/{faction_folder}/{self.name}.png"
-        
-        if spritesheet_path in Unit.missing_spritesheets:
-            self.set_default_animations()
-            return
-        
-        if not os.path.exists(spritesheet_path):
-            print(f"Error: Spritesheet not found at {spritesheet_path}")
-            Unit.missing_spritesheets.add(spritesheet_path)
-            self.set_default_animations()
-            return
 
-        try:
-            spritesheet = pygame.image.load(spritesheet_path).convert_alpha()
-            frame_width = 192
-            frame_height = 192
-            frames_per_state = 14
-            state_rows = {"idle": 0, "run": 1, "attack": 2, "die": 3}
-            self.animations = {}
-            for state, row in state_rows.items():
-                frames = []
-                for i in range(frames_per_state):
-                    x = i * frame_width
-                    y = row * frame_height
-                    if x + frame_width <= spritesheet.get_width() and y + frame_height <= spritesheet.get_height():
-                        frame = spritesheet.subsurface((x, y, frame_width, frame_height))
-                        scaled_width = int(frame_width * self.scale_factor)
-                        scaled_height = int(frame_height * self.scale_factor)
-                        frame = pygame.transform.smoothscale(frame, (scaled_width, scaled_height))
-                        frames.append(frame)
-                self.animations[state] = frames if frames else [pygame.Surface((int(192 * self.scale_factor), int(192 * self.scale_factor)))]
-            self.animations["hurt"] = [pygame.transform.smoothscale(self.animations["die"][0], (int(192 * self.scale_factor), int(192 * self.scale_factor)))] if self.animations["die"] else [pygame.Surface((int(192 * self.scale_factor), int(192 * self.scale_factor)))]
-        except Exception as e:
-            print(f"Failed to load spritesheet {spritesheet_path}: {e}")
-            Unit.missing_spritesheets.add(spritesheet_path)
+        tables = AnimationCache.get_tables(spritesheet_path, self.scale_factor)
+        if tables is None:
             self.set_default_animations()
+            return
+        self.animations, self.mirrored_animations, self.masks, self.mirrored_masks = tables
 
     def set_default_animations(self):
         default_colors = {
@@ -107,6 +81,10 @@ class Unit:
         default_frame = pygame.Surface((int(192 * self.scale_factor), int(192 * self.scale_factor)))
         default_frame.fill(color)
         self.animations = {state: [default_frame] for state in ["idle", "run", "attack", "die", "hurt"]}
+        self.mirrored_animations = self.animations  # Solid fill looks the same either way
+        default_mask = pygame.mask.from_surface(default_frame)
+        self.masks = {state: [default_mask] for state in self.animations}
+        self.mirrored_masks = self.masks
 
     def get_icon(self):
         if self.animations["idle"]:
@@ -119,7 +97,7 @@ class Unit:
     def attack(self, target):
         if self.state == "die":
             return
-        now = pygame.time.get_ticks()
+        now = SimClock.now()
         if not self.is_attacking and now - self.last_attack >= self.attack_cooldown:
             self.attack_target = target
             self.is_attacking = True
@@ -129,7 +107,7 @@ class Unit:
             print(f"{self.name} starting attack on {target.name if hasattr(target, 'name') else 'base'}")
 
     def update_animation(self):
-        now = pygame.time.get_ticks()
+        now = SimClock.now()
         frame_delay = self.attack_frame_delay if self.state == "attack" else self.base_frame_delay
         if now - self.last_update < frame_delay:
             return None
@@ -145,19 +123,10 @@ class Unit:
         if self.state == "attack":
             self.frame += 1
             if self.frame == 7 and self.is_attacking and self.attack_target:
-                if self.attack_sound:
-                    self.attack_sound.play()
-                if isinstance(self, (Player_ArcherUnit, Bandit_Archer, Zombie_Archer)):
-                    arrow_start_x = self.x + (int(115 * self.scale_factor) if self.direction == 1 else int(59 * self.scale_factor))
-                    arrow_start_y = self.y + int(105 * self.scale_factor)
+                SoundBank.play(self.attack_sound)
+                if self.ranged:
                     if hasattr(self.attack_target, 'state') or hasattr(self.attack_target, 'health'):
-                        return Arrow(arrow_start_x, arrow_start_y, self.direction, self.attack_target, self.attack_power)
-                elif isinstance(self, Undead_Mage):
-                    ball_start_x = self.x - int(500 * self.scale_factor)
-                    ball_start_y = self.y + int(115 * self.scale_factor)
-                    if hasattr(self.attack_target, 'state') or hasattr(self.attack_target, 'health'):
-                        print(f"{self.name} firing magic ball at {self.attack_target.name if hasattr(self.attack_target, 'name') else 'base'}")
-                        return MagicBall(ball_start_x, ball_start_y, self.direction, self.attack_target, self.attack_power)
+                        return self.make_projectile()
                 else:  # Melee units
                     if hasattr(self.attack_target, 'state') and self.attack_target.state != "die":
                         self.attack_target.take_damage(self.attack_power)
@@ -184,9 +153,18 @@ class Unit:
             self.frame = (self.frame + 1) % (max_frame + 1)
             return None
 
+    def make_projectile(self):
+        """Projectile a ranged unit looses at its attack target."""
+        arrow_start_x = self.x + (int(115 * self.scale_factor) if self.direction == 1 else int(59 * self.scale_factor))
+        arrow_start_y = self.y + int(105 * self.scale_factor)
+        return Arrow(arrow_start_x, arrow_start_y, self.direction, self.attack_target, self.attack_power)
+
     def take_damage(self, damage):
         if self.state == "die":
             return
+        if self.combat_core is not None:
+            self.combat_core.take_damage(self, damage)
+            return
         self.health -= damage
         if self.health <= 0:
             self.health = 0
@@ -198,16 +176,16 @@ class Unit:
         elif self.state != "attack":
             self.state = "hurt"
             self.frame = 0
-            self.hurt_start = pygame.time.get_ticks()
+            self.hurt_start = SimClock.now()
 
-    def move(self, all_units, enemy_base, player_base, buckets, bucket_size):
+    def move(self, all_units, enemy_base, player_base, index):
         if self.state in ["attack", "die"]:
             return
 
         if self.direction == 1:
-            new_x, new_state, target = check_player_collisions(self, buckets, bucket_size, enemy_base)
+            new_x, new_state, target = check_player_collisions(self, index, enemy_base)
         elif self.direction == -1:
-            new_x, new_state, target = check_enemy_collisions(self, buckets, bucket_size, player_base)
+            new_x, new_state, target = check_enemy_collisions(self, index, player_base)
 
         self.x = new_x
         if new_state == "attack" and target:
@@ -215,32 +193,46 @@ class Unit:
         else:
             self.state = new_state
 
-    def draw(self, screen):
+    def get_animations(self, mirrored):
+        return self.mirrored_animations if mirrored else self.animations
+
+    def get_mask(self, mirrored):
+        return (self.mirrored_masks if mirrored else self.masks)[self.state][self.frame]
+
+    def get_draw_x(self):
+        """x to draw at, interpolated between the last two simulation ticks."""
+        return SimClock.lerp(self.prev_x, self.x)
+
+    def get_draw_rect(self):
+        """Screen area covered by the sprite and the health bar above it."""
+        return pygame.Rect(self.get_draw_x(), self.y - int(40 * self.scale_factor), int(192 * self.scale_factor), int(232 * self.scale_factor))
+
+    def get_blits(self):
+        """(surface, position) pairs for the current frame and health bar, in draw order."""
+        blits = []
+        x = self.get_draw_x()
         if self.state in self.animations and self.animations[self.state]:
-            frame_index = min(self.frame, len(self.animations[self.state]) - 1)
-            frame = self.animations[self.state][frame_index]
-            if self.direction == -1 and not self.is_retreating:
-                frame = pygame.transform.flip(frame, True, False)
-            screen.blit(frame, (self.x, self.y))
-
-        bar_width = int(114 * self.scale_factor)
-        bar_height = int(10 * self.scale_factor)
-        health_ratio = self.health / self.max_health
-        fill_width = bar_width * health_ratio
-        bar_x = self.x + ((192 * self.scale_factor) - bar_width) // 2
-        bar_y = self.y - int(20 * self.scale_factor)
-        pygame.draw.rect(screen, (100, 100, 100), (bar_x, bar_y, bar_width, bar_height))
-        fill_color = (0, 255, 0) if (self.faction == "Player" or (hasattr(self.faction, 'name') and self.faction.name == "Player")) else (255, 0, 0)
-        pygame.draw.rect(screen, fill_color, (bar_x, bar_y, fill_width, bar_height))
-        
-        hp_font = pygame.font.SysFont("Arial", int(16 * self.scale_factor))
-        hp_text = hp_font.render(f"{int(self.health)}/{int(self.max_health)}", True, (255, 255, 255))
-        screen.blit(hp_text, (bar_x + (bar_width - hp_text.get_width()) // 2, bar_y - int(20 * self.scale_factor)))
+            frames = self.get_animations(self.direction == -1 and not self.is_retreating)[self.state]
+            frame_index = min(self.frame, len(frames) - 1)
+            blits.append((frames[frame_index], (x, self.y)))
+
+        if self.shows_health_bar:
+            bar_x = x + ((192 * self.scale_factor) - self.health_bar.width) // 2
+            bar_y = self.y - int(20 * self.scale_factor)
+            blits.append(self.health_bar.get_blit(bar_x, bar_y, self.health, self.max_health))
+        return blits
+
+    def draw(self, screen):
+        screen.blits(self.get_blits(), doreturn=False)
 
 class Arrow:
+    draw_offset = (16, 8)
+
     def __init__(self, x, y, direction, target, damage, max_distance=1000):
         self.x = x
         self.y = y
+        self.prev_x = x
+        self.prev_y = y
         self.start_x = x
         self.direction = direction
         self.target = target
@@ -262,14 +254,8 @@ class Arrow:
         self.velocity_x = dx / travel_time if dx != 0 else 3 * direction
         self.velocity_y = (dy - 0.5 * self.gravity * travel_time * (travel_time - 1)) / travel_time
 
-        try:
-            self.sprite = pygame.image.load("assets/images/arrow.png").convert_alpha()
-            self.sprite = pygame.transform.scale(self.sprite, (32, 16))
-        except Exception as e:
-            print(f"Failed to load arrow sprite: {e}")
-            self.sprite = pygame.Surface((32, 16))
-            self.sprite.fill((255, 255, 255))
-
+        self.atlas = ProjectileAtlas.get("assets/images/arrow.png", (32, 16), (255, 255, 255))
+        self.sprite, self.rotated_mask = self.atlas[0]
         self.rotated_sprite = self.sprite
 
     def update(self, all_units):
@@ -290,8 +276,7 @@ class Arrow:
             self.active = False
             return True
 
-        angle = math.degrees(math.atan2(-self.velocity_y, self.velocity_x))
-        self.rotated_sprite = pygame.transform.rotate(self.sprite, angle)
+        self.rotated_sprite, self.rotated_mask = ProjectileAtlas.lookup(self.atlas, self.velocity_x, self.velocity_y)
 
         arrow_rect = pygame.Rect(self.x - 16, self.y - 8, 32, 16)
         target_rect = self.target.get_rect()
@@ -307,25 +292,30 @@ class Arrow:
 
     def check_pixel_collision(self, target):
         if hasattr(target, 'animations') and target.state in target.animations:
-            frame = target.animations[target.state][target.frame]
-            if target.direction == -1:
-                frame = pygame.transform.flip(frame, True, False)
-            mask = pygame.mask.from_surface(frame)
-            arrow_mask = pygame.mask.from_surface(self.rotated_sprite)
+            mask = target.get_mask(target.direction == -1)
             offset_x = int(self.x - target.x)
             offset_y = int(self.y - target.y)
-            overlap = mask.overlap(arrow_mask, (offset_x, offset_y))
+            overlap = mask.overlap(self.rotated_mask, (offset_x, offset_y))
             return overlap is not None
         return True
 
+    def get_draw_rect(self):
+        x = SimClock.lerp(self.prev_x, self.x)
+        y = SimClock.lerp(self.prev_y, self.y)
+        return self.rotated_sprite.get_rect(topleft=(x - self.draw_offset[0], y - self.draw_offset[1]))
+
     def draw(self, screen):
         if self.active:
-            screen.blit(self.rotated_sprite, (self.x - 16, self.y - 8))
+            screen.blit(self.rotated_sprite, self.get_draw_rect())
 
 class MagicBall:
+    draw_offset = (10, 10)
+
     def __init__(self, x, y, direction, target, damage, max_distance=1000):
         self.x = x
         self.y = y
+        self.prev_x = x
+        self.prev_y = y
         self.start_x = x
         self.direction = direction
         self.target = target
@@ -347,14 +337,8 @@ class MagicBall:
         self.velocity_x = dx / travel_time if dx != 0 else 3 * direction
         self.velocity_y = (dy - 0.5 * self.gravity * travel_time * (travel_time - 1)) / travel_time
 
-        try:
-            self.sprite = pygame.image.load("assets/images/magicball.png").convert_alpha()
-            self.sprite = pygame.transform.scale(self.sprite, (20, 20))
-        except Exception as e:
-            print(f"Failed to load magicball.png: {e}")
-            self.sprite = pygame.Surface((20, 20))
-            self.sprite.fill((128, 0, 128))
-
+        self.atlas = ProjectileAtlas.get("assets/images/magicball.png", (20, 20), (128, 0, 128))
+        self.sprite, self.rotated_mask = self.atlas[0]
         self.rotated_sprite = self.sprite
 
     def update(self, all_units):
@@ -375,8 +359,7 @@ class MagicBall:
             self.active = False
             return True
 
-        angle = math.degrees(math.atan2(-self.velocity_y, self.velocity_x))
-        self.rotated_sprite = pygame.transform.rotate(self.sprite, angle)
+        self.rotated_sprite, self.rotated_mask = ProjectileAtlas.lookup(self.atlas, self.velocity_x, self.velocity_y)
 
         ball_rect = pygame.Rect(self.x - 10, self.y - 10, 20, 20)
         target_rect = self.target.get_rect()
@@ -393,20 +376,21 @@ class MagicBall:
 
     def check_pixel_collision(self, target):
         if hasattr(target, 'animations') and target.state in target.animations:
-            frame = target.animations[target.state][target.frame]
-            if target.direction == -1:
-                frame = pygame.transform.flip(frame, True, False)
-            mask = pygame.mask.from_surface(frame)
-            ball_mask = pygame.mask.from_surface(self.rotated_sprite)
+            mask = target.get_mask(target.direction == -1)
             offset_x = int(self.x - target.x)
             offset_y = int(self.y - target.y)
-            overlap = mask.overlap(ball_mask, (offset_x, offset_y))
+            overlap = mask.overlap(self.rotated_mask, (offset_x, offset_y))
             return overlap is not None
         return True
 
+    def get_draw_rect(self):
+        x = SimClock.lerp(self.prev_x, self.x)
+        y = SimClock.lerp(self.prev_y, self.y)
+        return self.rotated_sprite.get_rect(topleft=(x - self.draw_offset[0], y - self.draw_offset[1]))
+
     def draw(self, screen):
         if self.active:
-            screen.blit(self.rotated_sprite, (self.x - 10, self.y - 10))
+            screen.blit(self.rotated_sprite, self.get_draw_rect())
 
 class CartUnit:
     def __init__(self, x, y, target_x):
@@ -416,7 +400,7 @@ class CartUnit:
         self.speed = 3
         self.moving = False
         try:
-            self.sprite = pygame.image.load("assets/images/Cart.png").convert_alpha()
+            self.sprite = load_image("assets/images/Cart.png")
             self.sprite = pygame.transform.scale(self.sprite, (150, 100))
         except Exception as e:
             print(f"Failed to load Cart.png: {e}")
@@ -445,13 +429,7 @@ class Player_PeasantUnit(Unit):
     attack_range = 135
     base_attack_cooldown = 1000
     scale_factor = 0.75
-
-    def __init__(self, faction, x):
-        super().__init__(faction, x)
-        try:
-            self.attack_sound = pygame.mixer.Sound("assets/sounds/Units/melee_fist.ogg")
-        except Exception as e:
-            print(f"Failed to load melee_fist.ogg for {self.name}: {e}")
+    attack_sound_path = "assets/sounds/Units/melee_fist.ogg"
 
 class Player_SpearmanUnit(Unit):
     name = "Player_Spearman"
@@ -462,16 +440,11 @@ class Player_SpearmanUnit(Unit):
     attack_range = 150
     base_attack_cooldown = 1100
     scale_factor = 0.75
-
-    def __init__(self, faction, x):
-        super().__init__(faction, x)
-        try:
-            self.attack_sound = pygame.mixer.Sound("assets/sounds/Units/melee_sword.ogg")
-        except Exception as e:
-            print(f"Failed to load melee_sword.ogg for {self.name}: {e}")
+    attack_sound_path = "assets/sounds/Units/melee_sword.ogg"
 
 class Player_ArcherUnit(Unit):
     name = "Player_Archer"
+    ranged = True
     base_health = 70
     base_attack = 25
     base_speed = 1.5
@@ -479,13 +452,7 @@ class Player_ArcherUnit(Unit):
     cost = 25
     attack_range = 300
     scale_factor = 0.75
-
-    def __init__(self, faction, x):
-        super().__init__(faction, x)
-        try:
-            self.attack_sound = pygame.mixer.Sound("assets/sounds/Units/bowshot.ogg")
-        except Exception as e:
-            print(f"Failed to load melee_sword.ogg for {self.name}: {e}")
+    attack_sound_path = "assets/sounds/Units/bowshot.ogg"
 
 class Player_WarriorUnit(Unit):
     name = "Player_Warrior"
@@ -496,13 +463,7 @@ class Player_WarriorUnit(Unit):
     attack_range = 135
     base_attack_cooldown = 1200
     scale_factor = 0.75
-
-    def __init__(self, faction, x):
-        super().__init__(faction, x)
-        try:
-            self.attack_sound = pygame.mixer.Sound("assets/sounds/Units/melee_sword.ogg")
-        except Exception as e:
-            print(f"Failed to load melee_sword.ogg for {self.name}: {e}")
+    attack_sound_path = "assets/sounds/Units/melee_sword.ogg"
 
 class Player_TankUnit(Unit):
     name = "Player_Tank"
@@ -513,13 +474,7 @@ class Player_TankUnit(Unit):
     attack_range = 135
     base_attack_cooldown = 2000
     scale_factor = 0.75
-
-    def __init__(self, faction, x):
-        super().__init__(faction, x)
-        try:
-            self.attack_sound = pygame.mixer.Sound("assets/sounds/Units/melee_sword.ogg")
-        except Exception as e:
-            print(f"Failed to load melee_sword.ogg for {self.name}: {e}")
+    attack_sound_path = "assets/sounds/Units/melee_sword.ogg"
 
 # Bandits
 class Bandit_Razor(Unit):
@@ -530,13 +485,7 @@ class Bandit_Razor(Unit):
     attack_range = 135
     base_attack_cooldown = 800
     scale_factor = 0.75
-
-    def __init__(self, faction, x):
-        super().__init__(faction, x)
-        try:
-            self.attack_sound = pygame.mixer.Sound("assets/sounds/Units/melee_sword.ogg")
-        except Exception as e:
-            print(f"Failed to load melee_sword.ogg for {self.name}: {e}")
+    attack_sound_path = "assets/sounds/Units/melee_sword.ogg"
 
 class Bandit_Madman(Unit):
     name = "Bandit_Madman"
@@ -546,29 +495,18 @@ class Bandit_Madman(Unit):
     attack_range = 135
     base_attack_cooldown = 1000
     scale_factor = 0.75
-
-    def __init__(self, faction, x):
-        super().__init__(faction, x)
-        try:
-            self.attack_sound = pygame.mixer.Sound("assets/sounds/Units/melee_fist.ogg")
-        except Exception as e:
-            print(f"Failed to load melee_fist.ogg for {self.name}: {e}")
+    attack_sound_path = "assets/sounds/Units/melee_fist.ogg"
 
 class Bandit_Archer(Unit):
     name = "Bandit_Archer"
+    ranged = True
     base_health = 70
     base_attack = 15
     base_speed = 1.5
     attack_range = 250
     base_attack_cooldown = 1500
     scale_factor = 0.75
-
-    def __init__(self, faction, x):
-        super().__init__(faction, x)
-        try:
-            self.attack_sound = pygame.mixer.Sound("assets/sounds/Units/bowshot.ogg")
-        except Exception as e:
-            print(f"Failed to load melee_sword.ogg for {self.name}: {e}")
+    attack_sound_path = "assets/sounds/Units/bowshot.ogg"
 
 class Bandit_Tank(Unit):
     name = "Bandit_Tank"
@@ -578,13 +516,7 @@ class Bandit_Tank(Unit):
     attack_range = 135
     base_attack_cooldown = 2000
     scale_factor = 0.75
-
-    def __init__(self, faction, x):
-        super().__init__(faction, x)
-        try:
-            self.attack_sound = pygame.mixer.Sound("assets/sounds/Units/melee_sword.ogg")
-        except Exception as e:
-            print(f"Failed to load melee_sword.ogg for {self.name}: {e}")
+    attack_sound_path = "assets/sounds/Units/melee_sword.ogg"
 
 class Bandit_King(Unit):
     name = "Bandit_King"
@@ -594,13 +526,7 @@ class Bandit_King(Unit):
     attack_range = 150
     base_attack_cooldown = 1500
     scale_factor = 1.0
-
-    def __init__(self, faction, x):
-        super().__init__(faction, x)
-        try:
-            self.attack_sound = pygame.mixer.Sound("assets/sounds/Units/melee_sword.ogg")
-        except Exception as e:
-            print(f"Failed to load melee_sword.ogg for {self.name}: {e}")
+    attack_sound_path = "assets/sounds/Units/melee_sword.ogg"
            
 #Zombies
 class Zombie_Melee(Unit):
@@ -611,29 +537,18 @@ class Zombie_Melee(Unit):
     attack_range = 135
     base_attack_cooldown = 1000
     scale_factor = 0.75
-
-    def __init__(self, faction, x):
-        super().__init__(faction, x)
-        try:
-            self.attack_sound = pygame.mixer.Sound("assets/sounds/Units/melee_sword.ogg")
-        except Exception as e:
-            print(f"Failed to load melee_sword.ogg for {self.name}: {e}")
+    attack_sound_path = "assets/sounds/Units/melee_sword.ogg"
 
 class Zombie_Archer(Unit):
     name = "Zombie_Archer"
+    ranged = True
     base_health = 70
     base_attack = 12
     base_speed = 1.2
     attack_range = 250
     base_attack_cooldown = 1500
     scale_factor = 0.75
-
-    def __init__(self, faction, x):
-        super().__init__(faction, x)
-        try:
-            self.attack_sound = pygame.mixer.Sound("assets/sounds/Units/melee_sword.ogg")
-        except Exception as e:
-            print(f"Failed to load melee_sword.ogg for {self.name}: {e}")
+    attack_sound_path = "assets/sounds/Units/melee_sword.ogg"
 
 class Zombie_Tank(Unit):
     name = "Zombie_Tank"
@@ -643,13 +558,7 @@ class Zombie_Tank(Unit):
     attack_range = 135
     base_attack_cooldown = 2000
     scale_factor = 0.75
-
-    def __init__(self, faction, x):
-        super().__init__(faction, x)
-        try:
-            self.attack_sound = pygame.mixer.Sound("assets/sounds/Units/melee_sword.ogg")
-        except Exception as e:
-            print(f"Failed to load melee_sword.ogg for {self.name}: {e}")
+    attack_sound_path = "assets/sounds/Units/melee_sword.ogg"
 
 class Zombie_Assassin(Unit):
     name = "Zombie_Assassin"
@@ -659,13 +568,7 @@ class Zombie_Assassin(Unit):
     attack_range = 135
     base_attack_cooldown = 800
     scale_factor = 0.75
-
-    def __init__(self, faction, x):
-        super().__init__(faction, x)
-        try:
-            self.attack_sound = pygame.mixer.Sound("assets/sounds/Units/melee_sword.ogg")
-        except Exception as e:
-            print(f"Failed to load melee_sword.ogg for {self.name}: {e}")
+    attack_sound_path = "assets/sounds/Units/melee_sword.ogg"
 
 class Zombie_Farmer(Unit):
     name = "Zombie_Farmer"
@@ -675,13 +578,7 @@ class Zombie_Farmer(Unit):
     attack_range = 135
     base_attack_cooldown = 1200
     scale_factor = 0.75
-
-    def __init__(self, faction, x):
-        super().__init__(faction, x)
-        try:
-            self.attack_sound = pygame.mixer.Sound("assets/sounds/Units/melee_fist.ogg")
-        except Exception as e:
-            print(f"Failed to load melee_fist.ogg for {self.name}: {e}")
+    attack_sound_path = "assets/sounds/Units/melee_fist.ogg"
 
 # Undead
 class Undead_Axeman(Unit):
@@ -692,13 +589,7 @@ class Undead_Axeman(Unit):
     attack_range = 135
     base_attack_cooldown = 1000
     scale_factor = 0.75
-
-    def __init__(self, faction, x):
-        super().__init__(faction, x)
-        try:
-            self.attack_sound = pygame.mixer.Sound("assets/sounds/Units/melee_sword.ogg")
-        except Exception as e:
-            print(f"Failed to load melee_sword.ogg for {self.name}: {e}")# Bandits
+    attack_sound_path = "assets/sounds/Units/melee_sword.ogg"
 
 class Undead_Samurai(Unit):
     name = "Undead_Samurai"
@@ -708,13 +599,7 @@ class Undead_Samurai(Unit):
     attack_range = 135
     base_attack_cooldown = 900
     scale_factor = 0.75
-
-    def __init__(self, faction, x):
-        super().__init__(faction, x)
-        try:
-            self.attack_sound = pygame.mixer.Sound("assets/sounds/Units/melee_sword.ogg")
-        except Exception as e:
-            print(f"Failed to load melee_sword.ogg for {self.name}: {e}")
+    attack_sound_path = "assets/sounds/Units/melee_sword.ogg"
 
 class Undead_Warrior(Unit):
     name = "Undead_Warrior"
@@ -724,13 +609,7 @@ class Undead_Warrior(Unit):
     attack_range = 135
     base_attack_cooldown = 1100
     scale_factor = 0.75
-
-    def __init__(self, faction, x):
-        super().__init__(faction, x)
-        try:
-            self.attack_sound = pygame.mixer.Sound("assets/sounds/Units/melee_sword.ogg")
-        except Exception as e:
-            print(f"Failed to load melee_sword.ogg for {self.name}: {e}")
+    attack_sound_path = "assets/sounds/Units/melee_sword.ogg"
 
 class Undead_King(Unit):
     name = "Undead_King"
@@ -740,16 +619,12 @@ class Undead_King(Unit):
     attack_range = 150
     base_attack_cooldown = 1500
     scale_factor = 1.0
-
-    def __init__(self, faction, x):
-        super().__init__(faction, x)
-        try:
-            self.attack_sound = pygame.mixer.Sound("assets/sounds/Units/melee_sword.ogg")
-        except Exception as e:
-            print(f"Failed to load melee_sword.ogg for {self.name}: {e}")
+    attack_sound_path = "assets/sounds/Units/melee_sword.ogg"
 
 class Undead_Mage(Unit):
     name = "Undead_Mage"
+    ranged = True
+    attack_once = True  # Goes back to idle after every cast instead of looping the attack
     base_health = 90
     base_attack = 22
     base_speed = 1.0
@@ -757,16 +632,16 @@ class Undead_Mage(Unit):
     cost = 40
     attack_range = 350
     scale_factor = 0.75
+    attack_sound_path = "assets/sounds/Units/magic_cast.ogg"
 
-    def __init__(self, faction, x):
-        super().__init__(faction, x)
-        try:
-            self.attack_sound = pygame.mixer.Sound("assets/sounds/Units/magic_cast.ogg")
-        except Exception as e:
-            print(f"Failed to load magic_cast.ogg for {self.name}: {e}")
+    def make_projectile(self):
+        ball_start_x = self.x + int(115 * self.scale_factor)
+        ball_start_y = self.y + int(105 * self.scale_factor)
+        print(f"{self.name} firing magic ball at {self.attack_target.name if hasattr(self.attack_target, 'name') else 'base'}")
+        return MagicBall(ball_start_x, ball_start_y, self.direction, self.attack_target, self.attack_power)
 
     def update_animation(self):
-        now = pygame.time.get_ticks()
+        now = SimClock.now()
         frame_delay = self.attack_frame_delay if self.state == "attack" else self.base_frame_delay
         if now - self.last_update < frame_delay:
             return None
@@ -783,13 +658,9 @@ class Undead_Mage(Unit):
         if self.state == "attack":
             self.frame += 1
             if self.frame == 7 and self.is_attacking and self.attack_target:
-                if self.attack_sound:
-                    self.attack_sound.play()
-                ball_start_x = self.x + int(115 * self.scale_factor)
-                ball_start_y = self.y + int(105 * self.scale_factor)
+                SoundBank.play(self.attack_sound)
                 if hasattr(self.attack_target, 'state') or hasattr(self.attack_target, 'health'):
-                    print(f"{self.name} firing magic ball at {self.attack_target.name if hasattr(self.attack_target, 'name') else 'base'}")
-                    return MagicBall(ball_start_x, ball_start_y, self.direction, self.attack_target, self.attack_power)
+                    return self.make_projectile()
             if self.frame > max_frame:
                 self.is_attacking = False
                 self.attack_target = None
@@ -813,6 +684,8 @@ class Undead_Mage(Unit):
 
 #TowerUnits
 class PlayerTowerArcher(Player_ArcherUnit):
+    shows_health_bar = False
+
     def __init__(self, x, y, game):
         super().__init__("Player", x)
         self.y = y
@@ -829,8 +702,8 @@ class PlayerTowerArcher(Player_ArcherUnit):
         self.attack_cooldown = max(200, self.base_attack_cooldown / (1 + speed_level * 0.075))
         self.attack_frame_delay = self.attack_cooldown / 14
 
-    def move(self, all_units, enemy_base, player_base, buckets, bucket_size):
-        _, new_state, target = check_player_collisions(self, buckets, bucket_size, enemy_base)
+    def move(self, all_units, enemy_base, player_base, index):
+        _, new_state, target = check_player_collisions(self, index, enemy_base)
         self.state = new_state if new_state == "attack" else "idle"
         if target:
             self.attack(target)
@@ -843,15 +716,10 @@ class PlayerTowerArcher(Player_ArcherUnit):
             return arrow
         return None
 
-    def draw(self, screen):
-        if self.state in self.animations and self.animations[self.state]:
-            frame_index = min(self.frame, len(self.animations[self.state]) - 1)
-            frame = self.animations[self.state][frame_index]
-            if self.direction == -1:
-                frame = pygame.transform.flip(frame, True, False)
-            screen.blit(frame, (self.x, self.y))
 
 class ZombieTowerArcher(Zombie_Archer):
+    shows_health_bar = False
+
     def __init__(self, x, y):
         super().__init__("Zombies", x)
         self.y = y
@@ -864,8 +732,8 @@ class ZombieTowerArcher(Zombie_Archer):
         self.is_tower = True
         self.attack_power = self.base_attack
 
-    def move(self, all_units, enemy_base, player_base, buckets, bucket_size):
-        _, new_state, target = check_enemy_collisions(self, buckets, bucket_size, player_base)  # Enemy faction targets player base
+    def move(self, all_units, enemy_base, player_base, index):
+        _, new_state, target = check_enemy_collisions(self, index, player_base)  # Enemy faction targets player base
         self.state = new_state if new_state == "attack" else "idle"
         if target:
             self.attack(target)
@@ -878,15 +746,10 @@ class ZombieTowerArcher(Zombie_Archer):
             return arrow
         return None
 
-    def draw(self, screen):
-        if self.state in self.animations and self.animations[self.state]:
-            frame_index = min(self.frame, len(self.animations[self.state]) - 1)
-            frame = self.animations[self.state][frame_index]
-            if self.direction == -1:
-                frame = pygame.transform.flip(frame, True, False)
-            screen.blit(frame, (self.x, self.y))
 
 class UndeadTowerMage(Undead_Mage):
+    shows_health_bar = False
+
     def __init__(self, x, y):
         super().__init__("Undead", x)
         self.y = y
@@ -899,8 +762,8 @@ class UndeadTowerMage(Undead_Mage):
         self.is_tower = True
         self.attack_power = self.base_attack
 
-    def move(self, all_units, enemy_base, player_base, buckets, bucket_size):
-        _, new_state, target = check_enemy_collisions(self, buckets, bucket_size, player_base)  # Enemy faction targets player base
+    def move(self, all_units, enemy_base, player_base, index):
+        _, new_state, target = check_enemy_collisions(self, index, player_base)  # Enemy faction targets player base
         self.state = new_state if new_state == "attack" else "idle"
         if target:
             self.attack(target)
@@ -913,10 +776,52 @@ class UndeadTowerMage(Undead_Mage):
             return magic_ball
         return None
 
-    def draw(self, screen):
-        if self.state in self.animations and self.animations[self.state]:
-            frame_index = min(self.frame, len(self.animations[self.state]) - 1)
-            frame = self.animations[self.state][frame_index]
-            if self.direction == -1:
-                frame = pygame.transform.flip(frame, True, False)
-            screen.blit(frame, (self.x, self.y))
\ No newline at end of file
+
+
+FACTION_UNITS = {
+    "Player": [Player_PeasantUnit, Player_SpearmanUnit, Player_ArcherUnit, Player_WarriorUnit, Player_TankUnit],
+    "Bandits": [Bandit_Razor, Bandit_Madman, Bandit_Archer, Bandit_Tank, Bandit_King],
+    "Zombies": [Zombie_Archer, Zombie_Assassin, Zombie_Farmer, Zombie_Melee, Zombie_Tank],
+    "Undead": [Undead_Axeman, Undead_King, Undead_Mage, Undead_Samurai, Undead_Warrior]
+}
+
+class FactionPreloader:
+    """Warms the shared AnimationCache and SoundBank one faction at a time.
+
+    preload() loads a faction straight away. prefetch() only queues its unit
+    types so step() can load them one per frame (e.g. while the level intro is
+    on screen); finish() loads whatever is still queued when it's needed.
+    """
+    loaded_types = set()
+    queue = []
+
+    @classmethod
+    def prefetch(cls, faction):
+        for unit_type in FACTION_UNITS.get(faction, []):
+            if unit_type not in cls.loaded_types and (unit_type, faction) not in cls.queue:
+                cls.queue.append((unit_type, faction))
+
+    @classmethod
+    def step(cls):
+        """Load one queued unit type. Returns True while more are pending."""
+        if cls.queue:
+            unit_type, faction = cls.queue.pop(0)
+            unit_type(faction, 0)  # Warms the shared AnimationCache
+            cls.loaded_types.add(unit_type)
+        return bool(cls.queue)
+
+    @classmethod
+    def finish(cls):
+        if not cls.queue:
+            return
+        start = pygame.time.get_ticks()
+        while cls.step():
+            pass
+        stats = AnimationCache.stats()
+        print(f"Loaded queued animations in {pygame.time.get_ticks() - start} ms: {stats['entries']} sheets cached "
+              f"({stats['hits']} hits, {stats['misses']} misses)")
+
+    @classmethod
+    def preload(cls, faction):
+        cls.prefetch(faction)
+        cls.finish()